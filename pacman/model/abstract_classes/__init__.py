@@ -1,3 +1,4 @@
 from .abstract_has_global_max_atoms import AbstractHasGlobalMaxAtoms
+from .abstract_slices_connect import AbstractSlicesConnect
 
-__all__ = ["AbstractHasGlobalMaxAtoms"]
+__all__ = ["AbstractHasGlobalMaxAtoms", "AbstractSlicesConnect"]
@@ -0,0 +1,26 @@
+from six import add_metaclass
+
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+
+
+@add_metaclass(AbstractBase)
+class AbstractSlicesConnect(object):
+    """ An application edge that can tell whether the atoms of a slice of its\
+        pre-vertex connect to any of the atoms of a slice of its post-vertex,\
+        so that machine edges need not be made between slices that do not
+    """
+
+    __slots__ = []
+
+    @abstractmethod
+    def could_connect(self, pre_slice, post_slice):
+        """ Determine if there might be connections between two slices
+
+        :param pre_slice: the slice of the pre-vertex
+        :type pre_slice: :py:class:`pacman.model.graphs.common.Slice`
+        :param post_slice: the slice of the post-vertex
+        :type post_slice: :py:class:`pacman.model.graphs.common.Slice`
+        :return: False if there are certainly no connections between the\
+            slices, True if there might be
+        :rtype: bool
+        """
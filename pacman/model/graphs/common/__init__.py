@@ -1,6 +1,9 @@
 from .constrained_object import ConstrainedObject
 from .edge_traffic_type import EdgeTrafficType
+from .graph_change import GraphChange
+from .graph_change_type import GraphChangeType
 from .graph_mapper import GraphMapper
 from .slice import Slice
 
-__all__ = ["ConstrainedObject", "EdgeTrafficType", "GraphMapper", "Slice"]
+__all__ = ["ConstrainedObject", "EdgeTrafficType", "GraphChange",
+           "GraphChangeType", "GraphMapper", "Slice"]
@@ -0,0 +1,14 @@
+import collections
+
+
+class GraphChange(collections.namedtuple(
+        'GraphChange', 'change_type item partition_name')):
+    """ A change to a graph recorded in its journal.
+
+    :attr change_type: The kind of change
+    :attr item: The vertex, edge, block of edges or outgoing edge partition\
+        that was added or removed
+    :attr partition_name: The name of the outgoing edge partition of the\
+        edge, block of edges or partition, or None for a vertex
+    """
+    __slots__ = ()
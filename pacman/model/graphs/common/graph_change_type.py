@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class GraphChangeType(Enum):
+    """ Indicates the kind of a change to a graph recorded in its journal
+    """
+
+    ADD_VERTEX = 1
+    REMOVE_VERTEX = 2
+    ADD_EDGE = 3
+    REMOVE_EDGE = 4
+    ADD_EDGE_BLOCK = 5
+    ADD_PARTITION = 6
+    REMOVE_PARTITION = 7
@@ -21,6 +21,9 @@ class GraphMapper(object):
         # dict of application edge -> set of machine edges
         "_machine_edges_by_application_edge",
 
+        # dict of application edge -> list of blocks of machine edges
+        "_edge_blocks_by_application_edge",
+
         # dict of machine vertex -> index of vertex in list of vertices from
         #                           the same application vertex
         "_index_by_machine_vertex",
@@ -38,6 +41,7 @@ class GraphMapper(object):
 
         self._machine_vertices_by_application_vertex = defaultdict(OrderedSet)
         self._machine_edges_by_application_edge = defaultdict(OrderedSet)
+        self._edge_blocks_by_application_edge = defaultdict(list)
 
         self._index_by_machine_vertex = dict()
         self._slice_by_machine_vertex = dict()
@@ -81,6 +85,20 @@ class GraphMapper(object):
             machine_edge)
         self._application_edge_by_machine_edge[machine_edge] = application_edge
 
+    def add_edge_block_mapping(self, edge_block, application_edge):
+        """ Add a mapping between a block of machine edges and an\
+            application edge.  The edges of the block must each be mapped\
+            with add_edge_mapping as they are made; the block is used to make\
+            any edges not yet made when the machine edges of the application\
+            edge are asked for.
+
+        :param edge_block: A block of edges from a Machine Graph
+        :type edge_block: :py:class:`pacman.model.graphs.impl.EdgeBlock`
+        :param application_edge: An edge from an Application Graph
+        """
+        self._edge_blocks_by_application_edge[application_edge].append(
+            edge_block)
+
     def get_machine_vertices(self, application_vertex):
         """ Get all machine vertices mapped to a given application vertex
 
@@ -102,6 +120,9 @@ class GraphMapper(object):
         :param application_edge: An edge from an Application Graph
         :return: An iterable of machine edges or None if none
         """
+        for edge_block in self._edge_blocks_by_application_edge.pop(
+                application_edge, ()):
+            edge_block.make_all_edges()
         return self._machine_edges_by_application_edge.get(
             application_edge, None)
 
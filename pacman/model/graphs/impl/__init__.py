@@ -1,4 +1,6 @@
+from .edge_block import EdgeBlock
 from .graph import Graph
+from .graph_adjacency import GraphAdjacency
 from .outgoing_edge_partition import OutgoingEdgePartition
 
-__all__ = ["Graph", "OutgoingEdgePartition"]
+__all__ = ["EdgeBlock", "Graph", "GraphAdjacency", "OutgoingEdgePartition"]
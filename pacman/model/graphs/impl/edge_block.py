@@ -0,0 +1,202 @@
+from pacman.model.graphs.common import EdgeTrafficType
+
+
+class EdgeBlock(object):
+    """ The edges from each of a number of pre-vertices to each of a number\
+        of post-vertices, all in partitions with the same name, which are\
+        only made when they are asked for.
+
+    A block stands for the edges until it is added to a graph; after that,\
+    the graph asks the block for the edges starting or ending at a vertex\
+    when they are needed, and the block makes each edge once, adding it to\
+    the graph as if it had been added with add_edge.
+    """
+
+    __slots__ = [
+        # The vertices at the start of the edges, in order
+        "_pre_vertices",
+
+        # The vertices at the end of the edges, in order
+        "_post_vertices",
+
+        # The index of each pre-vertex
+        "_pre_indices",
+
+        # The index of each post-vertex
+        "_post_indices",
+
+        # Function that makes the edge between a pre- and post-vertex
+        "_create_edge",
+
+        # The traffic type of the edges
+        "_traffic_type",
+
+        # The edges made so far by (pre-index, post-index)
+        "_edges",
+
+        # The number of edges made so far from each pre-vertex
+        "_n_made_from",
+
+        # The indices of the pre-vertices all of whose edges are made
+        "_pre_done",
+
+        # The indices of the post-vertices all of whose edges are made
+        "_post_done",
+
+        # Function that adds an edge made to the graph, or None if the block
+        # is not in a graph
+        "_add_edge"
+    ]
+
+    def __init__(self, pre_vertices, post_vertices, create_edge,
+                 traffic_type=EdgeTrafficType.MULTICAST):
+        """
+        :param pre_vertices: The vertices at the start of the edges
+        :type pre_vertices:\
+            iterable(:py:class:`pacman.model.graphs.AbstractVertex`)
+        :param post_vertices: The vertices at the end of the edges
+        :type post_vertices:\
+            iterable(:py:class:`pacman.model.graphs.AbstractVertex`)
+        :param create_edge: Function taking a pre-vertex and a post-vertex\
+            that makes the edge between them
+        :type create_edge: callable
+        :param traffic_type: The traffic type of the edges
+        :type traffic_type:\
+            :py:class:`pacman.model.graphs.common.EdgeTrafficType`
+        """
+        self._pre_vertices = list(pre_vertices)
+        self._post_vertices = list(post_vertices)
+        self._pre_indices = dict(
+            (vertex, index) for index, vertex in enumerate(self._pre_vertices))
+        self._post_indices = dict(
+            (vertex, index)
+            for index, vertex in enumerate(self._post_vertices))
+        self._create_edge = create_edge
+        self._traffic_type = traffic_type
+        self._edges = dict()
+        self._n_made_from = [0] * len(self._pre_vertices)
+        self._pre_done = set()
+        self._post_done = set()
+        self._add_edge = None
+
+    @property
+    def pre_vertices(self):
+        """ The vertices at the start of the edges
+
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractVertex`)
+        """
+        return self._pre_vertices
+
+    @property
+    def post_vertices(self):
+        """ The vertices at the end of the edges
+
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractVertex`)
+        """
+        return self._post_vertices
+
+    @property
+    def traffic_type(self):
+        """ The traffic type of the edges
+
+        :rtype: :py:class:`pacman.model.graphs.common.EdgeTrafficType`
+        """
+        return self._traffic_type
+
+    @property
+    def n_edges(self):
+        """ The number of edges in the block, made or not
+
+        :rtype: int
+        """
+        return len(self._pre_vertices) * len(self._post_vertices)
+
+    @property
+    def n_edges_made(self):
+        """ The number of edges that have been made so far
+
+        :rtype: int
+        """
+        return len(self._edges)
+
+    def set_add_edge(self, add_edge):
+        """ Set the function that adds each edge made to a graph; called by\
+            the graph when the block is added to it
+
+        :param add_edge: function taking the index of the pre-vertex and the\
+            edge
+        :type add_edge: callable
+        """
+        self._add_edge = add_edge
+
+    def _edge(self, pre_index, post_index):
+        """ Get the edge between two vertices, making it if needed
+        """
+        edge = self._edges.get((pre_index, post_index))
+        if edge is None:
+            edge = self._create_edge(
+                self._pre_vertices[pre_index],
+                self._post_vertices[post_index])
+            self._edges[pre_index, post_index] = edge
+            self._n_made_from[pre_index] += 1
+            if self._add_edge is not None:
+                self._add_edge(pre_index, edge)
+        return edge
+
+    def n_edges_not_made_from(self, pre_vertex):
+        """ Get the number of edges from a pre-vertex not yet made
+
+        :param pre_vertex: The vertex at the start of the edges
+        :rtype: int
+        """
+        return (len(self._post_vertices) -
+                self._n_made_from[self._pre_indices[pre_vertex]])
+
+    def edges_from(self, pre_vertex):
+        """ Get the edges starting at a vertex, making any not yet made
+
+        :param pre_vertex: The vertex at the start of the edges
+        :return: The edges, in the order of the post-vertices
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractEdge`)
+        """
+        pre_index = self._pre_indices[pre_vertex]
+        self._pre_done.add(pre_index)
+        return [self._edge(pre_index, post_index)
+                for post_index in range(len(self._post_vertices))]
+
+    def edges_to(self, post_vertex):
+        """ Get the edges ending at a vertex, making any not yet made
+
+        :param post_vertex: The vertex at the end of the edges
+        :return: The edges, in the order of the pre-vertices
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractEdge`)
+        """
+        post_index = self._post_indices[post_vertex]
+        self._post_done.add(post_index)
+        return [self._edge(pre_index, post_index)
+                for pre_index in range(len(self._pre_vertices))]
+
+    def make_edges_from(self, pre_vertex):
+        """ Make the edges starting at a vertex if they are not all made
+
+        :param pre_vertex: The vertex at the start of the edges
+        """
+        if self._pre_indices[pre_vertex] not in self._pre_done:
+            self.edges_from(pre_vertex)
+
+    def make_edges_to(self, post_vertex):
+        """ Make the edges ending at a vertex if they are not all made
+
+        :param post_vertex: The vertex at the end of the edges
+        """
+        if self._post_indices[post_vertex] not in self._post_done:
+            self.edges_to(post_vertex)
+
+    def make_all_edges(self):
+        """ Make all the edges not yet made
+
+        :return: All the edges, by pre-vertex and then by post-vertex
+        :rtype: list(:py:class:`pacman.model.graphs.AbstractEdge`)
+        """
+        return [edge for pre_vertex in self._pre_vertices
+                for edge in self.edges_from(pre_vertex)]
@@ -4,9 +4,12 @@ from spinn_utilities.overrides import overrides
 from spinn_utilities.ordered_set import OrderedSet
 
 from pacman.exceptions import \
-    PacmanAlreadyExistsException, PacmanInvalidParameterException
+    PacmanAlreadyExistsException, PacmanInvalidParameterException, \
+    PacmanNotFoundError
 from pacman.model.graphs import AbstractGraph
-from pacman.model.graphs.common import ConstrainedObject
+from pacman.model.graphs.common import \
+    ConstrainedObject, GraphChange, GraphChangeType
+from .graph_adjacency import GraphAdjacency
 from .outgoing_edge_partition import OutgoingEdgePartition
 
 
@@ -35,6 +38,25 @@ class Graph(ConstrainedObject, AbstractGraph):
         "_incoming_edges_by_partition_name",
         # The outgoing edge partitions by pre-vertex
         "_outgoing_edge_partitions_by_pre_vertex",
+        # Blocks of edges not all yet made by pre-vertex
+        "_outgoing_edge_blocks",
+        # Blocks of edges not all yet made by post-vertex
+        "_incoming_edge_blocks",
+        # The integer ID of each vertex, in order of addition
+        "_vertex_ids",
+        # The integer ID of each edge, in order of addition
+        "_edge_ids",
+        # The integer ID of each outgoing edge partition, in order of addition
+        "_partition_ids",
+        # The number of vertex IDs given, which are not reused on removal
+        "_n_vertex_ids",
+        # The number of edge IDs given, which are not reused on removal
+        "_n_edge_ids",
+        # The number of partition IDs given, which are not reused on removal
+        "_n_partition_ids",
+        # The changes made since the journal was started, or None if the
+        # changes are not being recorded
+        "_journal",
         # The label of the graph
         "_label"]
 
@@ -60,6 +82,15 @@ class Graph(ConstrainedObject, AbstractGraph):
         self._incoming_edges = defaultdict(OrderedSet)
         self._incoming_edges_by_partition_name = defaultdict(list)
         self._outgoing_edge_partitions_by_pre_vertex = defaultdict(OrderedSet)
+        self._outgoing_edge_blocks = defaultdict(list)
+        self._incoming_edge_blocks = defaultdict(list)
+        self._vertex_ids = dict()
+        self._edge_ids = dict()
+        self._partition_ids = dict()
+        self._n_vertex_ids = 0
+        self._n_edge_ids = 0
+        self._n_partition_ids = 0
+        self._journal = None
         self._label = label
 
     @property
@@ -74,10 +105,109 @@ class Graph(ConstrainedObject, AbstractGraph):
                 "vertex", vertex.__class__,
                 "Vertices of this graph must be one of the following types:"
                 " {}".format(self._allowed_vertex_types))
-        self._vertices.add(vertex)
+        if vertex not in self._vertex_ids:
+            self._vertices.add(vertex)
+            self._vertex_ids[vertex] = self._n_vertex_ids
+            self._n_vertex_ids += 1
+            self._record(GraphChangeType.ADD_VERTEX, vertex, None)
 
     @overrides(AbstractGraph.add_edge)
     def add_edge(self, edge, outgoing_edge_partition_name):
+        self._check_edge(edge)
+        self._add_edge(
+            edge, outgoing_edge_partition_name,
+            self._get_partition(edge.pre_vertex, outgoing_edge_partition_name))
+        self._record(
+            GraphChangeType.ADD_EDGE, edge, outgoing_edge_partition_name)
+
+    @overrides(AbstractGraph.add_edges)
+    def add_edges(self, edges, outgoing_edge_partition_name):
+        edges = list(edges)
+        for edge in edges:
+            self._check_edge(edge)
+
+        # Consecutive edges usually start at the same vertex, so share the
+        # look up of the partition between them
+        pre_vertex = None
+        partition = None
+        for edge in edges:
+            if partition is None or edge.pre_vertex != pre_vertex:
+                pre_vertex = edge.pre_vertex
+                partition = self._get_partition(
+                    pre_vertex, outgoing_edge_partition_name)
+            self._add_edge(edge, outgoing_edge_partition_name, partition)
+            self._record(
+                GraphChangeType.ADD_EDGE, edge, outgoing_edge_partition_name)
+
+    def add_edge_block(self, edge_block, outgoing_edge_partition_name):
+        """ Add a block of edges to the graph.  The edges are made when they\
+            are first asked for, through the partitions or by vertex, and are\
+            then added as if by add_edge; until then, the block takes space\
+            only for its vertices.
+
+        :param edge_block: The block of edges to add
+        :type edge_block: :py:class:`pacman.model.graphs.impl.EdgeBlock`
+        :param outgoing_edge_partition_name: \
+            The name of the edge partitions to add the edges to
+        :type outgoing_edge_partition_name: str
+        :raises PacmanInvalidParameterException:\
+            If the vertices of the block are not in the graph, or the\
+            partition of a pre-vertex cannot hold blocks of edges
+        """
+        for vertex in edge_block.pre_vertices:
+            if vertex not in self._vertices:
+                raise PacmanInvalidParameterException(
+                    "edge_block", vertex, "pre-vertex must be known in graph")
+        for vertex in edge_block.post_vertices:
+            if vertex not in self._vertices:
+                raise PacmanInvalidParameterException(
+                    "edge_block", vertex, "post-vertex must be known in graph")
+
+        partitions = list()
+        for vertex in edge_block.pre_vertices:
+            partition = self._get_partition(
+                vertex, outgoing_edge_partition_name)
+            if not isinstance(partition, OutgoingEdgePartition):
+                raise PacmanInvalidParameterException(
+                    "outgoing_edge_partition_name",
+                    outgoing_edge_partition_name,
+                    "the partition of {} cannot hold blocks of edges".format(
+                        vertex))
+            partitions.append(partition)
+        for vertex, partition in zip(edge_block.pre_vertices, partitions):
+            partition.add_edge_block(edge_block, vertex)
+            self._outgoing_edge_blocks[vertex].append(edge_block)
+        for vertex in edge_block.post_vertices:
+            self._incoming_edge_blocks[vertex].append(edge_block)
+
+        def add_edge(pre_index, edge):
+            self._check_edge(edge)
+            self._add_edge(
+                edge, outgoing_edge_partition_name, partitions[pre_index])
+        edge_block.set_add_edge(add_edge)
+        self._record(
+            GraphChangeType.ADD_EDGE_BLOCK, edge_block,
+            outgoing_edge_partition_name)
+
+    def _make_edges_from(self, vertex):
+        """ Make the edges of blocks starting at a vertex
+        """
+        for edge_block in self._outgoing_edge_blocks.pop(vertex, ()):
+            edge_block.make_edges_from(vertex)
+
+    def _make_edges_to(self, vertex):
+        """ Make the edges of blocks ending at a vertex
+        """
+        for edge_block in self._incoming_edge_blocks.pop(vertex, ()):
+            edge_block.make_edges_to(vertex)
+
+    def _check_edge(self, edge):
+        """ Check that an edge can be added to this graph
+
+        :raises PacmanInvalidParameterException:\
+            If the edge is not of a valid type or its vertices are not in the\
+            graph
+        """
         # verify that the edge is one suitable for this graph
         if not isinstance(edge, self._allowed_edge_types):
             raise PacmanInvalidParameterException(
@@ -92,27 +222,159 @@ class Graph(ConstrainedObject, AbstractGraph):
             raise PacmanInvalidParameterException(
                 "edge", edge.post_vertex, "post-vertex must be known in graph")
 
-        # Add the edge to the partition
-        partition = None
-        if ((edge.pre_vertex, outgoing_edge_partition_name) not in
-                self._outgoing_edge_partitions_by_name):
+    def _get_partition(self, pre_vertex, outgoing_edge_partition_name):
+        """ Get the outgoing edge partition of a vertex with the given name,\
+            making it if it does not exist
+        """
+        partition = self._outgoing_edge_partitions_by_name.get(
+            (pre_vertex, outgoing_edge_partition_name))
+        if partition is None:
             partition = OutgoingEdgePartition(
                 outgoing_edge_partition_name, self._allowed_edge_types)
-            self._outgoing_edge_partitions_by_pre_vertex[
-                edge.pre_vertex].add(partition)
+            self._outgoing_edge_partitions_by_pre_vertex[pre_vertex].add(
+                partition)
             self._outgoing_edge_partitions_by_name[
-                edge.pre_vertex, outgoing_edge_partition_name] = partition
-        else:
-            partition = self._outgoing_edge_partitions_by_name[
-                edge.pre_vertex, outgoing_edge_partition_name]
+                pre_vertex, outgoing_edge_partition_name] = partition
+            self._partition_ids[partition] = self._n_partition_ids
+            self._n_partition_ids += 1
+            self._record(
+                GraphChangeType.ADD_PARTITION, partition,
+                outgoing_edge_partition_name)
+        return partition
+
+    def _add_edge(self, edge, outgoing_edge_partition_name, partition):
+        """ Add a checked edge to its partition and to the indices
+        """
+        # Add the edge to the partition
         partition.add_edge(edge)
 
         # Add the edge to the indices
+        if edge not in self._edge_ids:
+            self._edge_ids[edge] = self._n_edge_ids
+            self._n_edge_ids += 1
         self._outgoing_edges[edge.pre_vertex].add(edge)
         self._incoming_edges_by_partition_name[
             (edge.post_vertex, outgoing_edge_partition_name)].append(edge)
         self._incoming_edges[edge.post_vertex].add(edge)
 
+    def remove_edge(self, edge):
+        """ Remove an edge from the graph, and from its outgoing edge\
+            partition, which stays in the graph even if it has no edges left.
+
+        :param edge: The edge to remove
+        :type edge: :py:class:`pacman.model.graphs.AbstractEdge`
+        :raise PacmanNotFoundError: If the edge is not in the graph
+        """
+        self._make_edges_from(edge.pre_vertex)
+        if edge not in self._edge_ids:
+            raise PacmanNotFoundError(
+                "Edge {} is not in the graph".format(edge))
+        for partition in self._outgoing_edge_partitions_by_pre_vertex[
+                edge.pre_vertex]:
+            if edge in partition:
+                partition.remove_edge(edge)
+                self._remove_edge(edge, partition.identifier)
+                return
+
+    def _remove_edge(self, edge, outgoing_edge_partition_name):
+        """ Remove an edge already removed from its partition from the indices
+        """
+        del self._edge_ids[edge]
+        self._outgoing_edges[edge.pre_vertex].remove(edge)
+        self._incoming_edges[edge.post_vertex].remove(edge)
+        key = (edge.post_vertex, outgoing_edge_partition_name)
+        self._incoming_edges_by_partition_name[key].remove(edge)
+        if not self._incoming_edges_by_partition_name[key]:
+            del self._incoming_edges_by_partition_name[key]
+        self._record(
+            GraphChangeType.REMOVE_EDGE, edge, outgoing_edge_partition_name)
+
+    def remove_outgoing_edge_partition(self, outgoing_edge_partition):
+        """ Remove an outgoing edge partition and all its edges from the graph
+
+        :param outgoing_edge_partition: The partition to remove
+        :type outgoing_edge_partition:\
+            :py:class:`pacman.model.graphs.impl.OutgoingEdgePartition`
+        :raise PacmanNotFoundError: If the partition is not in the graph
+        """
+        if outgoing_edge_partition not in self._partition_ids:
+            raise PacmanNotFoundError(
+                "Partition {} is not in the graph".format(
+                    outgoing_edge_partition))
+        name = outgoing_edge_partition.identifier
+        for edge in list(outgoing_edge_partition.edges):
+            outgoing_edge_partition.remove_edge(edge)
+            self._remove_edge(edge, name)
+        pre_vertex = outgoing_edge_partition.pre_vertex
+        self._outgoing_edge_partitions_by_pre_vertex[pre_vertex].remove(
+            outgoing_edge_partition)
+        del self._outgoing_edge_partitions_by_name[pre_vertex, name]
+        del self._partition_ids[outgoing_edge_partition]
+        self._record(
+            GraphChangeType.REMOVE_PARTITION, outgoing_edge_partition, name)
+
+    def remove_vertex(self, vertex):
+        """ Remove a vertex from the graph, with the outgoing edge partitions\
+            that start at it and the edges that end at it.  This takes time\
+            in proportion to the number of edges and partitions of the vertex.
+
+        :param vertex: The vertex to remove
+        :type vertex: :py:class:`pacman.model.graphs.AbstractVertex`
+        :raise PacmanNotFoundError: If the vertex is not in the graph
+        """
+        if vertex not in self._vertex_ids:
+            raise PacmanNotFoundError(
+                "Vertex {} is not in the graph".format(vertex))
+        self._make_edges_from(vertex)
+        for partition in list(
+                self._outgoing_edge_partitions_by_pre_vertex[vertex]):
+            self.remove_outgoing_edge_partition(partition)
+        for edge in list(self.get_edges_ending_at_vertex(vertex)):
+            self.remove_edge(edge)
+
+        # The indices of the vertex are now empty
+        self._outgoing_edge_partitions_by_pre_vertex.pop(vertex, None)
+        self._outgoing_edges.pop(vertex, None)
+        self._incoming_edges.pop(vertex, None)
+        self._vertices.remove(vertex)
+        del self._vertex_ids[vertex]
+        self._record(GraphChangeType.REMOVE_VERTEX, vertex, None)
+
+    def _record(self, change_type, item, partition_name):
+        """ Record a change in the journal if it is being kept
+        """
+        if self._journal is not None:
+            self._journal.append(
+                GraphChange(change_type, item, partition_name))
+
+    def start_journal(self):
+        """ Start recording the changes made to the graph, forgetting any\
+            recorded before.  Edges of a block are recorded as the addition\
+            of the block, not as they are made; removing a vertex or a\
+            partition records the removal of each of its edges first.
+        """
+        self._journal = list()
+
+    def stop_journal(self):
+        """ Stop recording the changes made to the graph
+
+        :return: The changes recorded since the journal was started, in order
+        :rtype: list(:py:class:`pacman.model.graphs.common.GraphChange`)
+        """
+        journal = self._journal or list()
+        self._journal = None
+        return journal
+
+    @property
+    def journal(self):
+        """ The changes recorded since the journal was started, in order, or\
+            None if they are not being recorded
+
+        :rtype: list(:py:class:`pacman.model.graphs.common.GraphChange`)\
+            or None
+        """
+        return self._journal
+
     @overrides(AbstractGraph.add_outgoing_edge_partition)
     def add_outgoing_edge_partition(self, outgoing_edge_partition):
 
@@ -138,6 +400,11 @@ class Graph(ConstrainedObject, AbstractGraph):
         self._outgoing_edge_partitions_by_name[
             outgoing_edge_partition.pre_vertex,
             outgoing_edge_partition.identifier] = outgoing_edge_partition
+        self._partition_ids[outgoing_edge_partition] = self._n_partition_ids
+        self._n_partition_ids += 1
+        self._record(
+            GraphChangeType.ADD_PARTITION, outgoing_edge_partition,
+            outgoing_edge_partition.identifier)
 
     @property
     @overrides(AbstractGraph.vertices)
@@ -169,10 +436,12 @@ class Graph(ConstrainedObject, AbstractGraph):
 
     @overrides(AbstractGraph.get_edges_starting_at_vertex)
     def get_edges_starting_at_vertex(self, vertex):
+        self._make_edges_from(vertex)
         return self._outgoing_edges[vertex]
 
     @overrides(AbstractGraph.get_edges_ending_at_vertex)
     def get_edges_ending_at_vertex(self, vertex):
+        self._make_edges_to(vertex)
         if vertex not in self._incoming_edges:
             return []
         return self._incoming_edges[vertex]
@@ -180,6 +449,7 @@ class Graph(ConstrainedObject, AbstractGraph):
     @overrides(AbstractGraph.get_edges_ending_at_vertex_with_partition_name)
     def get_edges_ending_at_vertex_with_partition_name(
             self, vertex, partition_name):
+        self._make_edges_to(vertex)
         key = (vertex, partition_name)
         if key not in self._incoming_edges_by_partition_name:
             return []
@@ -194,3 +464,81 @@ class Graph(ConstrainedObject, AbstractGraph):
             self, vertex, outgoing_edge_partition_name):
         return self._outgoing_edge_partitions_by_name.get(
             (vertex, outgoing_edge_partition_name), None)
+
+    def get_vertex_id(self, vertex):
+        """ Get the integer ID of a vertex.  The vertices are given the IDs\
+            0, 1, 2, ... in the order in which they are added.
+
+        :param vertex: The vertex to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the vertex is not in the graph
+        """
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            raise PacmanNotFoundError(
+                "Vertex {} is not in the graph".format(vertex))
+        return vertex_id
+
+    def get_edge_id(self, edge):
+        """ Get the integer ID of an edge.  The edges are given the IDs\
+            0, 1, 2, ... in the order in which they are added; the edges of\
+            a block are added when they are made.
+
+        :param edge: The edge to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the edge is not in the graph
+        """
+        edge_id = self._edge_ids.get(edge)
+        if edge_id is None:
+            raise PacmanNotFoundError(
+                "Edge {} is not in the graph".format(edge))
+        return edge_id
+
+    def get_outgoing_edge_partition_id(self, outgoing_edge_partition):
+        """ Get the integer ID of an outgoing edge partition.  The\
+            partitions are given the IDs 0, 1, 2, ... in the order in which\
+            they are added or made.
+
+        :param outgoing_edge_partition: The partition to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the partition is not in the graph
+        """
+        partition_id = self._partition_ids.get(outgoing_edge_partition)
+        if partition_id is None:
+            raise PacmanNotFoundError(
+                "Partition {} is not in the graph".format(
+                    outgoing_edge_partition))
+        return partition_id
+
+    def _get_edge_weight(self, edge, partition):
+        """ Get the weight of an edge in the adjacency arrays
+
+        :param edge: The edge
+        :param partition: The outgoing edge partition of the edge
+        :rtype: float
+        """
+        return partition.traffic_weight
+
+    def get_adjacency(self):
+        """ Get a snapshot of the edges of the graph as arrays of the IDs of\
+            their vertices and partitions, and of their weights.  Any edges\
+            of blocks not yet made are made first.
+
+        :rtype: :py:class:`pacman.model.graphs.impl.GraphAdjacency`
+        """
+        sources = list()
+        targets = list()
+        partition_ids = list()
+        weights = list()
+        edge_ids = list()
+        for partition in self.outgoing_edge_partitions:
+            partition_id = self._partition_ids[partition]
+            for edge in partition.edges:
+                sources.append(self._vertex_ids[edge.pre_vertex])
+                targets.append(self._vertex_ids[edge.post_vertex])
+                partition_ids.append(partition_id)
+                weights.append(self._get_edge_weight(edge, partition))
+                edge_ids.append(self._edge_ids[edge])
+        return GraphAdjacency(
+            self._n_vertex_ids, sources, targets, partition_ids, weights,
+            edge_ids)
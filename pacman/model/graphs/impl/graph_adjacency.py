@@ -0,0 +1,158 @@
+import numpy
+
+
+class GraphAdjacency(object):
+    """ A snapshot of the edges of a graph as arrays, in compressed sparse\
+        row form, using the integer IDs that the graph gives its vertices,\
+        edges and outgoing edge partitions.
+
+    The edges are sorted by the ID of their pre-vertex, and then by their\
+    own ID, so that the edges starting at the vertex with ID i are those\
+    from row_starts[i] up to row_starts[i + 1].  The arrays cannot be\
+    written to, and do not change if the graph is changed afterwards.
+    """
+
+    __slots__ = [
+        # The index of the first edge of each pre-vertex, and the number of
+        # edges at the end
+        "_row_starts",
+
+        # The ID of the pre-vertex of each edge
+        "_sources",
+
+        # The ID of the post-vertex of each edge
+        "_targets",
+
+        # The ID of the outgoing edge partition of each edge
+        "_partition_ids",
+
+        # The weight of each edge
+        "_weights",
+
+        # The ID of each edge
+        "_edge_ids"
+    ]
+
+    def __init__(self, n_vertices, sources, targets, partition_ids, weights,
+                 edge_ids):
+        """
+        :param n_vertices: The number of vertex IDs given by the graph
+        :type n_vertices: int
+        :param sources: The ID of the pre-vertex of each edge
+        :type sources: iterable(int)
+        :param targets: The ID of the post-vertex of each edge
+        :type targets: iterable(int)
+        :param partition_ids: The ID of the partition of each edge
+        :type partition_ids: iterable(int)
+        :param weights: The weight of each edge
+        :type weights: iterable(float)
+        :param edge_ids: The ID of each edge
+        :type edge_ids: iterable(int)
+        """
+        sources = numpy.asarray(sources, dtype="int64")
+        edge_ids = numpy.asarray(edge_ids, dtype="int64")
+        order = numpy.lexsort((edge_ids, sources))
+        self._sources = self._frozen(sources[order])
+        self._targets = self._frozen(
+            numpy.asarray(targets, dtype="int64")[order])
+        self._partition_ids = self._frozen(
+            numpy.asarray(partition_ids, dtype="int64")[order])
+        self._weights = self._frozen(
+            numpy.asarray(weights, dtype="float64")[order])
+        self._edge_ids = self._frozen(edge_ids[order])
+        self._row_starts = self._frozen(numpy.searchsorted(
+            self._sources, numpy.arange(n_vertices + 1, dtype="int64")))
+
+    @staticmethod
+    def _frozen(array):
+        array.flags.writeable = False
+        return array
+
+    @property
+    def n_vertices(self):
+        """ The number of vertex IDs, and so of rows
+
+        :rtype: int
+        """
+        return len(self._row_starts) - 1
+
+    @property
+    def n_edges(self):
+        """ The number of edges
+
+        :rtype: int
+        """
+        return len(self._sources)
+
+    @property
+    def row_starts(self):
+        """ The index of the first edge starting at each vertex, followed by\
+            the number of edges
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._row_starts
+
+    @property
+    def sources(self):
+        """ The ID of the pre-vertex of each edge
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._sources
+
+    @property
+    def targets(self):
+        """ The ID of the post-vertex of each edge
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._targets
+
+    @property
+    def partition_ids(self):
+        """ The ID of the outgoing edge partition of each edge
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._partition_ids
+
+    @property
+    def weights(self):
+        """ The weight of each edge
+
+        :rtype: numpy.ndarray(float64)
+        """
+        return self._weights
+
+    @property
+    def edge_ids(self):
+        """ The ID of each edge
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._edge_ids
+
+    def targets_of(self, vertex_id):
+        """ Get the IDs of the post-vertices of the edges starting at a vertex
+
+        :param vertex_id: The ID of the pre-vertex
+        :type vertex_id: int
+        :rtype: numpy.ndarray(int64)
+        """
+        return self._targets[
+            self._row_starts[vertex_id]:self._row_starts[vertex_id + 1]]
+
+    def out_degrees(self):
+        """ Get the number of edges starting at each vertex
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return numpy.diff(self._row_starts)
+
+    def in_degrees(self):
+        """ Get the number of edges ending at each vertex
+
+        :rtype: numpy.ndarray(int64)
+        """
+        return numpy.bincount(self._targets, minlength=self.n_vertices)
@@ -28,7 +28,9 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
         # The weight of traffic going down this partition
         "_traffic_weight",
         # The label of the graph
-        "_label"
+        "_label",
+        # Blocks of edges starting at the pre vertex not all yet made
+        "_edge_blocks"
     ]
 
     def __init__(
@@ -49,6 +51,7 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
         self._pre_vertex = None
         self._traffic_type = None
         self._traffic_weight = traffic_weight
+        self._edge_blocks = list()
 
     @property
     @overrides(AbstractOutgoingEdgePartition.label)
@@ -83,6 +86,55 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
 
         self._edges.add(edge)
 
+    def remove_edge(self, edge):
+        """ Remove an edge from the partition
+
+        :param edge: the edge to remove
+        :type edge: :py:class:`pacman.model.graphs.AbstractEdge`
+        :raise KeyError: If the edge is not in the partition
+        """
+        self._make_block_edges()
+        self._edges.remove(edge)
+
+    def add_edge_block(self, edge_block, pre_vertex):
+        """ Add the edges of a block that start at a vertex, to be made when\
+            they are asked for
+
+        :param edge_block: The block of edges
+        :type edge_block: :py:class:`pacman.model.graphs.impl.EdgeBlock`
+        :param pre_vertex: The vertex of the block at the start of the edges
+        :type pre_vertex: :py:class:`pacman.model.graphs.AbstractVertex`
+        :raise PacmanConfigurationException:\
+            If the vertex or the traffic type differ from those of the\
+            partition
+        """
+        # Check for an incompatible pre vertex
+        if self._pre_vertex is None:
+            self._pre_vertex = pre_vertex
+        elif pre_vertex != self._pre_vertex:
+            raise PacmanConfigurationException(
+                "A partition can only contain edges with the same"
+                "pre_vertex")
+
+        # Check for an incompatible traffic type
+        if self._traffic_type is None:
+            self._traffic_type = edge_block.traffic_type
+        elif edge_block.traffic_type != self._traffic_type:
+            raise PacmanConfigurationException(
+                "A partition can only contain edges with the same"
+                " traffic_type")
+
+        self._edge_blocks.append(edge_block)
+
+    def _make_block_edges(self):
+        """ Make the edges of the blocks that are not yet made
+        """
+        if self._edge_blocks:
+            edge_blocks = self._edge_blocks
+            self._edge_blocks = list()
+            for edge_block in edge_blocks:
+                edge_block.make_edges_from(self._pre_vertex)
+
     @property
     @overrides(AbstractOutgoingEdgePartition.identifier)
     def identifier(self):
@@ -91,12 +143,15 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
     @property
     @overrides(AbstractOutgoingEdgePartition.edges)
     def edges(self):
+        self._make_block_edges()
         return self._edges
 
     @property
     @overrides(AbstractOutgoingEdgePartition.n_edges)
     def n_edges(self):
-        return len(self._edges)
+        return len(self._edges) + sum(
+            edge_block.n_edges_not_made_from(self._pre_vertex)
+            for edge_block in self._edge_blocks)
 
     @property
     @overrides(AbstractOutgoingEdgePartition.pre_vertex)
@@ -115,7 +170,7 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
 
     def __repr__(self):
         edges = ""
-        for edge in self._edges:
+        for edge in self.edges:
             if edge.label is not None:
                 edges += edge.label + ","
             else:
@@ -133,4 +188,4 @@ class OutgoingEdgePartition(ConstrainedObject, AbstractOutgoingEdgePartition):
         :param edge: the edge to search for.
         :return: boolean of true of false otherwise
         """
-        return edge in self._edges
+        return edge in self.edges
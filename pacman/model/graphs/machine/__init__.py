@@ -1,3 +1,5 @@
+from .frozen_machine_graph import FrozenMachineGraph
+from .frozen_outgoing_edge_partition import FrozenOutgoingEdgePartition
 from .machine_edge import MachineEdge
 from .machine_fpga_vertex import MachineFPGAVertex
 from .machine_graph import MachineGraph
@@ -6,6 +8,7 @@ from .machine_spinnaker_link_vertex import MachineSpiNNakerLinkVertex
 from .machine_vertex import MachineVertex
 from .simple_machine_vertex import SimpleMachineVertex
 
-__all__ = ["MachineEdge", "MachineFPGAVertex", "MachineGraph",
+__all__ = ["FrozenMachineGraph", "FrozenOutgoingEdgePartition",
+           "MachineEdge", "MachineFPGAVertex", "MachineGraph",
            "MachineOutgoingEdgePartition", "MachineSpiNNakerLinkVertex",
            "MachineVertex", "SimpleMachineVertex"]
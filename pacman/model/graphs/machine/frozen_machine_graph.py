@@ -0,0 +1,280 @@
+from spinn_utilities.overrides import overrides
+
+from pacman.exceptions import PacmanConfigurationException, \
+    PacmanNotFoundError
+from pacman.model.graphs import AbstractGraph
+from pacman.model.graphs.impl import GraphAdjacency
+from .frozen_outgoing_edge_partition import FrozenOutgoingEdgePartition
+
+
+class FrozenMachineGraph(AbstractGraph):
+    """ A machine graph that cannot be changed, holding the vertices, edges\
+        and outgoing edge partitions of a machine graph in tuples indexed by\
+        vertex, for the stages that only read the graph after partitioning.
+
+    The vertices and edges are those of the graph that was frozen, with the\
+    same integer IDs.  The outgoing edge partitions are frozen views of\
+    those of the graph that was frozen, which hold the edges that each\
+    partition had at the time, so that edges added to that graph later are\
+    not seen through the frozen graph.  A frozen partition is equal to the\
+    partition it was made from, so either can be used to look up the other.
+    """
+
+    __slots__ = [
+        # The label of the graph
+        "_label",
+        # The constraints of the graph
+        "_constraints",
+        # The vertices, in order
+        "_vertices",
+        # The integer ID of each vertex
+        "_vertex_ids",
+        # The edges, in the order of their partitions
+        "_edges",
+        # The integer ID of the partition of each edge, in the order of the
+        # edges
+        "_edge_partition_ids",
+        # The integer ID of each edge
+        "_edge_ids",
+        # The frozen outgoing edge partitions, in order
+        "_partitions",
+        # The integer ID of each outgoing edge partition
+        "_partition_ids",
+        # The outgoing edge partitions by (pre-vertex, name)
+        "_partitions_by_name",
+        # The outgoing edge partitions by pre-vertex
+        "_partitions_by_pre_vertex",
+        # The outgoing edges by pre-vertex
+        "_outgoing_edges",
+        # The incoming edges by post-vertex
+        "_incoming_edges",
+        # The incoming edges by (post-vertex, partition name)
+        "_incoming_edges_by_partition_name",
+        # The edges as arrays, made when first asked for
+        "_adjacency"
+    ]
+
+    def __init__(self, machine_graph):
+        """
+        :param machine_graph: The graph to freeze; any edges of blocks not\
+            yet made are made
+        :type machine_graph:\
+            :py:class:`pacman.model.graphs.machine.MachineGraph`
+        """
+        self._label = machine_graph.label
+        self._constraints = tuple(machine_graph.constraints)
+        self._vertices = tuple(machine_graph.vertices)
+        self._vertex_ids = dict(
+            (vertex, machine_graph.get_vertex_id(vertex))
+            for vertex in self._vertices)
+        self._partitions = tuple(
+            FrozenOutgoingEdgePartition(partition)
+            for partition in machine_graph.outgoing_edge_partitions)
+        self._partition_ids = dict(
+            (partition, machine_graph.get_outgoing_edge_partition_id(
+                partition.partition))
+            for partition in self._partitions)
+        self._partitions_by_name = dict(
+            ((partition.pre_vertex, partition.identifier), partition)
+            for partition in self._partitions)
+
+        partitions_by_pre_vertex = dict()
+        outgoing_edges = dict()
+        incoming_edges = dict()
+        incoming_edges_by_partition_name = dict()
+        edges = list()
+        edge_partition_ids = list()
+        for partition in self._partitions:
+            partitions_by_pre_vertex.setdefault(
+                partition.pre_vertex, list()).append(partition)
+            partition_id = self._partition_ids[partition]
+            for edge in partition.edges:
+                edges.append(edge)
+                edge_partition_ids.append(partition_id)
+                outgoing_edges.setdefault(edge.pre_vertex, list()).append(edge)
+                incoming_edges.setdefault(
+                    edge.post_vertex, list()).append(edge)
+                incoming_edges_by_partition_name.setdefault(
+                    (edge.post_vertex, partition.identifier),
+                    list()).append(edge)
+        self._edges = tuple(edges)
+        self._edge_partition_ids = tuple(edge_partition_ids)
+        self._edge_ids = dict(
+            (edge, machine_graph.get_edge_id(edge)) for edge in self._edges)
+        self._partitions_by_pre_vertex = self._tuples(
+            partitions_by_pre_vertex)
+        self._outgoing_edges = self._tuples(outgoing_edges)
+        self._incoming_edges = self._tuples(incoming_edges)
+        self._incoming_edges_by_partition_name = self._tuples(
+            incoming_edges_by_partition_name)
+        self._adjacency = None
+
+    @staticmethod
+    def _tuples(lists):
+        return dict((key, tuple(values)) for key, values in lists.items())
+
+    def _frozen(self):
+        return PacmanConfigurationException(
+            "The frozen graph {} cannot be changed".format(self._label))
+
+    @property
+    @overrides(AbstractGraph.label)
+    def label(self):
+        return self._label
+
+    @property
+    @overrides(AbstractGraph.constraints)
+    def constraints(self):
+        return self._constraints
+
+    @overrides(AbstractGraph.add_constraint)
+    def add_constraint(self, constraint):
+        raise self._frozen()
+
+    @overrides(AbstractGraph.add_vertex)
+    def add_vertex(self, vertex):
+        raise self._frozen()
+
+    @overrides(AbstractGraph.add_edge)
+    def add_edge(self, edge, outgoing_edge_partition_name):
+        raise self._frozen()
+
+    @overrides(AbstractGraph.add_outgoing_edge_partition)
+    def add_outgoing_edge_partition(self, outgoing_edge_partition):
+        raise self._frozen()
+
+    @property
+    @overrides(AbstractGraph.vertices)
+    def vertices(self):
+        return self._vertices
+
+    @property
+    @overrides(AbstractGraph.n_vertices)
+    def n_vertices(self):
+        return len(self._vertices)
+
+    @property
+    @overrides(AbstractGraph.edges)
+    def edges(self):
+        return self._edges
+
+    @property
+    def n_edges(self):
+        """ The number of edges in the graph
+
+        :rtype: int
+        """
+        return len(self._edges)
+
+    @property
+    @overrides(AbstractGraph.outgoing_edge_partitions)
+    def outgoing_edge_partitions(self):
+        return self._partitions
+
+    @property
+    @overrides(AbstractGraph.n_outgoing_edge_partitions)
+    def n_outgoing_edge_partitions(self):
+        return len(self._partitions)
+
+    @overrides(AbstractGraph.get_edges_starting_at_vertex)
+    def get_edges_starting_at_vertex(self, vertex):
+        return self._outgoing_edges.get(vertex, ())
+
+    @overrides(AbstractGraph.get_edges_ending_at_vertex)
+    def get_edges_ending_at_vertex(self, vertex):
+        return self._incoming_edges.get(vertex, ())
+
+    @overrides(AbstractGraph.get_edges_ending_at_vertex_with_partition_name)
+    def get_edges_ending_at_vertex_with_partition_name(
+            self, vertex, partition_name):
+        return self._incoming_edges_by_partition_name.get(
+            (vertex, partition_name), ())
+
+    @overrides(AbstractGraph.get_outgoing_edge_partitions_starting_at_vertex)
+    def get_outgoing_edge_partitions_starting_at_vertex(self, vertex):
+        return self._partitions_by_pre_vertex.get(vertex, ())
+
+    @overrides(AbstractGraph.get_outgoing_edge_partition_starting_at_vertex)
+    def get_outgoing_edge_partition_starting_at_vertex(
+            self, vertex, outgoing_edge_partition_name):
+        return self._partitions_by_name.get(
+            (vertex, outgoing_edge_partition_name), None)
+
+    def get_n_edges_starting_at_vertex(self, vertex):
+        """ Get the number of edges that start at a vertex
+
+        :param vertex: The vertex at which the edges start
+        :rtype: int
+        """
+        return len(self._outgoing_edges.get(vertex, ()))
+
+    def get_n_edges_ending_at_vertex(self, vertex):
+        """ Get the number of edges that end at a vertex
+
+        :param vertex: The vertex at which the edges end
+        :rtype: int
+        """
+        return len(self._incoming_edges.get(vertex, ()))
+
+    def get_vertex_id(self, vertex):
+        """ Get the integer ID of a vertex, as given by the graph that was\
+            frozen
+
+        :param vertex: The vertex to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the vertex is not in the graph
+        """
+        return self._get_id(self._vertex_ids, vertex, "Vertex")
+
+    def get_edge_id(self, edge):
+        """ Get the integer ID of an edge, as given by the graph that was\
+            frozen
+
+        :param edge: The edge to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the edge is not in the graph
+        """
+        return self._get_id(self._edge_ids, edge, "Edge")
+
+    def get_outgoing_edge_partition_id(self, outgoing_edge_partition):
+        """ Get the integer ID of an outgoing edge partition, as given by the\
+            graph that was frozen
+
+        :param outgoing_edge_partition: The partition to get the ID of
+        :rtype: int
+        :raise PacmanNotFoundError: If the partition is not in the graph
+        """
+        return self._get_id(
+            self._partition_ids, outgoing_edge_partition, "Partition")
+
+    @staticmethod
+    def _get_id(ids, item, kind):
+        item_id = ids.get(item)
+        if item_id is None:
+            raise PacmanNotFoundError(
+                "{} {} is not in the graph".format(kind, item))
+        return item_id
+
+    def get_adjacency(self):
+        """ Get the edges of the graph as arrays of the IDs of their vertices\
+            and partitions, and of their weights.  The arrays are made the\
+            first time they are asked for, and then kept.
+
+        :rtype: :py:class:`pacman.model.graphs.impl.GraphAdjacency`
+        """
+        if self._adjacency is None:
+            self._adjacency = GraphAdjacency(
+                max(self._vertex_ids.values()) + 1 if self._vertex_ids else 0,
+                [self._vertex_ids[edge.pre_vertex] for edge in self._edges],
+                [self._vertex_ids[edge.post_vertex] for edge in self._edges],
+                self._edge_partition_ids,
+                [edge.traffic_weight for edge in self._edges],
+                [self._edge_ids[edge] for edge in self._edges])
+        return self._adjacency
+
+    def freeze(self):
+        """ Get the frozen graph, which is this graph
+
+        :rtype: :py:class:`FrozenMachineGraph`
+        """
+        return self
@@ -0,0 +1,128 @@
+from spinn_utilities.overrides import overrides
+
+from pacman.exceptions import PacmanConfigurationException
+from pacman.model.graphs import AbstractOutgoingEdgePartition
+
+_REPR_TEMPLATE = \
+    "FrozenOutgoingEdgePartition(identifier={}, edges={}, constraints={}," \
+    " label={})"
+
+
+class FrozenOutgoingEdgePartition(AbstractOutgoingEdgePartition):
+    """ An outgoing edge partition that cannot be changed, holding the edges\
+        that a partition had when its graph was frozen.
+
+    A frozen partition is equal to, and has the same hash as, the partition\
+    it was made from, so that either can be used to look up anything that\
+    is stored by the other, such as the keys of the partition.
+    """
+
+    __slots__ = [
+        # The partition that was frozen
+        "_partition",
+        # The edges of the partition when it was frozen
+        "_edges",
+        # The constraints of the partition when it was frozen
+        "_constraints"
+    ]
+
+    def __init__(self, partition):
+        """
+        :param partition: The partition to freeze; any edges of blocks not\
+            yet made are made
+        :type partition:\
+            :py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`
+        """
+        self._partition = partition
+        self._edges = tuple(partition.edges)
+        self._constraints = tuple(partition.constraints)
+
+    def _frozen(self):
+        return PacmanConfigurationException(
+            "The frozen partition {} cannot be changed".format(
+                self._partition.identifier))
+
+    @property
+    def partition(self):
+        """ The partition that was frozen
+
+        :rtype:\
+            :py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`
+        """
+        return self._partition
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.label)
+    def label(self):
+        return self._partition.label
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.constraints)
+    def constraints(self):
+        return self._constraints
+
+    @overrides(AbstractOutgoingEdgePartition.add_constraint)
+    def add_constraint(self, constraint):
+        raise self._frozen()
+
+    @overrides(AbstractOutgoingEdgePartition.add_edge)
+    def add_edge(self, edge):
+        raise self._frozen()
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.identifier)
+    def identifier(self):
+        return self._partition.identifier
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.edges)
+    def edges(self):
+        return self._edges
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.n_edges)
+    def n_edges(self):
+        return len(self._edges)
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.pre_vertex)
+    def pre_vertex(self):
+        return self._partition.pre_vertex
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.traffic_type)
+    def traffic_type(self):
+        return self._partition.traffic_type
+
+    @property
+    @overrides(AbstractOutgoingEdgePartition.traffic_weight)
+    def traffic_weight(self):
+        return self._partition.traffic_weight
+
+    @overrides(AbstractOutgoingEdgePartition.__contains__)
+    def __contains__(self, edge):
+        return edge in self._edges
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenOutgoingEdgePartition):
+            other = other._partition
+        return self._partition is other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._partition)
+
+    def __repr__(self):
+        edges = ""
+        for edge in self._edges:
+            if edge.label is not None:
+                edges += edge.label + ","
+            else:
+                edges += str(edge) + ","
+        return _REPR_TEMPLATE.format(
+            self.identifier, edges, self._constraints, self.label)
+
+    def __str__(self):
+        return self.__repr__()
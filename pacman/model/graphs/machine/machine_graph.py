@@ -1,5 +1,7 @@
 from .machine_vertex import MachineVertex
 from .machine_edge import MachineEdge
+from .frozen_machine_graph import FrozenMachineGraph
+from spinn_utilities.overrides import overrides
 from pacman.model.graphs import AbstractOutgoingEdgePartition
 from pacman.model.graphs.impl import Graph
 
@@ -13,3 +15,19 @@ class MachineGraph(Graph):
     def __init__(self, label):
         super(MachineGraph, self).__init__(
             MachineVertex, MachineEdge, AbstractOutgoingEdgePartition, label)
+
+    @overrides(Graph._get_edge_weight)
+    def _get_edge_weight(self, edge, partition):
+        return edge.traffic_weight
+
+    def freeze(self):
+        """ Make a frozen copy of the graph, which cannot be changed and\
+            which holds its indices more compactly, for the stages after\
+            partitioning that only read the graph.  Any edges of blocks not\
+            yet made are made first.  The outgoing edge partitions of the\
+            frozen graph hold the edges that they have now, so edges added\
+            to this graph later do not appear in the frozen graph.
+
+        :rtype: :py:class:`pacman.model.graphs.machine.FrozenMachineGraph`
+        """
+        return FrozenMachineGraph(self)
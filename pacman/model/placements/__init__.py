@@ -1,4 +1,5 @@
 from .placement import Placement
 from .placements import Placements
+from .columnar_placements import ColumnarPlacements
 
-__all__ = ["Placement", "Placements"]
+__all__ = ["ColumnarPlacements", "Placement", "Placements"]
@@ -0,0 +1,359 @@
+import numpy
+from six import moves, raise_from
+from pacman.exceptions import (PacmanAlreadyPlacedError,
+                               PacmanNotPlacedError,
+                               PacmanProcessorAlreadyOccupiedError,
+                               PacmanProcessorNotOccupiedError)
+from .placement import Placement
+from .placements import NO_PROCESSOR
+
+# The number of placements there is space for when there are none yet
+_INITIAL_CAPACITY = 1024
+
+
+class ColumnarPlacements(object):
+    """ The placements of vertices on the chips of the machine, held as\
+        arrays of the coordinates of the placements rather than as a\
+        placement object for each vertex.
+
+    This has the same interface as\
+    :py:class:`pacman.model.placements.Placements`, but the placement objects\
+    that it returns are made when they are asked for.  Removing a placement\
+    leaves a gap in the arrays, which are closed up when more than half of\
+    their entries are gaps, or when the arrays or the placements on a chip\
+    are asked for.
+    """
+
+    __slots__ = [
+
+        # list of the machine vertices placed, in the order that they were
+        # placed, or None where a placement has been removed; the index of a
+        # vertex is the index of its placement in the coordinate arrays
+        "_vertices",
+
+        # the number of placements removed since the gaps they left were
+        # last closed up
+        "_n_removed",
+
+        # dict of [machine_vertex] -> index of its placement. used for fast
+        # lookup of the placement of a machine vertex.
+        "_indices_by_vertex",
+
+        # dict of [packed (x,y,p)] -> index of the placement. used for fast
+        # lookup of a vertex given a set of coordinates
+        "_indices_by_processor",
+
+        # array of the x coordinate of each placement, with space for more
+        "_xs",
+
+        # array of the y coordinate of each placement, with space for more
+        "_ys",
+
+        # array of the processor of each placement, with space for more
+        "_ps",
+
+        # tuple of the indices of the placements in order of chip and
+        # processor, the chip of each of those, and the chips in order of
+        # first placement, or None if not made since the last change
+        "_chip_index",
+    ]
+
+    def __init__(self, placements=None):
+        """
+        :param placements: Any initial placements
+        :type placements:\
+            iterable(:py:class:`pacman.model.placements.Placement`)
+        :raise PacmanAlreadyPlacedError:\
+            If there is any vertex with more than one placement.
+        :raise PacmanProcessorAlreadyOccupiedError:\
+            If two placements are made to the same processor.
+        """
+        self._vertices = list()
+        self._n_removed = 0
+        self._indices_by_vertex = dict()
+        self._indices_by_processor = dict()
+        self._xs = numpy.zeros(_INITIAL_CAPACITY, dtype="int32")
+        self._ys = numpy.zeros(_INITIAL_CAPACITY, dtype="int32")
+        self._ps = numpy.zeros(_INITIAL_CAPACITY, dtype="int32")
+        self._chip_index = None
+        if placements is not None:
+            self.add_placements(placements)
+
+    @staticmethod
+    def _processor_key(x, y, p):
+        if p is None:
+            p = NO_PROCESSOR
+        return (((x << 16) | y) << 16) | (p & 0xFFFF)
+
+    def _p(self, index):
+        p = int(self._ps[index])
+        return None if p == NO_PROCESSOR else p
+
+    def _placement(self, index):
+        return Placement(
+            self._vertices[index], int(self._xs[index]),
+            int(self._ys[index]), self._p(index))
+
+    @property
+    def n_placements(self):
+        """ The number of placements
+
+        :rtype: int
+        """
+        return len(self._vertices) - self._n_removed
+
+    def add_placements(self, placements):
+        """ Add some placements
+
+        :param placements: The placements to add
+        :type placements:\
+            iterable(:py:class:`pacman.model.placements.Placement`)
+        """
+        for placement in placements:
+            self.add_placement(placement)
+
+    def add_placement(self, placement):
+        """ Add a placement
+
+        :param placement: The placement to add
+        :type placement:\
+            :py:class:`pacman.model.placements.placement.Placement`
+        :raise PacmanAlreadyPlacedError:\
+            If there is any vertex with more than one placement.
+        :raise PacmanProcessorAlreadyOccupiedError:\
+            If two placements are made to the same processor.
+        """
+        key = self._processor_key(placement.x, placement.y, placement.p)
+        if key in self._indices_by_processor:
+            raise PacmanProcessorAlreadyOccupiedError(
+                (placement.x, placement.y, placement.p))
+        if placement.vertex in self._indices_by_vertex:
+            raise PacmanAlreadyPlacedError(placement.vertex)
+
+        index = len(self._vertices)
+        if index == len(self._xs):
+            self._xs = self._grown(self._xs)
+            self._ys = self._grown(self._ys)
+            self._ps = self._grown(self._ps)
+        self._xs[index] = placement.x
+        self._ys[index] = placement.y
+        self._ps[index] = (
+            NO_PROCESSOR if placement.p is None else placement.p)
+        self._vertices.append(placement.vertex)
+        self._indices_by_vertex[placement.vertex] = index
+        self._indices_by_processor[key] = index
+        self._chip_index = None
+
+    @classmethod
+    def _grown(cls, array):
+        # A new array is made so that arrays handed out are not changed
+        return cls._with_capacity(
+            array, max(len(array) * 2, _INITIAL_CAPACITY))
+
+    def remove_placement(self, vertex):
+        """ Remove the placement of a vertex
+
+        :param vertex: The vertex to remove the placement of
+        :type vertex: :py:class:`pacman.model.graphs.machine.MachineVertex`
+        :return: The placement removed
+        :rtype: :py:class:`pacman.model.placements.Placement`
+        :raise PacmanNotPlacedError: If the vertex has not been placed.
+        """
+        try:
+            index = self._indices_by_vertex.pop(vertex)
+        except KeyError as e:
+            raise_from(PacmanNotPlacedError(vertex), e)
+        placement = self._placement(index)
+        del self._indices_by_processor[self._processor_key(
+            placement.x, placement.y, placement.p)]
+
+        # The arrays are left as they are, as they may have been handed out
+        self._vertices[index] = None
+        self._n_removed += 1
+        self._chip_index = None
+        if self._n_removed * 2 > len(self._vertices):
+            self._close_gaps()
+        return placement
+
+    def _close_gaps(self):
+        """ Close up the gaps left by removed placements
+        """
+        if not self._n_removed:
+            return
+        kept = numpy.array(
+            [index for index, vertex in enumerate(self._vertices)
+             if vertex is not None], dtype="int64")
+
+        # New arrays are made, so that arrays handed out are not changed
+        capacity = max(len(kept) * 2, _INITIAL_CAPACITY)
+        self._xs = self._with_capacity(self._xs[kept], capacity)
+        self._ys = self._with_capacity(self._ys[kept], capacity)
+        self._ps = self._with_capacity(self._ps[kept], capacity)
+        self._vertices = [
+            vertex for vertex in self._vertices if vertex is not None]
+        self._n_removed = 0
+        for index, vertex in enumerate(self._vertices):
+            self._indices_by_vertex[vertex] = index
+            self._indices_by_processor[self._processor_key(
+                int(self._xs[index]), int(self._ys[index]),
+                self._p(index))] = index
+
+    @staticmethod
+    def _with_capacity(values, capacity):
+        array = numpy.zeros(capacity, dtype=values.dtype)
+        array[:len(values)] = values
+        return array
+
+    def get_vertex_on_processor(self, x, y, p):
+        """ Return the vertex on a specific processor or None if the\
+            processor has not been allocated
+
+        :param x: the x coordinate of the chip
+        :type x: int
+        :param y: the y coordinate of the chip
+        :type y: int
+        :param p: the processor on the chip
+        :type p: int
+        :return: the vertex placed on the given processor
+        :rtype: :py:class:`pacman.model.graphs.machine.MachineVertex`
+        :raise PacmanProcessorNotOccupiedError:\
+            If the processor is not occupied
+        """
+        try:
+            return self._vertices[
+                self._indices_by_processor[self._processor_key(x, y, p)]]
+        except KeyError as e:
+            raise_from(PacmanProcessorNotOccupiedError((x, y, p)), e)
+
+    def get_placement_of_vertex(self, vertex):
+        """ Return the placement information for a vertex
+
+        :param vertex: The vertex to find the placement of
+        :type vertex: :py:class:`pacman.model.graphs.machine.MachineVertex`
+        :return: The placement
+        :rtype: :py:class:`pacman.model.placements.Placement`
+        :raise PacmanNotPlacedError: If the vertex has not been placed.
+        """
+        try:
+            return self._placement(self._indices_by_vertex[vertex])
+        except KeyError as e:
+            raise_from(PacmanNotPlacedError(vertex), e)
+
+    def get_placed_processors(self):
+        """ Return an iterable of processors with assigned vertices.
+
+        :return: Iterable of (x, y, p) tuples
+        :rtype: iterable(tuple(int, int, int))
+        """
+        for index in moves.range(len(self._vertices)):
+            if self._vertices[index] is not None:
+                yield (int(self._xs[index]), int(self._ys[index]),
+                       self._p(index))
+
+    def _get_chip_index(self):
+        if self._chip_index is None:
+            self._close_gaps()
+            n_placements = len(self._vertices)
+            chips = ((self._xs[:n_placements].astype("int64") << 16) |
+                     self._ys[:n_placements])
+            order = numpy.lexsort((self._ps[:n_placements], chips))
+            _, first_indices = numpy.unique(chips, return_index=True)
+            self._chip_index = (
+                order, chips[order],
+                [(int(self._xs[index]), int(self._ys[index]))
+                 for index in numpy.sort(first_indices)])
+        return self._chip_index
+
+    def _chip_range(self, x, y):
+        order, chips, _ = self._get_chip_index()
+        chip = (x << 16) | y
+        return order[numpy.searchsorted(chips, chip, side="left"):
+                     numpy.searchsorted(chips, chip, side="right")]
+
+    def get_placements_on_chip(self, x, y):
+        """ Return the placements on a chip, in order of processor
+
+        :param x: the x coordinate of the chip
+        :type x: int
+        :param y: the y coordinate of the chip
+        :type y: int
+        :return: the placements on the chip, which is empty if there are none
+        :rtype: list(:py:class:`pacman.model.placements.Placement`)
+        """
+        return [self._placement(index) for index in self._chip_range(x, y)]
+
+    def n_placements_on_chip(self, x, y):
+        """ Return the number of placements on a chip
+
+        :param x: the x coordinate of the chip
+        :type x: int
+        :param y: the y coordinate of the chip
+        :type y: int
+        :rtype: int
+        """
+        return len(self._chip_range(x, y))
+
+    @property
+    def chips_used(self):
+        """ The chips with at least one placement, in the order of the\
+            first of the placements on them
+
+        :return: Iterable of (x, y) tuples
+        :rtype: iterable(tuple(int, int))
+        """
+        return iter(self._get_chip_index()[2])
+
+    def is_processor_occupied(self, x, y, p):
+        """ Determine if a processor has a vertex on it
+
+        :param int x: x coordinate of processor.
+        :param int y: y coordinate of processor.
+        :param int p: Index of processor.
+        :return bool: Whether the processor has an assigned vertex.
+        """
+        return self._processor_key(x, y, p) in self._indices_by_processor
+
+    @property
+    def placements(self):
+        """ All of the placements
+
+        :return: iterable of placements
+        :rtype: iterable(:py:class:`pacman.model.placements.Placement`)
+        :raise None: does not raise any known exceptions
+        """
+        return (self._placement(index)
+                for index in moves.range(len(self._vertices))
+                if self._vertices[index] is not None)
+
+    def to_arrays(self):
+        """ Get the placements as arrays of coordinates.  The arrays share\
+            the memory of these placements, and cannot be written to.
+
+        :return: The vertices, and the x, y and processor of the placement\
+            of each vertex; a processor of -1 means none
+        :rtype: tuple(tuple(:py:class:`pacman.model.graphs.machine.\
+            MachineVertex`), numpy.ndarray(int32), numpy.ndarray(int32),\
+            numpy.ndarray(int32))
+        """
+        self._close_gaps()
+        n_placements = len(self._vertices)
+        arrays = [array[:n_placements]
+                  for array in (self._xs, self._ys, self._ps)]
+        for array in arrays:
+            array.flags.writeable = False
+        return (tuple(self._vertices),) + tuple(arrays)
+
+    def __repr__(self):
+        output = ""
+        for placement in self.placements:
+            output += placement.__repr__()
+        return output
+
+    def __iter__(self):
+        """ An iterator for the placements object within
+
+        """
+        return iter(self.placements)
+
+    def __len__(self):
+        return self.n_placements
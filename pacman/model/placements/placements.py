@@ -1,10 +1,14 @@
 from collections import OrderedDict
+import numpy
 from six import iterkeys, itervalues, raise_from
 from pacman.exceptions import (PacmanAlreadyPlacedError,
                                PacmanNotPlacedError,
                                PacmanProcessorAlreadyOccupiedError,
                                PacmanProcessorNotOccupiedError)
 
+# The processor given in arrays of placements with no processor
+NO_PROCESSOR = -1
+
 
 class Placements(object):
     """ The placements of vertices on the chips of the machine.
@@ -19,6 +23,10 @@ class Placements(object):
         # dict of [machine_vertex] -> placement object. used for fast lookup of
         # the placement of a machine vertex.
         "_machine_vertices",
+
+        # dict of [(x,y)] -> dict of [p] -> placement object. used for fast
+        # lookup of the placements on a chip
+        "_placements_by_chip",
     ]
 
     def __init__(self, placements=None):
@@ -33,6 +41,7 @@ class Placements(object):
         """
         self._placements = OrderedDict()
         self._machine_vertices = OrderedDict()
+        self._placements_by_chip = OrderedDict()
         if placements is not None:
             self.add_placements(placements)
 
@@ -73,6 +82,31 @@ class Placements(object):
 
         self._placements[placement_id] = placement
         self._machine_vertices[placement.vertex] = placement
+        chip = (placement.x, placement.y)
+        if chip not in self._placements_by_chip:
+            self._placements_by_chip[chip] = dict()
+        self._placements_by_chip[chip][placement.p] = placement
+
+    def remove_placement(self, vertex):
+        """ Remove the placement of a vertex
+
+        :param vertex: The vertex to remove the placement of
+        :type vertex: :py:class:`pacman.model.graphs.machine.MachineVertex`
+        :return: The placement removed
+        :rtype: :py:class:`pacman.model.placements.Placement`
+        :raise PacmanNotPlacedError: If the vertex has not been placed.
+        """
+        try:
+            placement = self._machine_vertices.pop(vertex)
+        except KeyError as e:
+            raise_from(PacmanNotPlacedError(vertex), e)
+        del self._placements[placement.x, placement.y, placement.p]
+        chip = (placement.x, placement.y)
+        on_chip = self._placements_by_chip[chip]
+        del on_chip[placement.p]
+        if not on_chip:
+            del self._placements_by_chip[chip]
+        return placement
 
     def get_vertex_on_processor(self, x, y, p):
         """ Return the vertex on a specific processor or None if the\
@@ -117,6 +151,42 @@ class Placements(object):
         """
         return iterkeys(self._placements)
 
+    def get_placements_on_chip(self, x, y):
+        """ Return the placements on a chip, in order of processor
+
+        :param x: the x coordinate of the chip
+        :type x: int
+        :param y: the y coordinate of the chip
+        :type y: int
+        :return: the placements on the chip, which is empty if there are none
+        :rtype: list(:py:class:`pacman.model.placements.Placement`)
+        """
+        on_chip = self._placements_by_chip.get((x, y))
+        if on_chip is None:
+            return []
+        return [on_chip[p] for p in sorted(on_chip)]
+
+    def n_placements_on_chip(self, x, y):
+        """ Return the number of placements on a chip
+
+        :param x: the x coordinate of the chip
+        :type x: int
+        :param y: the y coordinate of the chip
+        :type y: int
+        :rtype: int
+        """
+        return len(self._placements_by_chip.get((x, y), ()))
+
+    @property
+    def chips_used(self):
+        """ The chips with at least one placement, in the order in which\
+            they were first placed on
+
+        :return: Iterable of (x, y) tuples
+        :rtype: iterable(tuple(int, int))
+        """
+        return iterkeys(self._placements_by_chip)
+
     def is_processor_occupied(self, x, y, p):
         """ Determine if a processor has a vertex on it
 
@@ -137,6 +207,26 @@ class Placements(object):
         """
         return itervalues(self._placements)
 
+    def to_arrays(self):
+        """ Get the placements as arrays of coordinates.  The arrays are\
+            made when asked for, and do not change if the placements do.
+
+        :return: The vertices, and the x, y and processor of the placement\
+            of each vertex; a processor of -1 means none
+        :rtype: tuple(tuple(:py:class:`pacman.model.graphs.machine.\
+            MachineVertex`), numpy.ndarray(int32), numpy.ndarray(int32),\
+            numpy.ndarray(int32))
+        """
+        placements = list(itervalues(self._placements))
+        return (
+            tuple(placement.vertex for placement in placements),
+            numpy.array([placement.x for placement in placements],
+                        dtype="int32"),
+            numpy.array([placement.y for placement in placements],
+                        dtype="int32"),
+            numpy.array([NO_PROCESSOR if placement.p is None else placement.p
+                         for placement in placements], dtype="int32"))
+
     def __repr__(self):
         output = ""
         for placement in self._placements:
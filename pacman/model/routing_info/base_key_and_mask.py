@@ -11,7 +11,11 @@ class BaseKeyAndMask(object):
         "_base_key",
 
         # The routing mask
-        "_mask"
+        "_mask",
+
+        # The positions of the zeros in the mask, lowest first, or None if
+        # not yet worked out
+        "_zero_bits"
     ]
 
     def __init__(self, base_key, mask):
@@ -25,6 +29,7 @@ class BaseKeyAndMask(object):
         """
         self._base_key = base_key
         self._mask = mask
+        self._zero_bits = None
 
         if base_key & mask != base_key:
             raise PacmanConfigurationException(
@@ -75,6 +80,13 @@ class BaseKeyAndMask(object):
     def __hash__(self):
         return self.__repr__().__hash__()
 
+    def _get_zero_bits(self):
+        # Assume 32-bits; worked out once, as the mask does not change
+        if self._zero_bits is None:
+            self._zero_bits = tuple(
+                bit for bit in range(32) if not (self._mask >> bit) & 1)
+        return self._zero_bits
+
     @property
     def n_keys(self):
         """ The total number of keys that can be generated given the mask
@@ -82,15 +94,7 @@ class BaseKeyAndMask(object):
         :return: The number of keys
         :rtype: int
         """
-        # converts mask into array of bit representation
-        unwrapped_mask = numpy.unpackbits(
-            numpy.asarray([self._mask], dtype=">u4").view(dtype="uint8"))
-
-        # how many zeros are in the bit representation array
-        zeros = numpy.where(unwrapped_mask == 0)[0]
-
-        # number of keys available from this mask size
-        return 2 ** len(zeros)
+        return 1 << len(self._get_zero_bits())
 
     def get_keys(self, key_array=None, offset=0, n_keys=None):
         """ Get the ordered list of keys that the combination allows
@@ -109,41 +113,25 @@ class BaseKeyAndMask(object):
             the array
         :rtype: tuple(array-like of int, int)
         """
-        # Get the position of the zeros in the mask - assume 32-bits
-        unwrapped_mask = numpy.unpackbits(
-            numpy.asarray([self._mask], dtype=">u4").view(dtype="uint8"))
-        zeros = numpy.where(unwrapped_mask == 0)[0]
-
-        # If there are no zeros, there is only one key in the range, so
-        # return that
-        if len(zeros) == 0:
-            if key_array is None:
-                key_array = numpy.zeros(1, dtype=">u4")
-            key_array[offset] = self._base_key
-            return key_array, 1
+        zero_bits = self._get_zero_bits()
 
         # We now know how many values there are - 2^len(zeros)
-        max_n_keys = 2 ** len(zeros)
-        if key_array is not None and len(key_array) < max_n_keys:
-            max_n_keys = len(key_array)
+        max_n_keys = 1 << len(zero_bits)
+        if key_array is not None and len(key_array) - offset < max_n_keys:
+            max_n_keys = len(key_array) - offset
         if n_keys is None or n_keys > max_n_keys:
             n_keys = max_n_keys
         if key_array is None:
             key_array = numpy.zeros(n_keys, dtype=">u4")
 
-        # Create a list of 2^len(zeros) keys
-        unwrapped_key = numpy.unpackbits(
-            numpy.asarray([self._base_key], dtype=">u4").view(dtype="uint8"))
-
-        # for each key, create its key with the idea of a neuron ID being
-        # continuous and live at an offset position from the bottom of
-        # the key
-        for value in range(n_keys):
-            key = numpy.copy(unwrapped_key)
-            unwrapped_value = numpy.unpackbits(
-                numpy.asarray([value], dtype=">u4")
-                     .view(dtype="uint8"))[-len(zeros):]
-            key[zeros] = unwrapped_value
-            key_array[value + offset] = \
-                numpy.packbits(key).view(dtype=">u4")[0].item()
+        # Each key is the base key with the bits of a neuron ID, counting up
+        # from 0, put into the zeros of the mask, lowest bit in lowest zero;
+        # this is done for all the IDs at once, one bit at a time
+        values = numpy.arange(n_keys, dtype="uint32")
+        keys = numpy.full(n_keys, self._base_key, dtype="uint32")
+        for bit, zero_bit in enumerate(zero_bits):
+            if (1 << bit) >= n_keys:
+                break
+            keys |= ((values >> bit) & 1) << zero_bit
+        key_array[offset:offset + n_keys] = keys
         return key_array, n_keys
@@ -47,8 +47,11 @@ class PartitionRoutingInfo(object):
         key_array = numpy.zeros(n_keys, dtype=">u4")
         offset = 0
         for key_and_mask in self._keys_and_masks:
-            _, offset = key_and_mask.get_keys(
+            if offset == n_keys:
+                break
+            _, n_keys_added = key_and_mask.get_keys(
                 key_array=key_array, offset=offset, n_keys=(n_keys - offset))
+            offset += n_keys_added
         return key_array
 
     @property
@@ -17,7 +17,10 @@ class RoutingInfo(object):
         "_info_by_prevertex",
 
         # Partition information by edge
-        "_info_by_edge"
+        "_info_by_edge",
+
+        # The edges of each partition when its information was added
+        "_edges_by_partition"
     ]
 
     def __init__(self, partition_info_items=None):
@@ -40,6 +43,9 @@ class RoutingInfo(object):
         # Partition information by edge
         self._info_by_edge = dict()
 
+        # The edges of each partition when its information was added
+        self._edges_by_partition = dict()
+
         if partition_info_items is not None:
             for partition_info_item in partition_info_items:
                 self.add_partition_info(partition_info_item)
@@ -66,9 +72,31 @@ class RoutingInfo(object):
         self._info_by_partition[p] = partition_info
         self._info_by_prevertex[p.pre_vertex, p.identifier] = partition_info
 
-        for edge in p.edges:
+        edges = tuple(p.edges)
+        self._edges_by_partition[p] = edges
+        for edge in edges:
             self._info_by_edge[edge] = partition_info
 
+    def remove_partition_info(self, partition):
+        """ Remove the information of a partition, and of the edges that\
+            were in it when the information was added
+
+        :param partition: The partition to remove the information of
+        :type partition:\
+            :py:class:`pacman.model.graphs.impl.OutgoingEdgePartition`
+        :return: The partition information removed, or None if there was none
+        :rtype: :py:class:`pacman.model.routing_info.PartitionRoutingInfo` \
+            or None
+        """
+        partition_info = self._info_by_partition.pop(partition, None)
+        if partition_info is not None:
+            del self._info_by_prevertex[
+                partition.pre_vertex, partition.identifier]
+            for edge in self._edges_by_partition.pop(partition):
+                if self._info_by_edge.get(edge) is partition_info:
+                    del self._info_by_edge[edge]
+        return partition_info
+
     def get_first_key_from_partition(self, partition):
         """ Get the first key associated with a particular partition
 
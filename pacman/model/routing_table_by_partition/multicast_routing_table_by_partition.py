@@ -38,6 +38,28 @@ class MulticastRoutingTableByPartition(object):
             self._router_to_entries_map[key][partition] = entry.merge_entry(
                 self._router_to_entries_map[key][partition])
 
+    def remove_partitions(self, partitions):
+        """ Remove the entries of some partitions from all the routers
+
+        :param partitions: the partitions to remove the entries of
+        :type partitions: \
+            iterable(:py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`)
+        :return: the coordinates of the routers that had entries removed
+        :rtype: list(tuple(int, int))
+        """
+        partitions = set(partitions)
+        routers = list()
+        for key, entries in list(self._router_to_entries_map.items()):
+            removed = False
+            for partition in partitions.intersection(entries):
+                del entries[partition]
+                removed = True
+            if removed:
+                routers.append(key)
+                if not entries:
+                    del self._router_to_entries_map[key]
+        return routers
+
     def get_routers(self):
         """ Get the coordinates of all stored routers
         """
@@ -1,10 +1,13 @@
 import logging
+import numpy
 import os
 import time
+from six import moves
 
 from pacman import exceptions
 from pacman.model.graphs import AbstractSpiNNakerLinkVertex, AbstractFPGAVertex
 from pacman.model.graphs.common import EdgeTrafficType
+from pacman.model.placements.placements import NO_PROCESSOR
 
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
@@ -15,6 +18,7 @@ _LINK_LABELS = {0: 'E', 1: 'NE', 2: 'N', 3: 'W', 4: 'SW', 5: 'S'}
 
 _C_ROUTING_TABLE_DIR = "compressed_routing_tables_generated"
 _COMPARED_FILENAME = "comparison_of_compressed_uncompressed_routing_tables.rpt"
+_LINK_LOAD_FILENAME = "router_link_loads.rpt"
 _PARTITIONING_FILENAME = "partitioned_by_vertex.rpt"
 _PLACEMENT_VTX_FILENAME = "placement_by_vertex.rpt"
 _PLACEMENT_CORE_FILENAME = "placement_by_core.rpt"
@@ -52,6 +56,28 @@ def tag_allocator_report(report_folder, tag_infos):
                      "writing.", file_name)
 
 
+def router_link_load_report(report_folder, link_loads):
+    """ Reports the bandwidth used on each link by the routes, most heavily\
+        loaded first
+
+    :param report_folder: the folder to which the reports are being written
+    :param link_loads: the bandwidth used on each link by (x, y, link ID)
+    :rtype: None
+    """
+
+    file_name = os.path.join(report_folder, _LINK_LOAD_FILENAME)
+    try:
+        with open(file_name, "w") as f:
+            progress = ProgressBar(len(link_loads), "Reporting Link Loads")
+            for (x, y, link), load in progress.over(sorted(
+                    link_loads.items(), key=lambda item: -item[1])):
+                f.write("Chip ({}, {}) link {} ({}): {}\n".format(
+                    x, y, link, _LINK_LABELS[link], load))
+    except IOError:
+        logger.error("Generate_link_load_report: Can't open file {} for "
+                     "writing.", file_name)
+
+
 def placer_reports_with_application_graph(
         report_folder, hostname, graph, graph_mapper, placements, machine):
     """ Reports that can be produced from placement given a application\
@@ -370,30 +396,25 @@ def placement_report_with_application_graph_by_core(
 
 
 def _write_one_chip_application_placement(f, chip, placements, graph_mapper):
-    written_header = False
-    for processor in chip.processors:
-        if placements.is_processor_occupied(
-                chip.x, chip.y, processor.processor_id):
-            if not written_header:
-                f.write("**** Chip: ({}, {})\n".format(chip.x, chip.y))
-                f.write("Application cores: {}\n".format(
-                    len(list(chip.processors))))
-                written_header = True
-            pro_id = processor.processor_id
-            vertex = placements.get_vertex_on_processor(
-                chip.x, chip.y, processor.processor_id)
-            app_vertex = graph_mapper.get_application_vertex(vertex)
-            vertex_label = app_vertex.label
-            vertex_model = app_vertex.__class__.__name__
-            vertex_atoms = app_vertex.n_atoms
-            lo_atom = graph_mapper.get_slice(vertex).lo_atom
-            hi_atom = graph_mapper.get_slice(vertex).hi_atom
-            num_atoms = hi_atom - lo_atom + 1
-            f.write("  Processor {}: Vertex: '{}', pop size: {}\n".format(
-                pro_id, vertex_label, vertex_atoms))
-            f.write("              Slice on this core: {}:{} ({} atoms)\n"
-                    .format(lo_atom, hi_atom, num_atoms))
-            f.write("              Model: {}\n\n".format(vertex_model))
+    chip_placements = placements.get_placements_on_chip(chip.x, chip.y)
+    if not chip_placements:
+        return
+    f.write("**** Chip: ({}, {})\n".format(chip.x, chip.y))
+    f.write("Application cores: {}\n".format(len(list(chip.processors))))
+    for placement in chip_placements:
+        vertex = placement.vertex
+        app_vertex = graph_mapper.get_application_vertex(vertex)
+        vertex_label = app_vertex.label
+        vertex_model = app_vertex.__class__.__name__
+        vertex_atoms = app_vertex.n_atoms
+        lo_atom = graph_mapper.get_slice(vertex).lo_atom
+        hi_atom = graph_mapper.get_slice(vertex).hi_atom
+        num_atoms = hi_atom - lo_atom + 1
+        f.write("  Processor {}: Vertex: '{}', pop size: {}\n".format(
+            placement.p, vertex_label, vertex_atoms))
+        f.write("              Slice on this core: {}:{} ({} atoms)\n"
+                .format(lo_atom, hi_atom, num_atoms))
+        f.write("              Model: {}\n\n".format(vertex_model))
 
 
 def placement_report_without_application_graph_by_core(
@@ -430,21 +451,18 @@ def placement_report_without_application_graph_by_core(
 
 
 def _write_one_chip_machine_placement(f, c, placements):
-    written_header = False
-    for pr in c.processors:
-        if placements.is_processor_occupied(c.x, c.y, pr.processor_id):
-            if not written_header:
-                f.write("**** Chip: ({}, {})\n".format(c.x, c.y))
-                f.write("Application cores: {}\n".format(
-                    len(list(c.processors))))
-                written_header = True
-            vertex = placements.get_vertex_on_processor(
-                c.x, c.y, pr.processor_id)
-            f.write("  Processor {}: Vertex: '{}' \n".format(
-                pr.processor_id, vertex.label))
-            f.write("              Model: {}\n\n".format(
-                vertex.__class__.__name__))
-            f.write("\n")
+    chip_placements = placements.get_placements_on_chip(c.x, c.y)
+    if not chip_placements:
+        return
+    f.write("**** Chip: ({}, {})\n".format(c.x, c.y))
+    f.write("Application cores: {}\n".format(len(list(c.processors))))
+    for placement in chip_placements:
+        vertex = placement.vertex
+        f.write("  Processor {}: Vertex: '{}' \n".format(
+            placement.p, vertex.label))
+        f.write("              Model: {}\n\n".format(
+            vertex.__class__.__name__))
+        f.write("\n")
 
 
 def sdram_usage_report_per_chip(report_folder, hostname, placements, machine):
@@ -478,20 +496,27 @@ def sdram_usage_report_per_chip(report_folder, hostname, placements, machine):
 
 
 def _write_sdram_by_core(f, placements, progress):
-    used_sdram = dict()
-    placements = sorted(placements.placements,
-                        key=lambda x: x.vertex.label)
-    for placement in progress.over(placements, False):
-        sdram = placement.vertex.resources_required.sdram.get_value()
-        x, y, p = placement.x, placement.y, placement.p
+    # Only the coordinates of the placements are needed, so work on them as
+    # arrays, which columnar placements hand over without making placements
+    vertices, xs, ys, ps = placements.to_arrays()
+    sdrams = numpy.array(
+        [vertex.resources_required.sdram.get_value() for vertex in vertices],
+        dtype="int64")
+    by_label = sorted(moves.range(len(vertices)),
+                      key=lambda index: vertices[index].label)
+    for index in progress.over(by_label, False):
+        p = None if ps[index] == NO_PROCESSOR else ps[index]
         f.write("SDRAM reqs for core ({},{},{}) is {} KB\n".format(
-            x, y, p, int(sdram / 1024.0)))
-        key = (x, y)
-        if key not in used_sdram:
-            used_sdram[key] = sdram
-        else:
-            used_sdram[key] += sdram
-    return used_sdram
+            xs[index], ys[index], p, int(sdrams[index] / 1024.0)))
+
+    # Add up the SDRAM of the placements on each chip
+    chips, chip_indices = numpy.unique(
+        (xs.astype("int64") << 16) | ys, return_inverse=True)
+    used_sdram = numpy.zeros(len(chips), dtype="int64")
+    numpy.add.at(used_sdram, chip_indices, sdrams)
+    return dict(
+        ((int(chip >> 16), int(chip & _LOWER_16_BITS)), int(sdram))
+        for chip, sdram in zip(chips, used_sdram))
 
 
 def _write_chip_sdram(f, chip, used_sdram_by_chip):
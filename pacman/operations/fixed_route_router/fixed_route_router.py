@@ -6,6 +6,7 @@ from spinn_machine import Router
 from spinn_machine.fixed_route_entry import FixedRouteEntry
 from pacman.exceptions import \
     PacmanAlreadyExistsException, PacmanConfigurationException
+from pacman.utilities.utility_objs import MachineTopology
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_machine.virtual_machine import VirtualMachine
 from spinn_machine.machine import Machine
@@ -131,6 +132,7 @@ class FixedRouteRouter(object):
         # build fake setup for the routing
         eth_x = ethernet_connected_chip.x
         eth_y = ethernet_connected_chip.y
+        topology = MachineTopology.of(machine)
         down_links = set()
         for (chip_x, chip_y) in machine.get_chips_on_board(
                 ethernet_connected_chip):
@@ -156,7 +158,7 @@ class FixedRouteRouter(object):
             down_links.update({
                 (rel_x, rel_y, link) for link in range(
                     Router.MAX_LINKS_PER_ROUTER)
-                if not machine.is_link_at(chip_x, chip_y, link)})
+                if not topology.is_link_at(chip_x, chip_y, link)})
 
         # Create a fake machine consisting of only the one board that
         # the routes should go over
@@ -289,16 +291,12 @@ class FixedRouteRouter(object):
         :return: processor ID as a int, or None if no valid processor found
         :rtype: int or None
         """
-        for processor_id in range(0, Machine.MAX_CORES_PER_CHIP):
-            # only check occupied processors
-            if placements.is_processor_occupied(
-                    ethernet_chip_x, ethernet_chip_y, processor_id):
-                # verify if vertex correct one
-                if isinstance(
-                        placements.get_vertex_on_processor(
-                            ethernet_chip_x, ethernet_chip_y, processor_id),
-                        destination_class):
-                    return processor_id
+        # only check occupied processors, in order
+        for placement in placements.get_placements_on_chip(
+                ethernet_chip_x, ethernet_chip_y):
+            # verify if vertex correct one
+            if isinstance(placement.vertex, destination_class):
+                return placement.p
         raise PacmanConfigurationException(
             "no destination vertex found on Ethernet chip {}:{}".format(
                 ethernet_chip_x, ethernet_chip_y))
@@ -325,6 +323,7 @@ class FixedRouteRouter(object):
             return False
 
         # figure correct links
+        topology = MachineTopology.of(machine)
         joins, _ = self._get_joins_paths(board_version)
         for ethernet_chip in machine.ethernet_connected_chips:
             ethernet_chip_x = ethernet_chip.x
@@ -333,13 +332,13 @@ class FixedRouteRouter(object):
                 join_chip_x = chip_x - ethernet_chip_x
                 join_chip_y = chip_y - ethernet_chip_y
                 if (join_chip_x, join_chip_y) in joins:
-                    if not machine.is_link_at(
+                    if not topology.is_link_at(
                             chip_x, chip_y, joins[join_chip_x, join_chip_y]):
                         return False
                 elif (
                         join_chip_x != self.FAKE_ETHERNET_CHIP_X or
                         join_chip_y != self.FAKE_ETHERNET_CHIP_Y):
-                    if not machine.is_link_at(
+                    if not topology.is_link_at(
                             chip_x, chip_y, self.DEFAULT_LINK_ID):
                         return False
         return True
@@ -0,0 +1,4 @@
+from pacman.operations.incremental_mapping.incremental_mapper \
+    import IncrementalMapper
+
+__all__ = ['IncrementalMapper']
@@ -0,0 +1,406 @@
+import logging
+
+from spinn_utilities.log import FormatAdapter
+from spinn_utilities.ordered_set import OrderedSet
+
+from pacman.exceptions import PacmanElementAllocationException, \
+    PacmanRouteInfoAllocationException, PacmanValueError
+from pacman.model.constraints.key_allocator_constraints import \
+    AbstractKeyAllocatorConstraint, ContiguousKeyRangeContraint
+from pacman.model.constraints.placer_constraints import \
+    AbstractPlacerConstraint, ChipAndCoreConstraint
+from pacman.model.graphs.common import EdgeTrafficType, GraphChangeType
+from pacman.model.graphs.machine import MachineGraph
+from pacman.model.placements import Placement
+from pacman.model.routing_info import PartitionRoutingInfo
+from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.operations.placer_algorithms import RadialPlacer
+from pacman.operations.router_algorithms import BasicDijkstraRouting
+from pacman.operations.routing_info_allocator_algorithms import \
+    BasicRoutingInfoAllocator, MallocBasedRoutingInfoAllocator
+from pacman.operations.routing_table_generators.\
+    basic_routing_table_generator import BasicRoutingTableGenerator
+from pacman.utilities.utility_objs import ResourceTracker
+
+logger = FormatAdapter(logging.getLogger(__name__))
+
+
+class IncrementalMapper(object):
+    """ Updates the placements, routes, keys and routing tables of a machine\
+        graph after a few changes to it, recomputing only what the changes\
+        affect, or maps the graph again in full if the changes are too many\
+        or of a kind that cannot be handled incrementally.
+
+    The changes are those recorded in the journal of the machine graph\
+    since the previous mapping (see\
+    :py:meth:`pacman.model.graphs.impl.Graph.start_journal`).  Vertices\
+    that are already placed are not moved: removed vertices free their\
+    cores, and added vertices are placed on free cores.  The outgoing edge\
+    partitions that are added, removed or have edges added or removed are\
+    routed again, without regard to the routes of the others, and keep\
+    their keys if they still have enough, or are given keys not used by any\
+    other partition.  The routing tables of the chips whose entries change\
+    are made again.
+
+    A full run uses the placer, router and key allocator given; it is done\
+    if the changes touch more than the given fraction of the vertices and\
+    partitions, if an added vertex has tags or placement constraints other\
+    than a chip and core, if a changed partition has key constraints other\
+    than a contiguous range, or if the incremental placement or key\
+    allocation fails.  Changes to the application graph need the graph to\
+    be partitioned again, and so a full run.
+    """
+
+    __slots__ = [
+        # Function taking the machine graph and machine that places the
+        # graph
+        "_placer",
+
+        # Function taking the placements, machine and machine graph that
+        # routes the graph
+        "_router",
+
+        # Function taking the machine graph, placements and n keys map that
+        # allocates the keys of the graph
+        "_key_allocator",
+
+        # The largest fraction of vertices and partitions that can change
+        # for the mapping to be updated incrementally
+        "_max_changed_fraction"
+    ]
+
+    MAX_CHANGED_FRACTION = 0.1
+
+    def __init__(self, placer=None, router=None, key_allocator=None,
+                 max_changed_fraction=MAX_CHANGED_FRACTION):
+        """
+        :param placer: The placer for a full run, called with the machine\
+            graph and machine; by default a\
+            :py:class:`pacman.operations.placer_algorithms.RadialPlacer`
+        :type placer: callable
+        :param router: The router, called with the placements, machine and\
+            machine graph; by default a\
+            :py:class:`pacman.operations.router_algorithms.BasicDijkstraRouting`
+        :type router: callable
+        :param key_allocator: The key allocator for a full run, called with\
+            the machine graph, placements and n keys map; by default a\
+            :py:class:`pacman.operations.routing_info_allocator_algorithms.BasicRoutingInfoAllocator`
+        :type key_allocator: callable
+        :param max_changed_fraction: The largest fraction of the vertices\
+            and partitions of the graph that can change for the mapping to\
+            be updated incrementally
+        :type max_changed_fraction: float
+        """
+        self._placer = placer if placer is not None else RadialPlacer()
+        self._router = (
+            router if router is not None else BasicDijkstraRouting())
+        self._key_allocator = (
+            key_allocator if key_allocator is not None
+            else BasicRoutingInfoAllocator())
+        self._max_changed_fraction = max_changed_fraction
+
+    def __call__(
+            self, machine_graph, machine, changes, n_keys_map, placements,
+            routing_table_by_partition, routing_infos, routing_tables):
+        """
+        :param machine_graph: The machine graph, with the changes made
+        :type machine_graph:\
+            :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :param machine: The machine the graph was mapped to
+        :type machine: :py:class:`spinn_machine.Machine`
+        :param changes: The changes made to the graph since it was mapped
+        :type changes:\
+            iterable(:py:class:`pacman.model.graphs.common.GraphChange`)
+        :param n_keys_map: The number of keys of each partition of the graph
+        :type n_keys_map:\
+            :py:class:`pacman.model.routing_info.AbstractMachinePartitionNKeysMap`
+        :param placements: The placements of the graph before the changes,\
+            which are updated
+        :type placements: :py:class:`pacman.model.placements.Placements`
+        :param routing_table_by_partition: The routes of the graph before\
+            the changes, which are updated
+        :type routing_table_by_partition:\
+            :py:class:`pacman.model.routing_table_by_partition.MulticastRoutingTableByPartition`
+        :param routing_infos: The keys of the graph before the changes,\
+            which are updated
+        :type routing_infos:\
+            :py:class:`pacman.model.routing_info.RoutingInfo`
+        :param routing_tables: The routing tables of the graph before the\
+            changes
+        :type routing_tables:\
+            :py:class:`pacman.model.routing_tables.MulticastRoutingTables`
+        :return: The placements, routes, keys and routing tables of the\
+            graph, and whether they were updated incrementally rather than\
+            by a full run
+        :rtype: tuple(\
+            :py:class:`pacman.model.placements.Placements`,\
+            :py:class:`pacman.model.routing_table_by_partition.MulticastRoutingTableByPartition`,\
+            :py:class:`pacman.model.routing_info.RoutingInfo`,\
+            :py:class:`pacman.model.routing_tables.MulticastRoutingTables`,\
+            bool)
+        """
+        added_vertices, removed_vertices, changed_partitions, \
+            removed_partitions = self._summarise(machine_graph, changes)
+
+        n_changed = (len(added_vertices) + len(removed_vertices) +
+                     len(changed_partitions) + len(removed_partitions))
+        n_items = max(1, machine_graph.n_vertices +
+                      machine_graph.n_outgoing_edge_partitions)
+        if (n_changed > self._max_changed_fraction * n_items or
+                not self._can_place(added_vertices) or
+                not self._can_allocate_keys(changed_partitions)):
+            return self._full_run(machine_graph, machine, n_keys_map)
+
+        try:
+            self._place(
+                machine, added_vertices, removed_vertices, placements)
+        except PacmanValueError:
+            logger.info("Added vertices do not fit; mapping again in full")
+            return self._full_run(machine_graph, machine, n_keys_map)
+
+        # Routes and keys are made again for changed partitions
+        old_partitions = list(removed_partitions) + list(changed_partitions)
+        routers = set(routing_table_by_partition.remove_partitions(
+            old_partitions))
+        old_infos = dict()
+        for partition in old_partitions:
+            old_infos[partition] = routing_infos.remove_partition_info(
+                partition)
+        try:
+            self._allocate_keys(
+                changed_partitions, n_keys_map, routing_infos, old_infos)
+        except (PacmanElementAllocationException,
+                PacmanRouteInfoAllocationException):
+            logger.info("Keys could not be allocated; mapping again in full")
+            return self._full_run(machine_graph, machine, n_keys_map)
+        routers.update(self._route(
+            machine, changed_partitions, placements,
+            routing_table_by_partition))
+
+        routing_tables = self._update_tables(
+            machine, routers, routing_table_by_partition, routing_infos,
+            routing_tables)
+        return (placements, routing_table_by_partition, routing_infos,
+                routing_tables, True)
+
+    @staticmethod
+    def _summarise(machine_graph, changes):
+        """ Work out the net effect of the changes
+
+        :return: The vertices added and removed, the partitions in the graph\
+            that were added or had edges added or removed, and the\
+            partitions removed
+        :rtype: tuple(OrderedSet, OrderedSet, OrderedSet, OrderedSet)
+        """
+        added_vertices = OrderedSet()
+        removed_vertices = OrderedSet()
+        changed_partition_names = OrderedSet()
+        removed_partitions = OrderedSet()
+        for change in changes:
+            change_type = change.change_type
+            if change_type == GraphChangeType.ADD_VERTEX:
+                added_vertices.add(change.item)
+            elif change_type == GraphChangeType.REMOVE_VERTEX:
+                if change.item in added_vertices:
+                    added_vertices.discard(change.item)
+                else:
+                    removed_vertices.add(change.item)
+            elif change_type == GraphChangeType.ADD_EDGE_BLOCK:
+                for pre_vertex in change.item.pre_vertices:
+                    changed_partition_names.add(
+                        (pre_vertex, change.partition_name))
+            elif change_type == GraphChangeType.REMOVE_PARTITION:
+                removed_partitions.add(change.item)
+            elif change.item.pre_vertex is not None:
+                # Edges, and partitions added with their edges
+                changed_partition_names.add(
+                    (change.item.pre_vertex, change.partition_name))
+
+        changed_partitions = OrderedSet()
+        for pre_vertex, partition_name in changed_partition_names:
+            partition = machine_graph.\
+                get_outgoing_edge_partition_starting_at_vertex(
+                    pre_vertex, partition_name)
+            if partition is not None:
+                changed_partitions.add(partition)
+                removed_partitions.discard(partition)
+        return (added_vertices, removed_vertices, changed_partitions,
+                removed_partitions)
+
+    @staticmethod
+    def _can_place(added_vertices):
+        """ Determine if the added vertices can be placed incrementally
+        """
+        for vertex in added_vertices:
+            resources = vertex.resources_required
+            if resources.iptags or resources.reverse_iptags:
+                return False
+            for constraint in vertex.constraints:
+                if (isinstance(constraint, AbstractPlacerConstraint) and
+                        not isinstance(constraint, ChipAndCoreConstraint)):
+                    return False
+        return True
+
+    @staticmethod
+    def _can_allocate_keys(changed_partitions):
+        """ Determine if the changed partitions can be given keys\
+            incrementally
+        """
+        for partition in changed_partitions:
+            for constraint in partition.constraints:
+                if (isinstance(constraint, AbstractKeyAllocatorConstraint) and
+                        not isinstance(
+                            constraint, ContiguousKeyRangeContraint)):
+                    return False
+        return True
+
+    def _full_run(self, machine_graph, machine, n_keys_map):
+        """ Map the graph again in full
+        """
+        placements = self._placer(machine_graph, machine)
+        routing_table_by_partition = self._router(
+            placements, machine, machine_graph)
+        routing_infos = self._key_allocator(
+            machine_graph, placements, n_keys_map)
+        routing_tables = BasicRoutingTableGenerator()(
+            routing_infos, routing_table_by_partition, machine)
+        return (placements, routing_table_by_partition, routing_infos,
+                routing_tables, False)
+
+    @staticmethod
+    def _place(machine, added_vertices, removed_vertices, placements):
+        """ Remove the placements of removed vertices and place the added\
+            vertices on free cores
+
+        :raise PacmanValueError: If an added vertex does not fit
+        """
+        for vertex in removed_vertices:
+            placements.remove_placement(vertex)
+
+        # Track the resources used by the vertices that stay where they are
+        resource_tracker = ResourceTracker(machine)
+        for placement in placements.placements:
+            resource_tracker.allocate_resources(
+                placement.vertex.resources_required,
+                [(placement.x, placement.y)], placement.p)
+
+        for vertex in added_vertices:
+            (x, y, p, _, _) = resource_tracker.allocate_constrained_resources(
+                vertex.resources_required, vertex.constraints)
+            placements.add_placement(Placement(vertex, x, y, p))
+
+    @staticmethod
+    def _allocate_keys(
+            changed_partitions, n_keys_map, routing_infos, old_infos):
+        """ Give the changed partitions their old keys if they still have\
+            enough, or else keys not used by any other partition
+        """
+        to_allocate = list()
+        for partition in changed_partitions:
+            if partition.traffic_type != EdgeTrafficType.MULTICAST:
+                continue
+            n_keys = n_keys_map.n_keys_for_partition(partition)
+            old_info = old_infos.get(partition)
+            if old_info is not None and n_keys <= sum(
+                    key_and_mask.n_keys
+                    for key_and_mask in old_info.keys_and_masks):
+                routing_infos.add_partition_info(PartitionRoutingInfo(
+                    old_info.keys_and_masks, partition))
+            else:
+                to_allocate.append((partition, n_keys))
+        if not to_allocate:
+            return
+
+        key_space = _KeySpace(
+            key_and_mask
+            for partition_info in routing_infos
+            for key_and_mask in partition_info.keys_and_masks)
+        for partition, n_keys in to_allocate:
+            routing_infos.add_partition_info(PartitionRoutingInfo(
+                key_space.allocate(n_keys), partition))
+
+    def _route(
+            self, machine, changed_partitions, placements,
+            routing_table_by_partition):
+        """ Route the changed partitions, adding their routes to the others
+
+        :return: The coordinates of the routers with new entries
+        :rtype: set(tuple(int, int))
+        """
+        partitions = [
+            partition for partition in changed_partitions
+            if partition.traffic_type == EdgeTrafficType.MULTICAST and
+            partition.n_edges]
+        if not partitions:
+            return set()
+
+        # Route a graph of only the changed partitions; the partitions are
+        # shared with the whole graph so that the routes are for them
+        sub_graph = MachineGraph("Changed partitions")
+        for partition in partitions:
+            sub_graph.add_vertex(partition.pre_vertex)
+            sub_graph.add_vertices(
+                edge.post_vertex for edge in partition.edges)
+            sub_graph.add_outgoing_edge_partition(partition)
+            sub_graph.add_edges(partition.edges, partition.identifier)
+        routes = self._router(placements, machine, sub_graph)
+
+        routers = set()
+        for x, y in routes.get_routers():
+            routers.add((x, y))
+            for partition, entry in routes.get_entries_for_router(
+                    x, y).items():
+                routing_table_by_partition.add_path_entry(
+                    entry, x, y, partition)
+        return routers
+
+    @staticmethod
+    def _update_tables(
+            machine, routers, routing_table_by_partition, routing_infos,
+            routing_tables):
+        """ Make the tables of the given routers again, keeping the others
+        """
+        generator = BasicRoutingTableGenerator()
+        tables = [
+            table for table in routing_tables
+            if (table.x, table.y) not in routers]
+        for x, y in routers:
+            entries = routing_table_by_partition.get_entries_for_router(x, y)
+            if entries:
+                tables.append(generator.create_routing_table(
+                    machine.get_chip_at(x, y), entries, routing_infos))
+        return MulticastRoutingTables(tables)
+
+
+class _KeySpace(MallocBasedRoutingInfoAllocator):
+    """ The keys not used by a set of keys and masks, from which keys can be\
+        allocated
+    """
+
+    __slots__ = []
+
+    def __init__(self, keys_and_masks):
+        """
+        :param keys_and_masks: The keys and masks in use
+        :type keys_and_masks:\
+            iterable(:py:class:`pacman.model.routing_info.BaseKeyAndMask`)
+        :raise PacmanElementAllocationException:\
+            If the keys and masks overlap other than by being the same
+        """
+        super(_KeySpace, self).__init__()
+
+        # Allocating in order of key keeps the free spaces cheap to split
+        for key_and_mask in sorted(
+                set(keys_and_masks), key=lambda k: (k.key, k.mask)):
+            self._allocate_fixed_keys_and_masks([key_and_mask], None)
+
+    def allocate(self, n_keys):
+        """ Allocate keys not yet used
+
+        :param n_keys: The number of keys to allocate
+        :type n_keys: int
+        :rtype: list(:py:class:`pacman.model.routing_info.BaseKeyAndMask`)
+        :raise PacmanRouteInfoAllocationException:\
+            If there is no space for the keys
+        """
+        return self._allocate_keys_and_masks(None, None, n_keys)
@@ -0,0 +1,4 @@
+from pacman.operations.machine_graph_freezer.machine_graph_freezer \
+    import MachineGraphFreezer
+
+__all__ = ['MachineGraphFreezer']
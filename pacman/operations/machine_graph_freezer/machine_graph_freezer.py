@@ -0,0 +1,22 @@
+class MachineGraphFreezer(object):
+    """ Freezes the partitioned machine graph, so that the stages that only\
+        read the graph use the more compact frozen graph.
+
+    The frozen graph takes the place of the machine graph, so this must run\
+    after any algorithm that adds to the machine graph.  The placers,\
+    routers and routing key allocators that can read a frozen graph wait\
+    for the FrozenMachineGraph token if this algorithm is used.
+    """
+
+    __slots__ = []
+
+    def __call__(self, machine_graph):
+        """
+        :param machine_graph: The machine graph to freeze
+        :type machine_graph:\
+            :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :return: The frozen graph
+        :rtype:\
+            :py:class:`pacman.model.graphs.machine.FrozenMachineGraph`
+        """
+        return machine_graph.freeze()
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from pacman.exceptions import PacmanPartitionException
 from pacman.model.constraints.partitioner_constraints \
@@ -7,22 +8,38 @@ from pacman.model.constraints.partitioner_constraints \
 from pacman.model.graphs.common import GraphMapper, Slice
 from pacman.model.graphs.machine import MachineGraph
 from pacman.utilities import utility_calls
+from pacman.utilities.utility_calls import forked_map
 from pacman.utilities.algorithm_utilities \
     import partition_algorithm_utilities as utils
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import ResourceTracker, \
+    ResourceModelCache
 
 from spinn_utilities.progress_bar import ProgressBar
 
+from six.moves import zip
+
 logger = logging.getLogger(__name__)
 
 
 class BasicPartitioner(object):
     """ An basic algorithm that can partition an application graph based\
         on the number of atoms in the vertices.
+
+    The slices of the vertices, and the resources they use, can be worked\
+    out in a number of forked processes, each taking groups of vertices that\
+    must be partitioned the same size.  The machine graph is then built in\
+    the order of the vertices in this process; a vertex is sliced again here\
+    if the resources allocated to the vertices before it change the number\
+    of atoms that fit on a core, so the result is the same as partitioning\
+    in one process.
     """
 
     __slots__ = []
 
+    # The number of chunks of vertex groups per process when slicing in
+    # parallel
+    CHUNKS_PER_PROCESS = 4
+
     @staticmethod
     def _get_ratio(top, bottom):
         if bottom == 0:
@@ -30,7 +47,8 @@ class BasicPartitioner(object):
         return top / bottom
 
     # inherited from AbstractPartitionAlgorithm
-    def __call__(self, graph, machine):
+    def __call__(self, graph, machine, resource_model_cache=None,
+                 n_processes=1, use_edge_blocks=False):
         """
         :param graph: The application_graph to partition
         :type graph:\
@@ -39,6 +57,18 @@ class BasicPartitioner(object):
             The machine with respect to which to partition the application\
             graph
         :type machine: :py:class:`spinn_machine.Machine`
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices to use, or None to ask the vertices each time;\
+            when slicing in parallel, the slices remembered in the other\
+            processes are lost, but their hits and misses are counted
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
+        :param n_processes: the number of processes to slice the vertices in
+        :type n_processes: int
+        :param use_edge_blocks: Whether to add the machine edges of each\
+            application edge as a block, making each only when it is first\
+            asked for
+        :type use_edge_blocks: bool
         :return: A machine graph
         :rtype:\
             :py:class:`pacman.model.graphs.machine.MachineGraph`
@@ -57,41 +87,187 @@ class BasicPartitioner(object):
         machine_graph = MachineGraph("Machine graph for " + graph.label)
         graph_mapper = GraphMapper()
         resource_tracker = ResourceTracker(machine)
+        if resource_model_cache is None:
+            resource_model_cache = ResourceModelCache(max_size=0)
+
+        vertices = list(graph.vertices)
+        if n_processes > 1:
+            slicings = self._slice_in_parallel(
+                vertices, resource_tracker, resource_model_cache,
+                n_processes)
+        else:
+            slicings = [None] * len(vertices)
 
         # Partition one vertex at a time
-        for vertex in progress.over(graph.vertices):
+        for vertex, slicing in progress.over(zip(vertices, slicings)):
             self._partition_one_application_vertex(
-                vertex, resource_tracker, machine_graph, graph_mapper)
+                vertex, resource_tracker, machine_graph, graph_mapper,
+                resource_model_cache, slicing)
 
-        utils.generate_machine_edges(machine_graph, graph_mapper, graph)
+        utils.generate_machine_edges(
+            machine_graph, graph_mapper, graph, use_edge_blocks)
 
         return machine_graph, graph_mapper, resource_tracker.chips_used
 
-    def _partition_one_application_vertex(
-            self, vertex, res_tracker, m_graph, mapper):
-        """ Partitions a single application vertex.
+    def _slice_in_parallel(
+            self, vertices, res_tracker, resource_model_cache, n_processes):
+        """ Work out the slices of the vertices, and the resources that they\
+            use, in a number of forked processes, against the resources\
+            available before any of the vertices are partitioned
+
+        :param vertices: the vertices to slice
+        :type vertices:\
+            list(:py:class:`pacman.model.graphs.application.ApplicationVertex`)
+        :param res_tracker: the tracker of resources
+        :type res_tracker:\
+            :py:class:`pacman.utilities.utility_objs.ResourceTracker`
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
+        :param n_processes: the number of processes to use
+        :type n_processes: int
+        :return: for each vertex, the slicing found by _slice_vertex, or None\
+            if the vertex could not be sliced
+        :rtype: list(tuple or None)
         """
+        # Each group is given by the indices of its vertices, as the vertices
+        # themselves would be copied going to other processes
+        indices = dict(
+            (vertex, index) for index, vertex in enumerate(vertices))
+        same_size_groups = utils.get_same_size_vertex_groups(vertices)
+        groups = list()
+        grouped = set()
+        for vertex in vertices:
+            if vertex not in grouped:
+                group = same_size_groups[vertex]
+                grouped.update(group)
+                groups.append(sorted(indices[other] for other in group))
+
+        chunk_size = max(1, -(-len(groups) // (
+            n_processes * self.CHUNKS_PER_PROCESS)))
+        chunks = [(start, min(start + chunk_size, len(groups)))
+                  for start in range(0, len(groups), chunk_size)]
+
+        def slice_chunk(chunk):
+            start, end = chunk
+            hits = resource_model_cache.hits
+            misses = resource_model_cache.misses
+            slicings = list()
+            for group in groups[start:end]:
+                for index in group:
+                    try:
+                        requirements, atoms_per_core, slices = \
+                            self._slice_vertex(
+                                vertices[index], res_tracker,
+                                resource_model_cache)
+                    except PacmanPartitionException:
+                        # Left to be sliced again, to raise the exception
+                        continue
+
+                    # Slices do not unpickle, so are sent as their atoms
+                    slicings.append((index, requirements, atoms_per_core, [
+                        (vertex_slice.lo_atom, vertex_slice.hi_atom,
+                         resources)
+                        for vertex_slice, resources in slices]))
+
+            # The counts of the memo of another process are sent back too
+            return (os.getpid(), resource_model_cache.hits - hits,
+                    resource_model_cache.misses - misses, slicings)
+
+        slicings = [None] * len(vertices)
+        for pid, hits, misses, chunk_slicings in forked_map(
+                slice_chunk, chunks, n_processes):
+            if pid != os.getpid():
+                resource_model_cache.add_counts(hits, misses)
+            for index, requirements, atoms_per_core, slices in \
+                    chunk_slicings:
+                slicings[index] = (requirements, atoms_per_core, [
+                    (Slice(lo_atom, hi_atom), resources)
+                    for lo_atom, hi_atom, resources in slices])
+        return slicings
+
+    def _slice_vertex(
+            self, vertex, res_tracker, resource_model_cache,
+            requirements=None):
+        """ Work out the slices of a vertex, and the resources that they use
+
+        :param vertex: the vertex to slice
+        :type vertex:\
+            :py:class:`pacman.model.graphs.application.ApplicationVertex`
+        :param res_tracker: the tracker of resources
+        :type res_tracker:\
+            :py:class:`pacman.utilities.utility_objs.ResourceTracker`
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
+        :param requirements: the resources used by the first atom of the\
+            vertex, if already known
+        :type requirements:\
+            :py:class:`pacman.model.resources.ResourceContainer`
+        :return: the resources used by the first atom, the number of atoms\
+            per core, and the slices with the resources they use
+        :rtype: tuple(\
+            :py:class:`pacman.model.resources.ResourceContainer`, float,\
+            list(tuple(:py:class:`pacman.model.graphs.common.Slice`,\
+            :py:class:`pacman.model.resources.ResourceContainer`)))
+        :raise PacmanPartitionException:\
+            if not even one atom will fit on a core
+        """
+        if requirements is None:
+            requirements = resource_model_cache.get_resources_used_by_atoms(
+                vertex, Slice(0, 1))
+
         # Compute how many atoms of this vertex we can put on one core
-        atoms_per_core = self._compute_atoms_per_core(vertex, res_tracker)
+        atoms_per_core = self._compute_atoms_per_core(
+            vertex, res_tracker, requirements)
         if atoms_per_core < 1.0:
             raise PacmanPartitionException(
                 "Not enough resources available to create vertex")
 
         # Partition into vertices
+        slices = list()
         for first in range(0, vertex.n_atoms, int(atoms_per_core)):
             # Determine vertex size
             last = min(first + atoms_per_core, vertex.n_atoms) - 1
             if first < 0 or last < 0:
                 raise PacmanPartitionException(
                     "Not enough resources available to create vertex")
-
-            # Create and store new vertex, and increment elements first
             vertex_slice = Slice(first, last)
-            resources = vertex.get_resources_used_by_atoms(vertex_slice)
+            slices.append((
+                vertex_slice,
+                resource_model_cache.get_resources_used_by_atoms(
+                    vertex, vertex_slice)))
+        return requirements, atoms_per_core, slices
 
+    def _partition_one_application_vertex(
+            self, vertex, res_tracker, m_graph, mapper, resource_model_cache,
+            slicing=None):
+        """ Partitions a single application vertex.
+
+        :param slicing: the slicing of the vertex found against the\
+            resources available before any vertex was partitioned, or None\
+            if not known
+        """
+        if slicing is None:
+            _, _, slices = self._slice_vertex(
+                vertex, res_tracker, resource_model_cache)
+        else:
+            # The slicing can be used if the atoms per core are the same
+            # with the resources now available
+            requirements, atoms_per_core, slices = slicing
+            if atoms_per_core != self._compute_atoms_per_core(
+                    vertex, res_tracker, requirements):
+                _, _, slices = self._slice_vertex(
+                    vertex, res_tracker, resource_model_cache, requirements)
+
+        # Create and store new vertices
+        for vertex_slice, resources in slices:
             m_vertex = vertex.create_machine_vertex(
                 vertex_slice, resources,
-                "{}:{}:{}".format(vertex.label, first, last),
+                "{}:{}:{}".format(
+                    vertex.label, vertex_slice.lo_atom, vertex_slice.hi_atom),
                 utils.get_remaining_constraints(vertex))
             m_graph.add_vertex(m_vertex)
             mapper.add_vertex_mapping(m_vertex, vertex_slice, vertex)
@@ -100,17 +276,15 @@ class BasicPartitioner(object):
             res_tracker.allocate_constrained_resources(
                 resources, vertex.constraints)
 
-    def _compute_atoms_per_core(self, vertex, res_tracker):
+    def _compute_atoms_per_core(self, vertex, res_tracker, requirements):
         """ Work out how many atoms per core are required for the given\
             vertex. Assumes that the first atom of the vertex is fully\
             representative.
 
+        :param requirements: the resources used by the first atom, which\
+            are assumed to be the resources used by each of the atoms
         :rtype: float
         """
-        # Get the usage of the first atom, then assume that this will be the
-        # usage of all the atoms.
-        requirements = vertex.get_resources_used_by_atoms(Slice(0, 1))
-
         # Locate the maximum resources available
         limits = res_tracker.get_maximum_constrained_resources_available(
             requirements, vertex.constraints)
@@ -16,7 +16,8 @@ from pacman.utilities.algorithm_utilities \
     import partition_algorithm_utilities as partition_utils
 from pacman.utilities.algorithm_utilities \
     import placer_algorithm_utilities as placer_utils
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import ResourceTracker, \
+    ResourceModelCache
 
 from spinn_utilities.progress_bar import ProgressBar
 
@@ -31,7 +32,8 @@ class PartitionAndPlacePartitioner(object):
     __slots__ = []
 
     # inherited from AbstractPartitionAlgorithm
-    def __call__(self, graph, machine, preallocated_resources=None):
+    def __call__(self, graph, machine, preallocated_resources=None,
+                 resource_model_cache=None, use_edge_blocks=False):
         """
         :param graph: The application_graph to partition
         :type graph:\
@@ -39,6 +41,18 @@ class PartitionAndPlacePartitioner(object):
         :param machine: The machine with respect to which to partition the\
             application_graph
         :type machine: :py:class:`spinn_machine.Machine`
+        :param preallocated_resources: resources already allocated on the\
+            machine, which are not to be used by the vertices
+        :type preallocated_resources:\
+            :py:class:`pacman.model.resources.PreAllocatedResourceContainer`
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices to use, or None to ask the vertices each time
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
+        :param use_edge_blocks: Whether to add the machine edges of each\
+            application edge as a block, making each only when it is first\
+            asked for
+        :type use_edge_blocks: bool
         :return: \
             A machine_graph of partitioned vertices and partitioned edges
         :rtype:\
@@ -71,6 +85,8 @@ class PartitionAndPlacePartitioner(object):
 
         resource_tracker = ResourceTracker(
             machine, preallocated_resources=preallocated_resources)
+        if resource_model_cache is None:
+            resource_model_cache = ResourceModelCache(max_size=0)
 
         # Group vertices that are supposed to be the same size
         vertex_groups = partition_utils.get_same_size_vertex_groups(vertices)
@@ -85,17 +101,17 @@ class PartitionAndPlacePartitioner(object):
             if machine_vertices is None:
                 self._partition_vertex(
                     vertex, machine_graph, graph_mapper, resource_tracker,
-                    progress, vertex_groups)
+                    progress, vertex_groups, resource_model_cache)
         progress.end()
 
         partition_utils.generate_machine_edges(
-            machine_graph, graph_mapper, graph)
+            machine_graph, graph_mapper, graph, use_edge_blocks)
 
         return machine_graph, graph_mapper, resource_tracker.chips_used
 
     def _partition_vertex(
             self, vertex, machine_graph, graph_mapper, resource_tracker,
-            progress, vertex_groups):
+            progress, vertex_groups, resource_model_cache):
         """ Partition a single vertex
 
         :param vertex: the vertex to partition
@@ -113,6 +129,10 @@ class PartitionAndPlacePartitioner(object):
         :param progress: The progress bar
         :param vertex_groups: Groups together vertices that are supposed to\
             be the same size
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
         :rtype: None
         :raise pacman.exceptions.PacmanPartitionException: \
             if the extra vertex for partitioning identically has a different\
@@ -157,11 +177,12 @@ class PartitionAndPlacePartitioner(object):
         self._partition_by_atoms(
             partition_together_vertices, vertex.n_atoms, max_atoms_per_core,
             machine_graph, graph_mapper, resource_tracker, progress,
-            n_atoms is not None)
+            resource_model_cache, n_atoms is not None)
 
     def _partition_by_atoms(
             self, vertices, n_atoms, max_atoms_per_core, machine_graph,
-            graph_mapper, resource_tracker, progress, fixed_n_atoms=False):
+            graph_mapper, resource_tracker, progress, resource_model_cache,
+            fixed_n_atoms=False):
         """ Try to partition vertices on how many atoms it can fit on\
             each vertex
 
@@ -185,6 +206,10 @@ class PartitionAndPlacePartitioner(object):
         :type resource_tracker:\
             :py:class:`pacman.utilities.ResourceTracker`
         :param progress: The progress bar
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
         :param fixed_n_atoms:\
             True if max_atoms_per_core is actually the fixed number of atoms\
             per core and cannot be reduced
@@ -200,7 +225,7 @@ class PartitionAndPlacePartitioner(object):
             # Scale down the number of atoms to fit the available resources
             used_placements, hi_atom = self._scale_down_resources(
                 lo_atom, hi_atom, vertices, resource_tracker,
-                max_atoms_per_core, fixed_n_atoms)
+                max_atoms_per_core, resource_model_cache, fixed_n_atoms)
 
             # Update where we are
             n_atoms_placed = hi_atom + 1
@@ -223,7 +248,8 @@ class PartitionAndPlacePartitioner(object):
 
     @staticmethod
     def _reallocate_resources(
-            used_placements, resource_tracker, lo_atom, hi_atom):
+            used_placements, resource_tracker, savepoint, lo_atom, hi_atom,
+            resource_model_cache):
         """ Readjusts resource allocation and updates the placement list to\
             take into account the new layout of the atoms
 
@@ -233,27 +259,34 @@ class PartitionAndPlacePartitioner(object):
         :param resource_tracker: the tracker of resources
         :type resource_tracker:\
             :py:class:`pacman.utilities.ResourceTracker`
+        :param savepoint: \
+            the savepoint of the tracker taken before the original placements\
+            were allocated
+        :type savepoint: int
         :param lo_atom: the low atom of a slice to be considered
         :type lo_atom: int
         :param hi_atom: the high atom of a slice to be considered
         :type hi_atom: int
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
         :return: the new list of tuples containing placement data
         :rtype: iterable(tuple(7 items))
         """
 
-        new_used_placements = list()
-        for (placed_vertex, x, y, p, placed_resources,
-                ip_tags, reverse_ip_tags) in used_placements:
+        # Deallocate the existing resources, leaving the tracker as it was
+        # before they were allocated
+        resource_tracker.rollback(savepoint)
 
-            if not isinstance(placed_vertex, AbstractVirtualVertex):
-                # Deallocate the existing resources
-                resource_tracker.unallocate_resources(
-                    x, y, p, placed_resources, ip_tags, reverse_ip_tags)
+        new_used_placements = list()
+        for (placed_vertex, x, y, p, _, ip_tags, reverse_ip_tags) in \
+                used_placements:
 
             # Get the new resource usage
             vertex_slice = Slice(lo_atom, hi_atom)
-            new_resources = \
-                placed_vertex.get_resources_used_by_atoms(vertex_slice)
+            new_resources = resource_model_cache.get_resources_used_by_atoms(
+                placed_vertex, vertex_slice)
 
             if not isinstance(placed_vertex, AbstractVirtualVertex):
                 # Re-allocate the existing resources
@@ -268,7 +301,7 @@ class PartitionAndPlacePartitioner(object):
     # noinspection PyUnusedLocal
     def _scale_down_resources(
             self, lo_atom, hi_atom, vertices, resource_tracker,
-            max_atoms_per_core, fixed_n_atoms=False):
+            max_atoms_per_core, resource_model_cache, fixed_n_atoms=False):
         """ Reduce the number of atoms on a core so that it fits within the
             resources available.
 
@@ -286,6 +319,10 @@ class PartitionAndPlacePartitioner(object):
         :type max_atoms_per_core: int
         :param resource_tracker: Tracker of used resources
         :type resource_tracker: :py:class:`spinn_machine.Machine`
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
         :param fixed_n_atoms:\
             True if max_atoms_per_core is actually the fixed number of atoms\
             per core
@@ -297,6 +334,10 @@ class PartitionAndPlacePartitioner(object):
         """
         used_placements = list()
 
+        # The placements are tentative until all the vertices are placed, as
+        # they are redone if the number of atoms has to be reduced
+        savepoint = resource_tracker.savepoint()
+
         # Find the number of atoms that will fit in each vertex given the
         # resources available
         min_hi_atom = hi_atom
@@ -304,7 +345,8 @@ class PartitionAndPlacePartitioner(object):
 
             # get resources used by vertex
             vertex_slice = Slice(lo_atom, hi_atom)
-            used_resources = vertex.get_resources_used_by_atoms(vertex_slice)
+            used_resources = resource_model_cache.get_resources_used_by_atoms(
+                vertex, vertex_slice)
 
             x = None
             y = None
@@ -331,22 +373,10 @@ class PartitionAndPlacePartitioner(object):
                             used_resources.sdram.get_value(),
                             resources.sdram.get_value()))
 
-                while ratio > 1.0 and hi_atom >= lo_atom:
-                    # Scale the resources by the ratio
-                    old_n_atoms = (hi_atom - lo_atom) + 1
-                    new_n_atoms = int(float(old_n_atoms) / (ratio * 1.1))
-
-                    # Avoid infinite looping
-                    if old_n_atoms == new_n_atoms:
-                        new_n_atoms -= 1
-
-                    # Find the new resource usage
-                    hi_atom = lo_atom + new_n_atoms - 1
-                    if hi_atom >= lo_atom:
-                        vertex_slice = Slice(lo_atom, hi_atom)
-                        used_resources = \
-                            vertex.get_resources_used_by_atoms(vertex_slice)
-                        ratio = self._find_max_ratio(used_resources, resources)
+                # Find the most atoms that fit in the resources available
+                used_resources, hi_atom = self._find_max_atoms(
+                    vertex, lo_atom, hi_atom, used_resources, resources,
+                    ratio, resource_model_cache)
 
                 # If we couldn't partition, raise an exception
                 if hi_atom < lo_atom:
@@ -359,17 +389,13 @@ class PartitionAndPlacePartitioner(object):
                             used_resources.sdram.get_value(),
                             resources.sdram.get_value()))
 
-                # Try to scale up until just below the resource usage
-                used_resources, hi_atom = self._scale_up_resource_usage(
-                    used_resources, hi_atom, lo_atom, max_atoms_per_core,
-                    vertex, resources, ratio)
-
                 # If this hi_atom is smaller than the current minimum, update
                 # the other placements to use (hopefully) less resources
                 if hi_atom < min_hi_atom:
                     min_hi_atom = hi_atom
                     used_placements = self._reallocate_resources(
-                        used_placements, resource_tracker, lo_atom, hi_atom)
+                        used_placements, resource_tracker, savepoint,
+                        lo_atom, hi_atom, resource_model_cache)
 
                 # Attempt to allocate the resources for this vertex on the
                 # machine
@@ -384,6 +410,7 @@ class PartitionAndPlacePartitioner(object):
 
             used_placements.append((vertex, x, y, p, used_resources,
                                     ip_tags, reverse_ip_tags))
+        resource_tracker.commit(savepoint)
 
         # reduce data to what the parent requires
         final_placements = list()
@@ -392,64 +419,83 @@ class PartitionAndPlacePartitioner(object):
 
         return final_placements, min_hi_atom
 
-    def _scale_up_resource_usage(
-            self, used_resources, hi_atom, lo_atom, max_atoms_per_core, vertex,
-            resources, ratio):
-        """ Try to push up the number of atoms in a vertex to be as close\
-            to the available resources as possible
+    def _find_max_atoms(
+            self, vertex, lo_atom, hi_atom, used_resources, resources,
+            ratio, resource_model_cache):
+        """ Find the largest hi_atom, no larger than the one given, for which\
+            the resources used by the atoms from lo_atom fit in the resources\
+            available
 
-        :param used_resources: the resources used by the machine so far
-        :type used_resources:\
-            :py:class:`pacman.model.resources.Resource`
-        :param hi_atom: the total number of atoms to place for this vertex
-        :type hi_atom: int
-        :param lo_atom: the number of atoms already partitioned
-        :type lo_atom: int
-        :param max_atoms_per_core: the min max atoms from all the vertexes \
-            considered that have max_atom constraints
-        :type max_atoms_per_core: int
-        :param vertex: the vertexes to scale up the num atoms per core for
+        The resources used are taken to grow with the number of atoms, so\
+        the search can gallop out from a guess made from the ratio until the\
+        largest number of atoms that fit is bracketed, and then bisect; this\
+        takes a number of resource evaluations logarithmic in the number of\
+        atoms.
+
+        :param vertex: the vertex to find the number of atoms of
         :type vertex:\
             :py:class:`pacman.model.graphs.application.ApplicationVertex`
-        :param resources: the resource estimate for the vertex for a given\
-            number of atoms
+        :param lo_atom: the number of atoms already partitioned
+        :type lo_atom: int
+        :param hi_atom: the largest hi_atom to consider
+        :type hi_atom: int
+        :param used_resources: the resources used by the atoms up to hi_atom
+        :type used_resources:\
+            :py:class:`pacman.model.resources.ResourceContainer`
+        :param resources: the resources available
         :type resources:\
-            :py:class:`pacman.model.resources.Resource`
-        :param ratio: the ratio between max atoms and available resources
-        :type ratio: int
-        :return: the new resources used and the new hi_atom
+            :py:class:`pacman.model.resources.ResourceContainer`
+        :param ratio: the ratio between the resources used by the atoms up\
+            to hi_atom and the resources available
+        :type ratio: float
+        :param resource_model_cache: A memo of the resources used by slices\
+            of the vertices
+        :type resource_model_cache:\
+            :py:class:`pacman.utilities.utility_objs.ResourceModelCache`
+        :return: the resources used and the new hi_atom, which is less than\
+            lo_atom if not even one atom fits, in which case the resources\
+            are those used by one atom
         :rtype: tuple(:py:class:`pacman.model.resources.Resource`, int)
         """
-
-        previous_used_resources = used_resources
-        previous_hi_atom = hi_atom
-
-        # Keep searching while the ratio is still in range,
-        # the next hi_atom value is still less than the number of atoms,
-        # and the number of atoms is less than the constrained number of atoms
-        while ((ratio < 1.0) and (hi_atom + 1 < vertex.n_atoms) and
-               (hi_atom - lo_atom + 2 < max_atoms_per_core)):
-
-            # Update the hi_atom, keeping track of the last hi_atom which
-            # resulted in a ratio < 1.0
-            previous_hi_atom = hi_atom
-            hi_atom += 1
-
-            # Find the new resource usage, keeping track of the last usage
-            # which resulted in a ratio < 1.0
-            previous_used_resources = used_resources
-            vertex_slice = Slice(lo_atom, hi_atom)
-            used_resources = vertex.get_resources_used_by_atoms(vertex_slice)
-            ratio = self._find_max_ratio(used_resources, resources)
-
-        # If we have managed to fit everything exactly (unlikely but possible),
-        # return the matched resources and high atom count
-        if ratio == 1.0:
+        if ratio <= 1.0:
             return used_resources, hi_atom
 
-        # At this point, the ratio > 1.0, so pick the last allocation of
-        # resources, which will be < 1.0
-        return previous_used_resources, previous_hi_atom
+        # The most atoms known to fit and the fewest known not to fit, with
+        # the resources that they use
+        fit_atoms = 0
+        fit_resources = None
+        no_fit_atoms = hi_atom - lo_atom + 1
+        no_fit_resources = used_resources
+
+        # Guess as if the resources used were in proportion to the atoms
+        n_atoms = max(1, min(no_fit_atoms - 1, int(no_fit_atoms / ratio)))
+        step = 1
+        galloping_up = None
+        while fit_atoms + 1 < no_fit_atoms:
+            vertex_slice = Slice(lo_atom, lo_atom + n_atoms - 1)
+            used_resources = resource_model_cache.get_resources_used_by_atoms(
+                vertex, vertex_slice)
+            fits = self._find_max_ratio(used_resources, resources) <= 1.0
+            if fits:
+                fit_atoms, fit_resources = n_atoms, used_resources
+            else:
+                no_fit_atoms, no_fit_resources = n_atoms, used_resources
+            if galloping_up is None:
+                galloping_up = fits
+
+            # Gallop on in the direction of the guess until passing the
+            # largest number that fits, then bisect
+            if step is not None and fits == galloping_up:
+                n_atoms += step if fits else -step
+                step *= 2
+            else:
+                step = None
+                n_atoms = (fit_atoms + no_fit_atoms) // 2
+            n_atoms = max(fit_atoms + 1, min(no_fit_atoms - 1, n_atoms))
+
+        if not fit_atoms:
+            return no_fit_resources, lo_atom - 1
+        return fit_resources, lo_atom + fit_atoms - 1
 
     @staticmethod
     def _get_max_atoms_per_core(vertices):
@@ -18,12 +18,18 @@ class BasicPlacer(object):
 
     __slots__ = []
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
         """ Place a machine_graph so that each vertex is placed on a core
 
         :param machine_graph: The machine_graph to place
         :type machine_graph:\
             :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :param machine: The machine to place the graph on
+        :type machine: :py:class:`spinn_machine.Machine`
+        :param resource_tracker: A tracker of the resources of the machine\
+            to fork and place with, or None to make a new one
+        :type resource_tracker: \
+            :py:class:`pacman.utilities.utility_objs.ResourceTracker`
         :return: A set of placements
         :rtype: :py:class:`pacman.model.placements.Placements`
         :raise pacman.exceptions.PacmanPlaceException: \
@@ -36,13 +42,19 @@ class BasicPlacer(object):
         placements = Placements()
         vertices = sort_vertices_by_known_constraints(machine_graph.vertices)
 
-        # Iterate over vertices and generate placements
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine)
+        else:
+            resource_tracker = resource_tracker.fork()
+
+        # Allocate all the vertices in one go, then generate placements
         progress = ProgressBar(vertices, "Placing graph vertices")
-        resource_tracker = ResourceTracker(machine)
-        for vertex in progress.over(vertices):
+        allocations = resource_tracker.allocate_constrained_resources_batch(
+            [(vertex.resources_required, vertex.constraints)
+             for vertex in vertices], progress=progress)
+        progress.end()
+        for vertex, (x, y, p, _, _) in zip(vertices, allocations):
             # Create and store a new placement anywhere on the board
-            (x, y, p, _, _) = resource_tracker.allocate_constrained_resources(
-                vertex.resources_required, vertex.constraints, None)
             placement = Placement(vertex, x, y, p)
             placements.add_placement(placement)
         return placements
@@ -22,7 +22,7 @@ class ConnectiveBasedPlacer(RadialPlacer):
 
     __slots__ = []
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
 
         # check that the algorithm can handle the constraints
         self._check_constraints(machine_graph.vertices)
@@ -42,8 +42,11 @@ class ConnectiveBasedPlacer(RadialPlacer):
         # Iterate over constrained vertices and generate placements
         progress = ProgressBar(
             machine_graph.n_vertices, "Placing graph vertices")
-        resource_tracker = ResourceTracker(
-            machine, self._generate_radial_chips(machine))
+        chips = self._generate_radial_chips(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine, chips)
+        else:
+            resource_tracker = resource_tracker.fork(chips)
         constrained = sort_vertices_by_known_constraints(constrained)
         for vertex in progress.over(constrained, False):
             self._place_vertex(vertex, resource_tracker, machine, placements)
@@ -29,7 +29,7 @@ class OneToOnePlacer(RadialPlacer):
 
     __slots__ = []
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
 
         # check that the algorithm can handle the constraints
         self._check_constraints(
@@ -42,17 +42,22 @@ class OneToOnePlacer(RadialPlacer):
             machine_graph, same_chip_vertex_groups)
 
         return self._do_allocation(
-            sorted_vertices, machine, same_chip_vertex_groups, machine_graph)
+            sorted_vertices, machine, same_chip_vertex_groups, machine_graph,
+            resource_tracker)
 
     def _do_allocation(
-            self, vertices, machine, same_chip_vertex_groups, machine_graph):
+            self, vertices, machine, same_chip_vertex_groups, machine_graph,
+            resource_tracker=None):
         placements = Placements()
 
         # Iterate over vertices and generate placements
         progress = ProgressBar(
             machine_graph.n_vertices, "Placing graph vertices")
-        resource_tracker = ResourceTracker(
-            machine, self._generate_radial_chips(machine))
+        chips = self._generate_radial_chips(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine, chips)
+        else:
+            resource_tracker = resource_tracker.fork(chips)
         all_vertices_placed = set()
 
         # iterate over vertices
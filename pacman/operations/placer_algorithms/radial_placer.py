@@ -5,8 +5,10 @@ from pacman.utilities.algorithm_utilities.placer_algorithm_utilities \
     import sort_vertices_by_known_constraints, get_same_chip_vertex_groups
 from pacman.model.placements import Placement, Placements
 from pacman.utilities.utility_calls import locate_constraints_of_type
-from pacman.utilities.utility_objs import ResourceTracker
-from pacman.exceptions import PacmanPlaceException
+from pacman.utilities.utility_objs import MachineTopology, ResourceTracker
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
+from pacman.exceptions import \
+    PacmanConfigurationException, PacmanPlaceException
 
 from spinn_utilities.progress_bar import ProgressBar
 
@@ -23,7 +25,7 @@ class RadialPlacer(object):
         machine choosing chips radiating in a circle from the boot chip
     """
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
         # check that the algorithm can handle the constraints
         self._check_constraints(machine_graph.vertices)
 
@@ -33,8 +35,11 @@ class RadialPlacer(object):
         # Iterate over vertices and generate placements
         progress = ProgressBar(
             machine_graph.n_vertices, "Placing graph vertices")
-        resource_tracker = ResourceTracker(
-            machine, self._generate_radial_chips(machine))
+        chips = self._generate_radial_chips(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine, chips)
+        else:
+            resource_tracker = resource_tracker.fork(chips)
         vertices_on_same_chip = get_same_chip_vertex_groups(machine_graph)
         all_vertices_placed = set()
         for vertex in progress.over(vertices):
@@ -119,26 +124,42 @@ class RadialPlacer(object):
         :param start_chip_y:\
             the chip y coordinate to start with for radial iteration
         :return: list of chips.
+        :raise PacmanConfigurationException: \
+            If the starting chip is not in the machine
         """
 
+        topology = MachineTopology.of(machine)
         if start_chip_x is None or start_chip_y is None:
-            first_chip = machine.boot_chip
+            boot_chip = machine.boot_chip
+            first_chip = topology.index_of(boot_chip.x, boot_chip.y)
         else:
-            first_chip = machine.get_chip_at(start_chip_x, start_chip_y)
+            first_chip = topology.index_of(start_chip_x, start_chip_y)
+            if first_chip == NO_CHIP:
+                raise PacmanConfigurationException(
+                    "Cannot start the radial search from chip ({}, {}) as it"
+                    " is not in the machine".format(
+                        start_chip_x, start_chip_y))
+        return RadialPlacer._search_radial_chips(
+            topology, first_chip, resource_tracker)
+
+    @staticmethod
+    def _search_radial_chips(topology, first_chip, resource_tracker):
+        """ Yield the coordinates of the chips in a breadth-first search of\
+            the links from the chip at the given index
+        """
         done_chips = {first_chip}
         search = deque([first_chip])
         while search:
             chip = search.pop()
+            x, y = topology.coordinates_of(chip)
             if (resource_tracker is None or
-                    resource_tracker.is_chip_available(chip.x, chip.y)):
-                yield chip.x, chip.y
+                    resource_tracker.is_chip_available(x, y)):
+                yield x, y
 
             # Examine the links of the chip to find the next chips
-            for link in chip.router.links:
-                next_chip = machine.get_chip_at(
-                    link.destination_x, link.destination_y)
+            for next_chip in topology.neighbours[chip].tolist():
 
                 # Don't search done chips again
-                if next_chip not in done_chips:
+                if next_chip != NO_CHIP and next_chip not in done_chips:
                     search.appendleft(next_chip)
                     done_chips.add(next_chip)
@@ -3,7 +3,7 @@ from pacman.model.constraints.placer_constraints import SameChipAsConstraint
 from pacman.utilities.algorithm_utilities.placer_algorithm_utilities import \
     get_same_chip_vertex_groups, sort_vertices_by_known_constraints
 from pacman.model.placements import Placement, Placements
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import MachineTopology, ResourceTracker
 from pacman.operations.rigged_algorithms.hilbert_state import HilbertState
 
 # spinn_utils imports
@@ -21,7 +21,7 @@ class HilbertPlacer(object):
         translated from RIG.
     """
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
         """ Place each vertex in a machine graph on a core in the machine.
 
         :param machine_graph: The machine_graph to place
@@ -29,6 +29,10 @@ class HilbertPlacer(object):
             :py:class:`pacman.model.graphs.machine.MachineGraph`
         :param machine: A SpiNNaker machine object.
         :type machine: :py:class:`spinn_machine.Machine`
+        :param resource_tracker: A tracker of the resources of the machine\
+            to fork and place with, or None to make a new one
+        :type resource_tracker: \
+            :py:class:`pacman.utilities.utility_objs.ResourceTracker`
         :return placements: Placements of vertices on the machine
         :rtype :py:class:`pacman.model.placements.Placements`
         """
@@ -45,8 +49,11 @@ class HilbertPlacer(object):
 
         progress = ProgressBar(
             machine_graph.n_vertices, "Placing graph vertices")
-        resource_tracker = ResourceTracker(
-            machine, self._generate_hilbert_chips(machine))
+        chips = self._generate_hilbert_chips(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine, chips)
+        else:
+            resource_tracker = resource_tracker.fork(chips)
 
         # get vertices which must be placed on the same chip
         vertices_on_same_chip = get_same_chip_vertex_groups(machine_graph)
@@ -99,8 +106,9 @@ class HilbertPlacer(object):
         else:
             hilbert_levels = 0
 
+        topology = MachineTopology.of(machine)
         for x, y in self._hilbert_curve(hilbert_levels):
-            if machine.is_chip_at(x, y):
+            if topology.is_chip_at(x, y):
                 yield x, y
 
     def _place_vertex(self, vertex, resource_tracker, machine, placements,
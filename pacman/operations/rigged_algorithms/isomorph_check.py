@@ -60,21 +60,15 @@ class IsomorphicChecker(object):
 
         chip_vertices = set()
         chip_vertices_copy = set()
-        chips = set()
 
-        # create a list of processors with assigned vertices
-        for x, y, p in placements.get_placed_processors():
-            chips.add((x, y))
-
-        # create sets of the vertices on each processor and compare them
-        for (x, y) in chips:
-            for p in range(0, 18):
-                if placements.is_processor_occupied(x, y, p):
-                    chip_vertices.add(placements.get_vertex_on_processor(
-                        x, y, p))
-                if placements_copy.is_processor_occupied(x, y, p):
-                    chip_vertices_copy.add(
-                        placements_copy.get_vertex_on_processor(x, y, p))
+        # create sets of the vertices on each chip used and compare them
+        for (x, y) in placements.chips_used:
+            chip_vertices.update(
+                placement.vertex
+                for placement in placements.get_placements_on_chip(x, y))
+            chip_vertices_copy.update(
+                placement.vertex
+                for placement in placements_copy.get_placements_on_chip(x, y))
 
         # if the two sets are not
         return (chip_vertices != chip_vertices_copy,
@@ -19,7 +19,7 @@ class RandomPlacer(object):
     # a list.
     THRESHOLD = 3
 
-    def __call__(self, machine_graph, machine):
+    def __call__(self, machine_graph, machine, resource_tracker=None):
 
         # check that the algorithm can handle the constraints
         ResourceTracker.check_constraints(machine_graph.vertices)
@@ -30,8 +30,11 @@ class RandomPlacer(object):
         # Iterate over vertices and generate placements
         progress = ProgressBar(machine_graph.n_vertices,
                                "Placing graph vertices")
-        resource_tracker = ResourceTracker(
-            machine, self._generate_random_chips(machine))
+        chips = self._generate_random_chips(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine, chips)
+        else:
+            resource_tracker = resource_tracker.fork(chips)
         vertices_on_same_chip = get_same_chip_vertex_groups(machine_graph)
         vertices_placed = set()
         for vertex in progress.over(vertices):
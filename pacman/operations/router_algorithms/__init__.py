@@ -1,4 +1,9 @@
 from pacman.operations.router_algorithms.basic_dijkstra_routing \
     import BasicDijkstraRouting
+from pacman.operations.router_algorithms.congestion_aware_routing \
+    import CongestionAwareRouting
+from pacman.operations.router_algorithms.steiner_tree_routing \
+    import SteinerTreeRouting
 
-__all__ = ['BasicDijkstraRouting', ]
+__all__ = ['BasicDijkstraRouting', 'CongestionAwareRouting',
+           'SteinerTreeRouting']
@@ -5,38 +5,55 @@ from pacman.exceptions import PacmanRoutingException
 from pacman.model.graphs.common import EdgeTrafficType
 from pacman.model.routing_table_by_partition import \
     MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry
+from pacman.utilities.utility_calls import forked_map
+from pacman.utilities.utility_objs import MachineTopology
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
 
 # general imports
-try:
-    import itertools.izip as zip  # @ReservedAssignment
-except ImportError:
-    pass
+from collections import OrderedDict
+import heapq
 import logging
-import sys
+from six.moves import zip
 
 logger = logging.getLogger(__name__)
 infinity = float("inf")
 
 
-class _NodeInfo(object):
-    __slots__ = ["neighbours", "bws", "weights"]
+class _ShortestPathTree(object):
+    """ The part of a shortest path tree from one source chip that has been\
+        explored so far
+    """
+
+    __slots__ = [
+        # the index of the chip at the root of the tree
+        "source",
 
-    def __init__(self):
-        self.neighbours = list()
-        self.bws = list()
-        self.weights = list()
+        # dict of chip index -> (index of parent, link from the chip to the
+        # parent) for each chip reached other than the source
+        "parents",
 
-    @property
-    def neighweights(self):
-        return zip(self.neighbours, self.weights)
+        # the generation of the tables that hold the state of the search;
+        # the search can only be resumed while this is still current
+        "generation",
 
+        # the last chip reached, whose neighbours are still to be explored
+        "current"]
 
-class _DijkstraInfo(object):
-    __slots__ = ["activated", "cost"]
+    def __init__(self, source, generation):
+        self.source = source
+        self.parents = dict()
+        self.generation = generation
+        self.current = source
 
-    def __init__(self):
-        self.activated = False
-        self.cost = None
+    def reaches(self, dest_chips):
+        """ Determine if the tree already reaches every given chip
+
+        :param dest_chips: the indices of the chips to check
+        :rtype: bool
+        """
+        return all(
+            chip == self.source or chip in self.parents
+            for chip in dest_chips)
 
 
 class BasicDijkstraRouting(object):
@@ -56,15 +73,56 @@ class BasicDijkstraRouting(object):
         "_max_bw",
 
         # the SpiNNMachine object used within the system.
-        "_machine"
+        "_machine",
+
+        # the array-backed view of the machine
+        "_topology",
+
+        # the index of the chip at the end of each link of each chip, as
+        # lists for fast access
+        "_neighbours",
+
+        # the weight of each link of each chip
+        "_weights",
+
+        # the x and y coordinates of each chip by index
+        "_xs",
+        "_ys",
+
+        # the cost of reaching each chip in the search of the generation in
+        # _stamps; costs with an older stamp are treated as unset
+        "_costs",
+        "_stamps",
+
+        # the generation of the search in which each chip was activated
+        "_activated",
+
+        # the generation of the current search
+        "_generation",
+
+        # the priority queue of (cost, chip index) of the current search
+        "_queue",
+
+        # the most recently used shortest path trees by source chip index, up
+        # to _tree_cache_size of them; emptied whenever a link weight changes
+        "_trees",
+
+        # the number of source chips whose shortest path trees are kept
+        "_tree_cache_size"
     ]
 
     BW_PER_ROUTE_ENTRY = 0.01
     MAX_BW = 250
+    TREE_CACHE_SIZE = 64
+
+    # The number of chunks of source chips per process when routing in
+    # parallel
+    CHUNKS_PER_PROCESS = 4
 
     def __call__(self, placements, machine, machine_graph,
                  bw_per_route_entry=BW_PER_ROUTE_ENTRY, max_bw=MAX_BW,
-                 use_progress_bar=True):
+                 use_progress_bar=True, tree_cache_size=TREE_CACHE_SIZE,
+                 n_processes=1):
         """ Find routes between the edges with the allocated information,\
             placed in the given places
 
@@ -78,6 +136,12 @@ class BasicDijkstraRouting(object):
             :py:class:`pacman.model.graphs.machine.MachineGraph`
         :param use_progress_bar: whether to show a progress bar
         :type use_progress_bar: bool
+        :param tree_cache_size: \
+            the number of source chips whose shortest path trees are kept\
+            for reuse by later placements on the same chip
+        :type tree_cache_size: int
+        :param n_processes: the number of processes to find the paths in
+        :type n_processes: int
         :return: The discovered routes
         :rtype:\
             :py:class:`pacman.model.routing_tables.MulticastRoutingTables`
@@ -90,257 +154,351 @@ class BasicDijkstraRouting(object):
         self._bw_per_route_entry = bw_per_route_entry
         self._max_bw = max_bw
         self._machine = machine
-
-        nodes_info = self._initiate_node_info(machine)
-        tables = self._initiate_dijkstra_tables(machine)
-        self._update_all_weights(nodes_info)
+        self._trees = OrderedDict()
+        self._tree_cache_size = max(1, tree_cache_size)
+
+        self._initiate_node_info(machine)
+        self._initiate_dijkstra_tables()
+        self._update_all_weights()
+
+        # The placements are shared out by source chip, so that the shortest
+        # path tree of each chip is found in only one process; the chunks are
+        # given by their range of chips, as the placements themselves would
+        # be copied going to other processes
+        by_chip = OrderedDict()
+        for placement in placements.placements:
+            by_chip.setdefault(
+                (placement.x, placement.y), list()).append(placement)
+        chip_placements = list(by_chip.values())
+        chunk_size = max(1, -(-len(chip_placements) // (
+            max(1, n_processes) * self.CHUNKS_PER_PROCESS)))
+        chunks = [(start, min(start + chunk_size, len(chip_placements)))
+                  for start in range(0, len(chip_placements), chunk_size)]
+
+        def find_paths(chunk):
+            start, end = chunk
+            return [[self._find_paths(placement, placements, machine_graph)
+                     for placement in on_chip]
+                    for on_chip in chip_placements[start:end]]
 
         # each vertex represents a core in the board
         pb_factory = ProgressBar if use_progress_bar else DummyProgressBar
         progress = pb_factory(placements.n_placements,
                               "Creating routing entries")
-
-        for placement in progress.over(placements.placements):
-            self._route(placement, placements, machine, machine_graph,
-                        nodes_info, tables)
+        for (start, end), chunk_paths in zip(
+                chunks, forked_map(find_paths, chunks, n_processes)):
+            for on_chip, chip_paths in zip(
+                    chip_placements[start:end], chunk_paths):
+                for placement, paths in zip(on_chip, chip_paths):
+                    self._add_paths(placement, paths, placements,
+                                    machine_graph)
+                progress.update(len(on_chip))
+        progress.end()
         return self._routing_paths
 
-    def _route(self, placement, placements, machine, graph, node_info, tables):
-        # pylint: disable=too-many-arguments
-        out_going_edges = filter(
-            lambda edge: edge.traffic_type == EdgeTrafficType.MULTICAST,
-            graph.get_edges_starting_at_vertex(placement.vertex))
-
-        dest_chips = set()
-        edges_to_route = list()
-
-        for edge in out_going_edges:
-            destination = edge.post_vertex
-            dest_place = placements.get_placement_of_vertex(destination)
-            chip = machine.get_chip_at(dest_place.x, dest_place.y)
-            dest_chips.add((chip.x, chip.y))
-            edges_to_route.append(edge)
-
-        if dest_chips:
-            self._update_all_weights(node_info)
-            self._reset_tables(tables)
-            tables[placement.x, placement.y].activated = True
-            tables[placement.x, placement.y].cost = 0
-            self._propagate_costs_until_reached_destinations(
-                tables, node_info, dest_chips, placement.x, placement.y)
-
-        for edge in edges_to_route:
-            dest = edge.post_vertex
-            dest_placement = placements.get_placement_of_vertex(dest)
+    @staticmethod
+    def _multicast_edges(placement, graph):
+        """ Get the multicast edges that start at the vertex of a placement
+
+        :rtype: list(:py:class:`pacman.model.graphs.machine.MachineEdge`)
+        """
+        return [edge
+                for edge in graph.get_edges_starting_at_vertex(
+                    placement.vertex)
+                if edge.traffic_type == EdgeTrafficType.MULTICAST]
+
+    def _find_paths(self, placement, placements, graph):
+        """ Find the path back from the destination of each multicast edge\
+            that starts at the vertex of a placement to the chip of the\
+            placement
+
+        :return: for each edge, the (index of chip, link from the chip to\
+            the previous chip) of each hop back to the source
+        :rtype: list(list(tuple(int, int)))
+        """
+        dest_chips = list()
+        for edge in self._multicast_edges(placement, graph):
+            dest_place = placements.get_placement_of_vertex(edge.post_vertex)
+            dest_chips.append(self._chip_index(dest_place.x, dest_place.y))
+        if not dest_chips:
+            return []
+        tree = self._get_shortest_path_tree(
+            self._chip_index(placement.x, placement.y), set(dest_chips))
+
+        paths = list()
+        for chip in dest_chips:
+            path = list()
+            while chip != tree.source:
+                chip, link = tree.parents[chip]
+                path.append((chip, link))
+            paths.append(path)
+        return paths
+
+    def _add_paths(self, placement, paths, placements, graph):
+        """ Add the routing entries of the paths found for the multicast\
+            edges that start at the vertex of a placement
+
+        :param paths: the paths found by _find_paths
+        """
+        for edge, path in zip(self._multicast_edges(placement, graph), paths):
+            dest_placement = placements.get_placement_of_vertex(
+                edge.post_vertex)
             self._retrace_back_to_source(
-                dest_placement, tables, edge, node_info, placement.p, graph)
+                dest_placement, path, edge, placement.p, graph)
+
+    def _chip_index(self, x, y):
+        """ Get the index of a chip in the topology of the machine
+
+        :param x: the x-coordinate of the chip
+        :param y: the y-coordinate of the chip
+        :rtype: int
+        :raise PacmanRoutingException: if there is no such chip
+        """
+        index = self._topology.index_of(x, y)
+        if index == NO_CHIP:
+            raise PacmanRoutingException(
+                "There is no chip at ({}, {}) to route to or from".format(
+                    x, y))
+        return index
+
+    def _get_shortest_path_tree(self, source, dest_chips):
+        """ Get a shortest path tree from a chip that reaches at least the\
+            given chips, reusing and extending a cached tree where possible
+
+        :param source: the index of the source chip
+        :param dest_chips: the indices of the chips to be reached
+        :rtype: _ShortestPathTree
+        :raise PacmanRoutingException: \
+            when a destination could not be reached
+        """
+        tree = self._trees.pop(source, None)
+        if tree is None or (
+                tree.generation != self._generation and
+                not tree.reaches(dest_chips)):
+            # The search state behind the tree is gone, so start again
+            self._reset_tables()
+            self._costs[source] = 0
+            self._stamps[source] = self._generation
+            self._activated[source] = self._generation
+            tree = _ShortestPathTree(source, self._generation)
+
+        # Keep the tree as the most recently used one
+        self._trees[source] = tree
+        while len(self._trees) > self._tree_cache_size:
+            self._trees.popitem(last=False)
+
+        self._propagate_costs_until_reached_destinations(dest_chips, tree)
+        return tree
 
     def _initiate_node_info(self, machine):
-        """ Set up a dictionary which contains data for each chip in the\
-            machine
+        """ Set up the view of the links of each chip in the machine
 
         :param machine: the machine object
         :type machine: spinn_machine.Machine
-        :return: nodes_info dictionary
-        :rtype: dict
+        :rtype: None
         :raise None: this method does not raise any known exceptions
         """
-        nodes_info = dict()
-        for chip in machine.chips:
-            # get_neighbours should return a list of
-            # dictionaries of 'x' and 'y' values
-            node = _NodeInfo()
-            for source_id in range(6):
-                n = chip.router.get_link(source_id)
-                node.neighbours.append(n)
-                node.weights.append(infinity)
-                node.bws.append(None if n is None else self._max_bw)
-            nodes_info[chip.x, chip.y] = node
-        return nodes_info
-
-    @staticmethod
-    def _initiate_dijkstra_tables(machine):
+        self._topology = MachineTopology.of(machine)
+        self._neighbours = self._topology.neighbours.tolist()
+        self._weights = [
+            [infinity] * len(links) for links in self._neighbours]
+        self._xs = self._topology.xs.tolist()
+        self._ys = self._topology.ys.tolist()
+
+    def _initiate_dijkstra_tables(self):
         """ Set up the Dijkstra's table which includes if you've reached a\
             given node
 
-        :param machine: the machine object
-        :type machine: the spinn_machine.Machine object
-        :return: the  Dijkstra's table dictionary
-        :rtype: dict
+        :rtype: None
         :raise None: this method does not raise any known exception
         """
         # Holds all the information about nodes within one full run of
         # Dijkstra's algorithm
-        tables = dict()
-        for chip in machine.chips:
-            tables[chip.x, chip.y] = _DijkstraInfo()
-        return tables
+        n_chips = self._topology.n_chips
+        self._costs = [None] * n_chips
+        self._stamps = [0] * n_chips
+        self._activated = [0] * n_chips
+        self._generation = 0
+        self._queue = list()
 
-    def _update_all_weights(self, nodes_info):
-        """ Change the weights of the neighbouring nodes
+    def _update_all_weights(self):
+        """ Change the weights of the links of the chips, dropping any cached\
+            shortest path trees if a weight has changed
 
-        :param nodes_info: the node info dictionary
-        :type nodes_info: dict
         :rtype: None
         :raise None: this method does not raise any known exception
         """
-        for key in nodes_info:
-            if nodes_info[key] is not None:
-                self._update_neighbour_weights(nodes_info, key)
-
-    def _update_neighbour_weights(self, nodes_info, key):
-        """ Change the weights of the neighbouring nodes
-
-        :param nodes_info: the node info dictionary
-        :param key: the identifier to the object in nodes_info
-        :type key: str
-        :type nodes_info: dict
-        :rtype: None
+        changed = False
+        for chip in range(len(self._neighbours)):
+            if self._update_neighbour_weights(chip):
+                changed = True
+        if changed:
+            self._trees.clear()
+
+    def _update_neighbour_weights(self, chip):
+        """ Change the weights of the links of a chip
+
+        :param chip: the index of the chip
+        :type chip: int
+        :return: whether any weight was changed
+        :rtype: bool
         :raise None: this method does not raise any known exception
         """
-        for n, neighbour in enumerate(nodes_info[key].neighbours):
-            if neighbour is not None:
-                nodes_info[key].weights[n] = 1
+        changed = False
+        weights = self._weights[chip]
+        for n, neighbour in enumerate(self._neighbours[chip]):
+            if neighbour != NO_CHIP and weights[n] != 1:
+                weights[n] = 1
+                changed = True
+        return changed
+
+    def _reset_tables(self):
+        """ Reset the Dijkstra tables for a new path search.  The entries\
+            are not touched; moving to a new generation makes every entry\
+            stale, and stale entries are ignored when next used.
 
-    @staticmethod
-    def _reset_tables(tables):
-        """ Reset the Dijkstra tables for a new path search
-
-        :param tables: the dictionary object for the Dijkstra-tables
-        :type tables: dict
         :rtype: None
         :raise None: this method does not raise any known exception
         """
-        for key in tables:
-            tables[key] = _DijkstraInfo()
+        self._generation += 1
+        del self._queue[:]
 
-    def _propagate_costs_until_reached_destinations(
-            self, tables, nodes_info, dest_chips, x_source, y_source):
+    def _propagate_costs_until_reached_destinations(self, dest_chips, tree):
         """ Propagate the weights till the destination nodes of the source\
-            nodes are retraced
-
-        :param tables: the dictionary object for the Dijkstra-tables
-        :param nodes_info: \
-            the dictionary object for the nodes inside a route scope
-        :param dest_chips:
-        :param x_source:
-        :param y_source:
-        :type tables: dict
-        :type nodes_info: dict
-        :type dest_chips:
-        :type x_source: int
-        :type y_source: int
+            nodes are retraced, recording the parent of each node in the tree\
+            as it is activated
+
+        :param dest_chips: the indices of the chips to be reached
+        :param tree: the tree to extend, whose search state is in the tables
+        :type dest_chips: iterable(int)
+        :type tree: _ShortestPathTree
         :rtype: None
         :raise PacmanRoutingException: when the destination node could not be\
             reached from this source node.
         """
 
-        dest_chips_to_find = set(dest_chips)
-        source = (x_source, y_source)
+        dest_chips_to_find = set(
+            chip for chip in dest_chips if chip not in tree.parents)
+        source = tree.source
         dest_chips_to_find.discard(source)
 
-        current = source
+        generation = self._generation
+        costs = self._costs
+        stamps = self._stamps
+        activated = self._activated
+        queue = self._queue
+        current = tree.current
 
         # Iterate only if the destination node hasn't been activated
         while dest_chips_to_find:
             # PROPAGATE!
-            for neighbour, weight in nodes_info[current].neighweights:
-                # "neighbours" is a list of 6 links or None objects. There is
-                # a None object where there is no connection to that neighbour
-                if (neighbour is not None and
-                        not (neighbour.destination_x == x_source and
-                             neighbour.destination_y == y_source)):
-
-                    # These variables change with every look at a new neighbour
-                    self._update_neighbour(
-                        tables, neighbour, current,
-                        source, weight)
+            chip_cost = costs[current]
+            weights = self._weights[current]
+            for link, neighbour in enumerate(self._neighbours[current]):
+                # Only try to update if the neighbour is within the graph and
+                # the cost if the node hasn't already been activated and the
+                # lowest cost if the new cost is less, or if there is no
+                # current cost.
+                if (neighbour == NO_CHIP or neighbour == source or
+                        activated[neighbour] == generation):
+                    continue
+                new_cost = float(chip_cost + weights[link])
+                if stamps[neighbour] != generation or \
+                        new_cost < costs[neighbour]:
+                    if new_cost == 0:
+                        raise PacmanRoutingException(
+                            "!!!Cost of non-source node ({}, {}) was set to "
+                            "zero!!!".format(
+                                self._xs[neighbour], self._ys[neighbour]))
+
+                    # update Dijkstra table; any older queue entry for this
+                    # node is left in place and discarded when it reaches the
+                    # top
+                    costs[neighbour] = new_cost
+                    stamps[neighbour] = generation
+                    heapq.heappush(queue, (new_cost, neighbour))
 
             # Set the next activated node as the deactivated node with the
             # lowest current cost
-            current = self._minimum(tables)
-            tables[current].activated = True
+            current = self._minimum()
+            activated[current] = generation
+            tree.parents[current] = self._find_parent(current)
+            tree.current = current
             dest_chips_to_find.discard(current)
 
-    @staticmethod
-    def _minimum(tables):
-        # This is the lowest cost across ALL deactivated nodes in the graph.
-        lowest_cost = sys.maxsize
-        lowest = None
-
-        # Find the next node to be activated
-        for key in tables:
-            # Don't continue if the node hasn't even been touched yet
-            if (tables[key].cost is not None and not tables[key].activated
-                    and tables[key].cost < lowest_cost):
-                lowest_cost = tables[key].cost
-                lowest = key
+    def _find_parent(self, chip):
+        """ Find the neighbour of a newly activated node through which it is\
+            reached at the lowest cost
+
+        :param chip: the index of the node
+        :return: the index of the parent, and the link from the node to it
+        :rtype: tuple(int, int)
+        :raise PacmanRoutingException: \
+            when the algorithm doesn't find a preceding node
+        """
+        generation = self._generation
+        cost = self._costs[chip]
+        for idx, neighbour in enumerate(self._neighbours[chip]):
+            # The neighbour precedes the node if getting to the node through
+            # the link back from the neighbour costs exactly the cost of the
+            # node
+            if neighbour != NO_CHIP and \
+                    self._stamps[neighbour] == generation:
+                n_weight = self._weights[neighbour][
+                    self._get_reverse_direction(idx)]
+                if self._close_enough(
+                        self._costs[neighbour], cost - n_weight):
+                    return neighbour, idx
+        raise PacmanRoutingException(
+            "Iterated through all neighbours of tracking node but"
+            " did not find a preceding node! Consider increasing "
+            "acceptable discrepancy between sought traceback cost"
+            " and actual cost at node. Terminating...")
+
+    def _minimum(self):
+        """ Get the deactivated node with the lowest cost, discarding any\
+            queue entries made obsolete by a later cost reduction or by\
+            activation of the node
+
+        :return: the index of the node
+        :rtype: int
+        :raise PacmanRoutingException: \
+            when there are no more nodes that can be reached
+        """
+        queue = self._queue
+        generation = self._generation
+        while queue:
+            cost, chip = heapq.heappop(queue)
+            if self._activated[chip] != generation and \
+                    self._costs[chip] == cost:
+                return chip
 
         # If there were no deactivated nodes with costs, but the destination
         # was not reached this iteration, raise an exception
-        if lowest is None:
-            raise PacmanRoutingException(
-                "Destination could not be activated, ending run")
-
-        return int(lowest[0]), int(lowest[1])
-
-    @staticmethod
-    def _update_neighbour(tables, neighbour, current, source, weight):
-        """ Update the lowest cost for each neighbour_xy of a node
-
-        :rtype: None
-        :raise PacmanRoutingException: when the algorithm goes to a node that\
-            doesn't exist in the machine or the node's cost was set too low.
-        """
-        neighbour_xy = (neighbour.destination_x, neighbour.destination_y)
-        if neighbour_xy not in tables:
-            raise PacmanRoutingException(
-                "Tried to propagate to ({}, {}), which is not in the"
-                " graph: remove non-existent neighbours"
-                .format(neighbour.destination_x, neighbour.destination_y))
-
-        chip_cost = tables[current].cost
-        neighbour_cost = tables[neighbour_xy].cost
-
-        # Only try to update if the neighbour_xy is within the graph and the
-        # cost if the node hasn't already been activated and the lowest cost
-        # if the new cost is less, or if there is no current cost.
-        new_weight = float(chip_cost + weight)
-        if (not tables[neighbour_xy].activated and
-                (neighbour_cost is None or new_weight < neighbour_cost)):
-            # update Dijkstra table
-            tables[neighbour_xy].cost = new_weight
-
-        if tables[neighbour_xy].cost == 0 and neighbour_xy != source:
-            raise PacmanRoutingException(
-                "!!!Cost of non-source node ({}, {}) was set to zero!!!"
-                .format(neighbour.destination_x, neighbour.destination_y))
+        raise PacmanRoutingException(
+            "Destination could not be activated, ending run")
 
     def _retrace_back_to_source(
-            self, dest, tables, edge, nodes_info, source_processor, graph):
-        """
+            self, dest, path, edge, source_processor, graph):
+        """ Add the routing entries of the path from the source of an edge\
+            to a destination by following the path back to the source
 
         :param dest: Destination placement
-        :param tables:
-        :param edge:
-        :param nodes_info:
-        :param source_processor:
-        :param graph:
-        :type nodes_info: dict( _NodeInfo )
-        :type edge:
+        :param path: the (index of chip, link from the chip to the previous\
+            chip) of each hop back from the destination to the source
+        :param edge: the edge being routed
+        :param source_processor: the processor the edge starts from
+        :param graph: the graph containing the edge
         :type dest: Placement
-        :type tables: dict( _DijkstraInfo )
-        :type graph:
-        :return: the next coordinates to look into
+        :type path: list(tuple(int, int))
+        :type edge: :py:class:`pacman.model.graphs.machine.MachineEdge`
+        :type source_processor: int
+        :type graph: :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :return: the coordinates of the source
         :rtype: (int, int)
-        :raise PacmanRoutingException: \
-            when the algorithm doesn't find a next point to search from. AKA,\
-            the neighbours of a chip do not have a cheaper cost than the node\
-            itself, but the node is not the destination or when the algorithm\
-            goes to a node that's not considered in the weighted search.
         """
         # Set the tracking node to the destination to begin with
-        x, y = dest.x, dest.y
+        chip = self._chip_index(dest.x, dest.y)
         routing_entry_route_processors = []
 
         # if the processor is None, don't add to router path entry
@@ -348,91 +506,36 @@ class BasicDijkstraRouting(object):
             routing_entry_route_processors.append(dest.p)
         routing_entry_route_links = None
 
-        # build the multicast entry
+        # find the partition of the edge
+        edge_partition = None
         partitions = graph.get_outgoing_edge_partitions_starting_at_vertex(
             edge.pre_vertex)
-
-        prev_entry = None
         for partition in partitions:
             if edge in partition:
-                entry = MulticastRoutingTableByPartitionEntry(
-                    out_going_links=routing_entry_route_links,
-                    outgoing_processors=routing_entry_route_processors)
-                self._routing_paths.add_path_entry(
-                    entry, dest.x, dest.y, partition)
-                prev_entry = entry
-
-        while tables[x, y].cost != 0:
-            for idx, neighbour in enumerate(nodes_info[x, y].neighbours):
-                if neighbour is not None:
-                    n_xy = (neighbour.destination_x, neighbour.destination_y)
-
-                    # Only check if it can be a preceding node if it actually
-                    # exists
-                    if n_xy not in tables:
-                        raise PacmanRoutingException(
-                            "Tried to trace back to node not in "
-                            "graph: remove non-existent neighbours")
-
-                    if tables[n_xy].cost is not None:
-                        x, y, prev_entry, added = self._create_routing_entry(
-                            n_xy, tables, idx, nodes_info, x, y,
-                            prev_entry, edge, graph)
-                        if added:
-                            break
-            else:
-                raise PacmanRoutingException(
-                    "Iterated through all neighbours of tracking node but"
-                    " did not find a preceding node! Consider increasing "
-                    "acceptable discrepancy between sought traceback cost"
-                    " and actual cost at node. Terminating...")
-        prev_entry.incoming_processor = source_processor
-        return x, y
-
-    def _create_routing_entry(
-            self, neighbour_xy, tables, neighbour_index,
-            nodes_info, x, y, previous_entry, edge, graph):
-        """ Create a new routing entry
+                edge_partition = partition
 
-        :return: x, y, previous_entry, made_an_entry
-        :rtype: int, int, spinn_machine.MulticastRoutingEntry, bool
-        :raise PacmanRoutingException: \
-            when the bandwidth of a router is beyond expected parameters
-        """
+        # build the multicast entry
+        entry = MulticastRoutingTableByPartitionEntry(
+            out_going_links=routing_entry_route_links,
+            outgoing_processors=routing_entry_route_processors)
+        self._routing_paths.add_path_entry(
+            entry, self._xs[chip], self._ys[chip], edge_partition)
+        prev_entry = entry
+
+        for chip, link in path:
+            # Set the direction of the routing entry as that which is from
+            # the preceding node to the current tracking node.
+            entry = MulticastRoutingTableByPartitionEntry(
+                self._get_reverse_direction(link), None)
+            prev_entry.incoming_link = link
+
+            # add entry for next hop going backwards into path
+            self._routing_paths.add_path_entry(
+                entry, self._xs[chip], self._ys[chip], edge_partition)
+            prev_entry = entry
 
-        # Set the direction of the routing other_entry as that which is from
-        # the preceding node to the current tracking node.
-        # neighbour_xy is the 'old' coordinates since it is from the preceding
-        # node. x and y are the 'new' coordinates since they are where the
-        # router should send the packet to.
-        dec_direction = self._get_reverse_direction(neighbour_index)
-        made_an_entry = False
-
-        neighbour_weight = nodes_info[neighbour_xy].weights[dec_direction]
-        chip_sought_cost = tables[x, y].cost - neighbour_weight
-        neighbours_lowest_cost = tables[neighbour_xy].cost
-
-        if (neighbours_lowest_cost is not None and
-                self._close_enough(neighbours_lowest_cost, chip_sought_cost)):
-            # build the multicast entry
-            partns = graph.get_outgoing_edge_partitions_starting_at_vertex(
-                    edge.pre_vertex)
-            entry = None
-            for partition in partns:
-                if edge in partition:
-                    entry = MulticastRoutingTableByPartitionEntry(
-                        dec_direction, None)
-                    previous_entry.incoming_link = neighbour_index
-                    # add entry for next hop going backwards into path
-                    self._routing_paths.add_path_entry(
-                        entry, neighbour_xy[0], neighbour_xy[1], partition)
-            previous_entry = entry
-            made_an_entry = True
-
-            # Finally move the tracking node
-            x, y = neighbour_xy
-
-        return x, y, previous_entry, made_an_entry
+        prev_entry.incoming_processor = source_processor
+        return self._xs[chip], self._ys[chip]
 
     @staticmethod
     def _close_enough(v1, v2, delta=0.00000000001):
@@ -0,0 +1,320 @@
+from spinn_utilities.progress_bar import ProgressBar, DummyProgressBar
+
+# pacman imports
+from pacman.model.graphs.common import EdgeTrafficType
+from pacman.model.routing_table_by_partition import \
+    MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
+from .basic_dijkstra_routing import BasicDijkstraRouting
+
+# general imports
+from collections import OrderedDict
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _PartitionRoute(object):
+    """ The tree of chips used by the route of one partition
+    """
+
+    __slots__ = [
+        # the partition being routed
+        "partition",
+
+        # the bandwidth that the partition uses on each link it goes down
+        "bandwidth",
+
+        # the index of the chip the partition starts from
+        "source",
+
+        # the processor the partition starts from, or None if virtual
+        "source_processor",
+
+        # list of (chip index, processor or None) of the destinations
+        "destinations",
+
+        # dict of chip index -> link to parent, or None for the source
+        "incoming_links",
+
+        # dict of chip index -> set of links to children
+        "out_going_links",
+
+        # dict of chip index -> set of destination processors
+        "out_going_processors"]
+
+    def __init__(
+            self, partition, bandwidth, source, source_processor,
+            destinations):
+        self.partition = partition
+        self.bandwidth = bandwidth
+        self.source = source
+        self.source_processor = source_processor
+        self.destinations = destinations
+        self.clear()
+
+    def clear(self):
+        """ Forget the chips and links of the route
+        """
+        self.incoming_links = OrderedDict()
+        self.out_going_links = dict()
+        self.out_going_processors = dict()
+
+    def links(self):
+        """ Iterate over the (chip index, link) of the links the route uses
+        """
+        for chip, links in self.out_going_links.items():
+            for link in links:
+                yield chip, link
+
+
+class CongestionAwareRouting(BasicDijkstraRouting):
+    """ A routing algorithm that routes each multicast partition of a machine\
+        graph along a tree of shortest paths, where the weight of each link\
+        rises as its bandwidth is used up by the partitions already routed.\
+        This spreads traffic over the machine rather than sending it all\
+        down the same links.
+
+    Each partition uses bw_per_route_entry times its traffic weight of the\
+    bandwidth of each link it goes down, out of max_bw per link.  The weight\
+    of a link is 1 + congestion_factor * (used bandwidth / max_bw), plus a\
+    history cost that grows on each rip-up-and-reroute pass in which the\
+    link is overloaded.  Passes end early when no link is overloaded.
+    """
+
+    __slots__ = [
+        # the bandwidth left on each link of each chip
+        "_bws",
+
+        # the history cost of each link of each chip
+        "_history",
+
+        # how much the weight of a link rises as its bandwidth is used
+        "_congestion_factor",
+
+        # the routes by partition
+        "_routes"
+    ]
+
+    CONGESTION_FACTOR = 4.0
+    HISTORY_INCREMENT = 1.0
+
+    def __call__(self, placements, machine, machine_graph,
+                 bw_per_route_entry=BasicDijkstraRouting.BW_PER_ROUTE_ENTRY,
+                 max_bw=BasicDijkstraRouting.MAX_BW,
+                 congestion_factor=CONGESTION_FACTOR, n_reroute_passes=0,
+                 use_progress_bar=True):
+        """ Find routes for the multicast partitions of a placed graph
+
+        :param placements: The placements of the vertices
+        :type placements:\
+            :py:class:`pacman.model.placements.Placements`
+        :param machine: The machine through which the routes are to be found
+        :type machine: :py:class:`spinn_machine.Machine`
+        :param machine_graph: the machine_graph object
+        :type machine_graph:\
+            :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :param bw_per_route_entry: \
+            the bandwidth a partition of traffic weight 1 uses on each link
+        :type bw_per_route_entry: float
+        :param max_bw: the bandwidth of each link
+        :type max_bw: float
+        :param congestion_factor: \
+            how much the weight of a link rises as its bandwidth is used
+        :type congestion_factor: float
+        :param n_reroute_passes: \
+            the maximum number of rip-up-and-reroute passes over the\
+            partitions that use overloaded links
+        :type n_reroute_passes: int
+        :param use_progress_bar: whether to show a progress bar
+        :type use_progress_bar: bool
+        :return: \
+            The discovered routes, and the bandwidth used on each link by\
+            (x, y, link ID)
+        :rtype:\
+            tuple(:py:class:`pacman.model.routing_table_by_partition.MulticastRoutingTableByPartition`,\
+            dict(tuple(int, int, int), float))
+        :raise pacman.exceptions.PacmanRoutingException: \
+            If something goes wrong with the routing
+        """
+        # pylint: disable=too-many-arguments, arguments-differ
+        self._routing_paths = MulticastRoutingTableByPartition()
+        self._bw_per_route_entry = bw_per_route_entry
+        self._max_bw = max_bw
+        self._machine = machine
+        self._congestion_factor = congestion_factor
+        self._trees = OrderedDict()
+        self._tree_cache_size = 1
+
+        self._initiate_node_info(machine)
+        self._initiate_dijkstra_tables()
+        self._update_all_weights()
+        self._bws = [
+            [0.0 if neighbour == NO_CHIP else float(max_bw)
+             for neighbour in links]
+            for links in self._neighbours]
+        self._history = [[0.0] * len(links) for links in self._neighbours]
+
+        self._routes = [
+            self._partition_route(partition, placements, machine_graph)
+            for partition in machine_graph.outgoing_edge_partitions
+            if partition.traffic_type == EdgeTrafficType.MULTICAST]
+        self._routes = [route for route in self._routes if route is not None]
+
+        pb_factory = ProgressBar if use_progress_bar else DummyProgressBar
+        progress = pb_factory(
+            len(self._routes) * (n_reroute_passes + 1),
+            "Creating congestion aware routing entries")
+
+        to_route = self._routes
+        for reroute_pass in range(n_reroute_passes + 1):
+            for route in to_route:
+                self._route_partition(route)
+                progress.update()
+
+            # The routes of the last pass are kept even if links are still
+            # overloaded, so that every partition is routed
+            overloaded = self._overloaded_links()
+            if not overloaded or reroute_pass == n_reroute_passes:
+                break
+            to_route = [
+                route for route in self._routes
+                if any(link in overloaded for link in route.links())]
+            for route in to_route:
+                self._rip_up(route)
+            for chip, link in overloaded:
+                self._history[chip][link] += self.HISTORY_INCREMENT
+                self._set_link_weight(chip, link)
+        progress.end()
+
+        for route in self._routes:
+            self._add_entries(route)
+        link_loads = self._link_loads()
+        self._log_link_loads(link_loads)
+        return self._routing_paths, link_loads
+
+    def _partition_route(self, partition, placements, graph):
+        """ Set up the route of a partition, ready for routing
+
+        :rtype: _PartitionRoute or None
+        """
+        # pylint: disable=unused-argument
+        if not partition.n_edges:
+            return None
+        source = placements.get_placement_of_vertex(partition.pre_vertex)
+        destinations = list()
+        for edge in partition.edges:
+            dest = placements.get_placement_of_vertex(edge.post_vertex)
+            destinations.append((self._chip_index(dest.x, dest.y), dest.p))
+        return _PartitionRoute(
+            partition, self._bw_per_route_entry * partition.traffic_weight,
+            self._chip_index(source.x, source.y), source.p, destinations)
+
+    def _route_partition(self, route):
+        """ Route a partition along the shortest path tree from its source\
+            with the current link weights, and use up the bandwidth of the\
+            links it goes down
+
+        :param route: the route of the partition
+        :type route: _PartitionRoute
+        """
+        tree = self._get_shortest_path_tree(
+            route.source, set(chip for chip, _ in route.destinations))
+        route.incoming_links[route.source] = None
+        for chip, processor in route.destinations:
+            if processor is not None:
+                route.out_going_processors.setdefault(chip, set()).add(
+                    processor)
+
+            # Walk up the tree until reaching a chip already in the route
+            while chip not in route.incoming_links:
+                parent, link = tree.parents[chip]
+                route.incoming_links[chip] = link
+                route.out_going_links.setdefault(parent, set()).add(
+                    self._get_reverse_direction(link))
+                chip = parent
+
+        for chip, link in route.links():
+            self._bws[chip][link] -= route.bandwidth
+            self._set_link_weight(chip, link)
+
+    def _rip_up(self, route):
+        """ Remove the route of a partition, giving back the bandwidth of the\
+            links it went down
+
+        :param route: the route of the partition
+        :type route: _PartitionRoute
+        """
+        for chip, link in route.links():
+            self._bws[chip][link] += route.bandwidth
+            self._set_link_weight(chip, link)
+        route.clear()
+
+    def _set_link_weight(self, chip, link):
+        """ Update the weight of a link from its used bandwidth and history\
+            cost, dropping any cached shortest path trees
+
+        :param chip: the index of the chip the link is on
+        :param link: the ID of the link
+        """
+        used = 1.0 - self._bws[chip][link] / self._max_bw
+        self._weights[chip][link] = (
+            1.0 + self._history[chip][link] +
+            self._congestion_factor * used)
+        self._trees.clear()
+
+    def _overloaded_links(self):
+        """ Get the links whose bandwidth has been overused
+
+        :rtype: set(tuple(int, int))
+        """
+        return set(
+            (chip, link)
+            for chip, bws in enumerate(self._bws)
+            for link, bw in enumerate(bws)
+            if bw < 0 and self._neighbours[chip][link] != NO_CHIP)
+
+    def _add_entries(self, route):
+        """ Add the routing entries of the route of a partition
+
+        :param route: the route of the partition
+        :type route: _PartitionRoute
+        """
+        for chip, incoming_link in route.incoming_links.items():
+            incoming_processor = None
+            if chip == route.source:
+                incoming_processor = route.source_processor
+            entry = MulticastRoutingTableByPartitionEntry(
+                route.out_going_links.get(chip),
+                route.out_going_processors.get(chip),
+                incoming_processor, incoming_link)
+            self._routing_paths.add_path_entry(
+                entry, self._xs[chip], self._ys[chip], route.partition)
+
+    def _link_loads(self):
+        """ Get the bandwidth used on each link that has been used
+
+        :rtype: dict(tuple(int, int, int), float)
+        """
+        link_loads = OrderedDict()
+        for chip, bws in enumerate(self._bws):
+            for link, bw in enumerate(bws):
+                if (self._neighbours[chip][link] != NO_CHIP and
+                        bw < self._max_bw):
+                    link_loads[self._xs[chip], self._ys[chip], link] = \
+                        self._max_bw - bw
+        return link_loads
+
+    def _log_link_loads(self, link_loads):
+        if not link_loads:
+            return
+        max_load = max(link_loads.values())
+        n_overloaded = sum(
+            1 for load in link_loads.values() if load > self._max_bw)
+        logger.info(
+            "Routes use %d links with a maximum load of %f of %f",
+            len(link_loads), max_load, self._max_bw)
+        if n_overloaded:
+            logger.warning(
+                "%d links have been given more than their bandwidth of %f",
+                n_overloaded, self._max_bw)
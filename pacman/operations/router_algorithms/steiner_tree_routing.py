@@ -0,0 +1,291 @@
+from spinn_utilities.progress_bar import ProgressBar, DummyProgressBar
+
+# pacman imports
+from pacman.exceptions import PacmanRoutingException
+from pacman.model.graphs.common import EdgeTrafficType
+from pacman.model.routing_table_by_partition import \
+    MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry
+from pacman.utilities.utility_objs import MachineTopology
+from pacman.utilities.utility_calls import forked_map
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
+
+# general imports
+from collections import deque, OrderedDict
+from six.moves import zip
+
+
+class SteinerTreeRouting(object):
+    """ A routing algorithm that routes each multicast partition along a\
+        single tree that shares branches between its destinations, in the\
+        spirit of the Neighbour Exploring Routing (NER) algorithm of rig.
+
+    The destination chips of a partition are added to the tree in order of\
+    their distance in hops from the source.  Each is joined to the chip of\
+    the tree nearest to it, along a shortest path of working links found by\
+    a breadth first search out from the destination; this greedily keeps\
+    down the number of routers that the tree touches, and so the number of\
+    routing table entries.
+
+    As each partition is routed on its own, the partitions can be shared out\
+    between a number of forked processes, which inherit the topology of the\
+    machine rather than copying it.  The entries found are merged in the\
+    order of the partitions, so the result is the same as routing them all\
+    in one process.
+    """
+
+    __slots__ = [
+        # the view of the machine being routed over
+        "_topology",
+
+        # the index of the chip at the other end of each link of each chip
+        "_neighbours",
+
+        # list for each chip of the (chip, link) of links that lead to it
+        "_predecessors",
+
+        # the coordinates of each chip by index
+        "_xs",
+        "_ys",
+
+        # for each chip, the generation of the last search that reached it
+        "_stamps",
+
+        # the generation of the current search
+        "_generation",
+
+        # the routes found
+        "_routing_paths"
+    ]
+
+    # The number of chunks of partitions per process when routing in parallel
+    CHUNKS_PER_PROCESS = 4
+
+    def __call__(self, placements, machine, machine_graph,
+                 use_progress_bar=True, n_processes=1):
+        """ Find routes for the multicast partitions of a placed graph
+
+        :param placements: The placements of the vertices
+        :type placements:\
+            :py:class:`pacman.model.placements.Placements`
+        :param machine: The machine through which the routes are to be found
+        :type machine: :py:class:`spinn_machine.Machine`
+        :param machine_graph: the machine_graph object
+        :type machine_graph:\
+            :py:class:`pacman.model.graphs.machine.MachineGraph`
+        :param use_progress_bar: whether to show a progress bar
+        :type use_progress_bar: bool
+        :param n_processes: the number of processes to route in
+        :type n_processes: int
+        :return: The discovered routes
+        :rtype:\
+            :py:class:`pacman.model.routing_table_by_partition.MulticastRoutingTableByPartition`
+        :raise pacman.exceptions.PacmanRoutingException: \
+            If something goes wrong with the routing
+        """
+        self._routing_paths = MulticastRoutingTableByPartition()
+        self._topology = MachineTopology.of(machine)
+        self._neighbours = self._topology.neighbours.tolist()
+        self._xs = self._topology.xs.tolist()
+        self._ys = self._topology.ys.tolist()
+        self._predecessors = [list() for _ in self._neighbours]
+        for chip, links in enumerate(self._neighbours):
+            for link, neighbour in enumerate(links):
+                if neighbour != NO_CHIP:
+                    self._predecessors[neighbour].append((chip, link))
+        self._stamps = [0] * len(self._neighbours)
+        self._generation = 0
+
+        partitions = [
+            partition for partition in machine_graph.outgoing_edge_partitions
+            if partition.traffic_type == EdgeTrafficType.MULTICAST]
+        chunk_size = max(1, -(-len(partitions) // (
+            max(1, n_processes) * self.CHUNKS_PER_PROCESS)))
+
+        # The chunks are given by their range of indices, as the partitions
+        # themselves would be copied going to other processes
+        chunks = [(start, min(start + chunk_size, len(partitions)))
+                  for start in range(0, len(partitions), chunk_size)]
+
+        pb_factory = ProgressBar if use_progress_bar else DummyProgressBar
+        progress = pb_factory(
+            len(chunks), "Creating Steiner tree routing entries")
+
+        def find_trees(chunk):
+            start, end = chunk
+            return [self._find_tree(partition, placements)
+                    for partition in partitions[start:end]]
+
+        for (start, end), trees in progress.over(zip(
+                chunks, forked_map(find_trees, chunks, n_processes))):
+            for partition, tree in zip(partitions[start:end], trees):
+                self._add_entries(partition, tree)
+        return self._routing_paths
+
+    def _chip_index(self, x, y):
+        """ Get the index of a chip in the topology of the machine
+
+        :param x: the x-coordinate of the chip
+        :param y: the y-coordinate of the chip
+        :rtype: int
+        :raise PacmanRoutingException: if there is no such chip
+        """
+        index = self._topology.index_of(x, y)
+        if index == NO_CHIP:
+            raise PacmanRoutingException(
+                "There is no chip at ({}, {}) to route to or from".format(
+                    x, y))
+        return index
+
+    def _next_generation(self):
+        """ Start a new search, so that no chip is marked as reached
+        """
+        self._generation += 1
+        return self._generation
+
+    def _find_tree(self, partition, placements):
+        """ Find a tree along which to route a partition from its source to\
+            all its destinations
+
+        :param partition: the partition to route
+        :type partition:\
+            :py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`
+        :param placements: the placements of the vertices
+        :type placements: :py:class:`pacman.model.placements.Placements`
+        :return: for each chip of the tree, the index of the chip, the links\
+            and processors to send to, and the processor or link that\
+            packets come in from
+        :rtype: list(tuple(int, set(int), set(int), int, int))
+        """
+        source_placement = placements.get_placement_of_vertex(
+            partition.pre_vertex)
+        source = self._chip_index(source_placement.x, source_placement.y)
+
+        # Find the destination chips and the processors on them
+        processors = OrderedDict()
+        for edge in partition.edges:
+            dest = placements.get_placement_of_vertex(edge.post_vertex)
+            chip_processors = processors.setdefault(
+                self._chip_index(dest.x, dest.y), set())
+            if dest.p is not None:
+                chip_processors.add(dest.p)
+        if not processors:
+            return []
+
+        # incoming_links maps each chip of the tree to the link to its parent
+        # (None for the source); out_going_links maps each chip of the tree
+        # to the links to its children
+        incoming_links = OrderedDict([(source, None)])
+        out_going_links = dict()
+        for dest in self._by_distance(source, processors):
+            if dest not in incoming_links:
+                self._connect(dest, incoming_links, out_going_links)
+
+        return [
+            (chip, out_going_links.get(chip), processors.get(chip),
+             source_placement.p if chip == source else None, incoming_link)
+            for chip, incoming_link in incoming_links.items()]
+
+    def _add_entries(self, partition, tree):
+        """ Add the routing entries of the tree of a partition
+
+        :param partition: the partition routed
+        :type partition:\
+            :py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`
+        :param tree: the tree found by _find_tree
+        """
+        for chip, links, processors, incoming_processor, incoming_link in \
+                tree:
+            entry = MulticastRoutingTableByPartitionEntry(
+                links, processors, incoming_processor, incoming_link)
+            self._routing_paths.add_path_entry(
+                entry, self._xs[chip], self._ys[chip], partition)
+
+    def _by_distance(self, source, dests):
+        """ Sort chips by their distance in hops from a source chip, using a\
+            breadth first search out from the source
+
+        :param source: the index of the source chip
+        :param dests: the indices of the chips to sort, in the order to use\
+            for chips at the same distance
+        :return: the indices of the chips, nearest first
+        :rtype: list(int)
+        :raise PacmanRoutingException: \
+            if a chip cannot be reached from the source
+        """
+        generation = self._next_generation()
+        stamps = self._stamps
+        neighbours = self._neighbours
+        to_find = set(dests)
+        distances = dict()
+        stamps[source] = generation
+        queue = deque([(source, 0)])
+        while queue and len(distances) < len(to_find):
+            chip, distance = queue.popleft()
+            if chip in to_find:
+                distances[chip] = distance
+            for neighbour in neighbours[chip]:
+                if neighbour != NO_CHIP and stamps[neighbour] != generation:
+                    stamps[neighbour] = generation
+                    queue.append((neighbour, distance + 1))
+        if len(distances) < len(to_find):
+            missing = next(dest for dest in dests if dest not in distances)
+            raise PacmanRoutingException(
+                "Could not find a route from ({}, {}) to ({}, {})".format(
+                    self._xs[source], self._ys[source],
+                    self._xs[missing], self._ys[missing]))
+
+        # sorted is stable, so chips at the same distance stay in order
+        return sorted(dests, key=distances.get)
+
+    def _connect(self, dest, incoming_links, out_going_links):
+        """ Join a chip to the nearest chip of a tree, along a shortest path\
+            found by a breadth first search back along the links that lead\
+            to the chip
+
+        :param dest: the index of the chip to join to the tree
+        :param incoming_links: \
+            the link to the parent of each chip of the tree, updated with the\
+            new chips
+        :param out_going_links: \
+            the links to the children of each chip of the tree, updated with\
+            the new links
+        """
+        generation = self._next_generation()
+        stamps = self._stamps
+        predecessors = self._predecessors
+
+        # children maps each chip reached to (child chip, link to child)
+        children = dict()
+        stamps[dest] = generation
+        queue = deque([dest])
+        while queue:
+            chip = queue.popleft()
+            if chip in incoming_links:
+                break
+            for predecessor, link in predecessors[chip]:
+                if stamps[predecessor] != generation:
+                    stamps[predecessor] = generation
+                    children[predecessor] = (chip, link)
+                    queue.append(predecessor)
+        else:
+            # The destination was checked to be reachable from the source,
+            # so it must be reachable from the tree
+            raise PacmanRoutingException(
+                "Could not find a route to ({}, {})".format(
+                    self._xs[dest], self._ys[dest]))
+
+        # Walk from the tree chip found down to the destination
+        while chip != dest:
+            child, link = children[chip]
+            out_going_links.setdefault(chip, set()).add(link)
+            incoming_links[child] = self._get_reverse_direction(link)
+            chip = child
+
+    @staticmethod
+    def _get_reverse_direction(link):
+        """ Get the direction of the link back along a link
+
+        :param link: the ID of the link
+        :rtype: int
+        """
+        return (link + 3) % 6
@@ -27,12 +27,25 @@ class BasicRoutingTableGenerator(object):
             partitions_in_table = routing_table_by_partitions.\
                 get_entries_for_router(chip.x, chip.y)
             if partitions_in_table:
-                routing_tables.add_routing_table(self._create_routing_table(
+                routing_tables.add_routing_table(self.create_routing_table(
                     chip, partitions_in_table, routing_infos))
 
         return routing_tables
 
-    def _create_routing_table(self, chip, partitions_in_table, routing_infos):
+    def create_routing_table(self, chip, partitions_in_table, routing_infos):
+        """ Create the routing table of one chip
+
+        :param chip: The chip to create the table of
+        :type chip: :py:class:`spinn_machine.Chip`
+        :param partitions_in_table: The entries of the chip by partition
+        :type partitions_in_table: dict(\
+            :py:class:`pacman.model.graphs.AbstractOutgoingEdgePartition`,\
+            :py:class:`pacman.model.routing_table_by_partition.MulticastRoutingTableByPartitionEntry`)
+        :param routing_infos: The keys and masks of the partitions
+        :type routing_infos:\
+            :py:class:`pacman.model.routing_info.RoutingInfo`
+        :rtype: :py:class:`pacman.model.routing_tables.MulticastRoutingTable`
+        """
         table = MulticastRoutingTable(chip.x, chip.y)
         for partition in partitions_in_table:
             r_info = routing_infos.get_routing_info_from_partition(partition)
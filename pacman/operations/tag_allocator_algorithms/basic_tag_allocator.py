@@ -19,11 +19,19 @@ class BasicTagAllocator(object):
 
     __slots__ = []
 
-    def __call__(self, machine, placements):
+    def __call__(self, machine, placements, resource_tracker=None):
         """ See :py:meth:`AbstractTagAllocatorAlgorithm.allocate_tags`
+
+        :param resource_tracker: A tracker of the resources of the machine\
+            to fork and allocate the tags with, or None to make a new one
+        :type resource_tracker: \
+            :py:class:`pacman.utilities.utility_objs.ResourceTracker`
         """
 
-        resource_tracker = ResourceTracker(machine)
+        if resource_tracker is None:
+            resource_tracker = ResourceTracker(machine)
+        else:
+            resource_tracker = resource_tracker.fork()
 
         # Keep track of ports allocated to reverse IP tags and tags that still
         # need a port to be allocated
@@ -4,15 +4,33 @@ A collection of methods which support partitioning algorithms.
 
 from pacman.model.constraints.partitioner_constraints\
     import AbstractPartitionerConstraint, SameAtomsAsVertexConstraint
+from pacman.model.abstract_classes import AbstractSlicesConnect
+from pacman.model.graphs.impl import EdgeBlock
 
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.ordered_set import OrderedSet
 from pacman.exceptions import PacmanPartitionException
 
 
-def generate_machine_edges(machine_graph, graph_mapper, application_graph):
+def generate_machine_edges(
+        machine_graph, graph_mapper, application_graph,
+        use_edge_blocks=False):
     """ Generate the machine edges for the vertices in the graph
 
+    The machine edges of each application partition starting at a machine\
+    vertex are added to the machine graph together, and the constraints of\
+    the application partition are added once to the machine partition.  No\
+    machine edge is made between slices that an application edge that is an\
+    :py:class:`pacman.model.abstract_classes.AbstractSlicesConnect` says\
+    cannot connect.
+
+    With edge blocks, the machine edges between all the slices of each\
+    other application edge are added as a single\
+    :py:class:`pacman.model.graphs.impl.EdgeBlock`, so that each is only\
+    made when it is first asked for.  The partitions of the machine graph\
+    are then in the order of the application partitions rather than of the\
+    machine vertices.
+
     :param machine_graph: the machine graph to add edges to
     :type machine_graph:\
         :py:class:`pacman.model.graphs.machine.MachineGraph`
@@ -22,7 +40,13 @@ def generate_machine_edges(machine_graph, graph_mapper, application_graph):
     :param application_graph: the application graph to work with
     :type application_graph:\
         :py:class:`pacman.model.graphs.application.ApplicationGraph`
+    :param use_edge_blocks: Whether to add the edges in blocks
+    :type use_edge_blocks: bool
     """
+    if use_edge_blocks:
+        _generate_machine_edge_blocks(
+            machine_graph, graph_mapper, application_graph)
+        return
 
     # start progress bar
     progress = ProgressBar(
@@ -33,29 +57,101 @@ def generate_machine_edges(machine_graph, graph_mapper, application_graph):
 
         # For each out edge of the parent vertex...
         vertex = graph_mapper.get_application_vertex(source_vertex)
+        source_slice = graph_mapper.get_slice(source_vertex)
         application_outgoing_partitions = application_graph.\
             get_outgoing_edge_partitions_starting_at_vertex(vertex)
         for application_partition in application_outgoing_partitions:
+            machine_edges = list()
             for application_edge in application_partition.edges:
-                # create new partitions
-                for dest_vertex in graph_mapper.get_machine_vertices(
-                        application_edge.post_vertex):
+                dest_vertices = graph_mapper.get_machine_vertices(
+                    application_edge.post_vertex)
+                if isinstance(application_edge, AbstractSlicesConnect):
+                    dest_vertices = [
+                        dest_vertex for dest_vertex in dest_vertices
+                        if application_edge.could_connect(
+                            source_slice, graph_mapper.get_slice(dest_vertex))]
+
+                # create new edges
+                label = "machine_edge_for{}".format(application_edge.label)
+                for dest_vertex in dest_vertices:
                     machine_edge = application_edge.create_machine_edge(
-                        source_vertex, dest_vertex,
-                        "machine_edge_for{}".format(application_edge.label))
-                    machine_graph.add_edge(
-                        machine_edge, application_partition.identifier)
-
-                    # add constraints from the application partition
-                    machine_partition = machine_graph.\
-                        get_outgoing_edge_partition_starting_at_vertex(
-                            source_vertex, application_partition.identifier)
-                    machine_partition.add_constraints(
-                        application_partition.constraints)
+                        source_vertex, dest_vertex, label)
+                    machine_edges.append(machine_edge)
 
                     # update mapping object
                     graph_mapper.add_edge_mapping(
                         machine_edge, application_edge)
+            if not machine_edges:
+                continue
+            machine_graph.add_edges(
+                machine_edges, application_partition.identifier)
+
+            # add constraints from the application partition
+            machine_partition = machine_graph.\
+                get_outgoing_edge_partition_starting_at_vertex(
+                    source_vertex, application_partition.identifier)
+            machine_partition.add_constraints(
+                application_partition.constraints)
+
+
+def _generate_machine_edge_blocks(
+        machine_graph, graph_mapper, application_graph):
+    """ Generate the machine edges for the vertices in the graph, adding\
+        the edges between the slices of each application edge as a block
+    """
+    progress = ProgressBar(
+        application_graph.n_outgoing_edge_partitions,
+        "Partitioning graph edges")
+    for application_partition in progress.over(
+            application_graph.outgoing_edge_partitions):
+        source_vertices = graph_mapper.get_machine_vertices(
+            application_partition.pre_vertex)
+        for application_edge in application_partition.edges:
+            dest_vertices = graph_mapper.get_machine_vertices(
+                application_edge.post_vertex)
+            create_edge = _machine_edge_maker(application_edge, graph_mapper)
+
+            if isinstance(application_edge, AbstractSlicesConnect):
+                # Not all the slices connect, so add the edges that might
+                for source_vertex in source_vertices:
+                    source_slice = graph_mapper.get_slice(source_vertex)
+                    machine_graph.add_edges([
+                        create_edge(source_vertex, dest_vertex)
+                        for dest_vertex in dest_vertices
+                        if application_edge.could_connect(
+                            source_slice, graph_mapper.get_slice(dest_vertex))
+                    ], application_partition.identifier)
+            else:
+                edge_block = EdgeBlock(
+                    source_vertices, dest_vertices, create_edge,
+                    application_edge.traffic_type)
+                machine_graph.add_edge_block(
+                    edge_block, application_partition.identifier)
+                graph_mapper.add_edge_block_mapping(
+                    edge_block, application_edge)
+
+        # add constraints from the application partition
+        for source_vertex in source_vertices:
+            machine_partition = machine_graph.\
+                get_outgoing_edge_partition_starting_at_vertex(
+                    source_vertex, application_partition.identifier)
+            if machine_partition is not None:
+                machine_partition.add_constraints(
+                    application_partition.constraints)
+
+
+def _machine_edge_maker(application_edge, graph_mapper):
+    """ Get a function that makes the machine edge of an application edge\
+        between two machine vertices, and maps it to the application edge
+    """
+    label = "machine_edge_for{}".format(application_edge.label)
+
+    def create_edge(source_vertex, dest_vertex):
+        machine_edge = application_edge.create_machine_edge(
+            source_vertex, dest_vertex, label)
+        graph_mapper.add_edge_mapping(machine_edge, application_edge)
+        return machine_edge
+    return create_edge
 
 
 def get_remaining_constraints(vertex):
@@ -7,6 +7,7 @@ from rig.place_and_route.constraints import \
 from rig.place_and_route.routing_tree import RoutingTree
 from rig.routing_table import Routes
 from six import iteritems, itervalues
+import numpy
 
 from pacman.model.constraints.placer_constraints\
     import ChipAndCoreConstraint, RadialPlacementFromChipConstraint
@@ -21,6 +22,8 @@ from pacman.model.placements import Placement, Placements
 from pacman.model.routing_table_by_partition import \
     MulticastRoutingTableByPartition, MulticastRoutingTableByPartitionEntry
 from pacman.utilities.constants import EDGES
+from pacman.utilities.utility_objs import MachineTopology
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
 
 # A lookup from link name (string) to Links enum entry.
 LINK_LOOKUP = {l.name: l for l in Links}
@@ -40,19 +43,6 @@ _SUPPORTED_VIRTUAL_VERTEX_TYPES = (
     AbstractFPGAVertex, AbstractSpiNNakerLinkVertex)
 
 
-def _is_dead(machine, chip, link_id):
-    router = chip.router
-    if not router.is_link(link_id):
-        return True
-    link = router.get_link(link_id)
-    if not machine.is_chip_at(
-            link.destination_x, link.destination_y):
-        return True
-    dest_chip = machine.get_chip_at(
-        link.destination_x, link.destination_y)
-    return dest_chip.virtual
-
-
 def convert_to_rig_machine(machine):
 
     chip_resources = dict()
@@ -61,42 +51,46 @@ def convert_to_rig_machine(machine):
     chip_resources['sram'] = CHIP_HOMOGENEOUS_SRAM
     chip_resources["router_entries"] = ROUTER_HOMOGENEOUS_ENTRIES
     chip_resources['tags'] = CHIP_HOMOGENEOUS_TAGS
-    LINKS = range(0, ROUTER_MAX_NUMBER_OF_LINKS)
+
+    topology = MachineTopology.of(machine)
+    xs = topology.xs.tolist()
+    ys = topology.ys.tolist()
+    virtual = topology.virtual
+    index_grid = topology.index_grid
+
+    # write dead chips; virtual chips are dead as far as rig is concerned
+    real_chips = (index_grid != NO_CHIP) & ~virtual[index_grid]
+    dead_chips = set(zip(*(
+        coords.tolist() for coords in numpy.nonzero(~real_chips))))
+
+    # write dead links; links of real chips that don't go to a real chip
+    neighbours = topology.neighbours
+    dead = ((neighbours == NO_CHIP) | virtual[neighbours]) & \
+        ~virtual[:, numpy.newaxis]
+    dead_links = set(
+        (xs[chip], ys[chip], LINK_LOOKUP[EDGES(link_id).name.lower()])
+        for chip, link_id in zip(*(
+            indices.tolist() for indices in numpy.nonzero(dead))))
 
     # handle exceptions
-    dead_chips = list()
-    dead_links = list()
     chip_resource_exceptions = list()
+    for index in numpy.nonzero(~virtual)[0].tolist():
+        chip = machine.get_chip_at(xs[index], ys[index])
+
+        # Fix the number of processors when there are less
+        resource_exceptions = dict()
+        n_processors = len([
+            processor for processor in chip.processors])
+        if n_processors < CHIP_HOMOGENEOUS_CORES:
+            resource_exceptions["cores"] = n_processors
+
+        # Add tags if Ethernet chip
+        if chip.ip_address is not None:
+            resource_exceptions["tags"] = len(chip.tag_ids)
 
-    # write dead chips
-    for x_coord in range(0, machine.max_chip_x + 1):
-        for y_coord in range(0, machine.max_chip_y + 1):
-            if (not machine.is_chip_at(x_coord, y_coord) or
-                    machine.get_chip_at(x_coord, y_coord).virtual):
-                dead_chips.append([x_coord, y_coord])
-                continue
-            chip = machine.get_chip_at(x_coord, y_coord)
-
-            # write dead links
-            for link_id in LINKS:
-                if _is_dead(machine, chip, link_id):
-                    dead_links.append([x_coord, y_coord, "{}".format(
-                        EDGES(link_id).name.lower())])
-
-            # Fix the number of processors when there are less
-            resource_exceptions = dict()
-            n_processors = len([
-                processor for processor in chip.processors])
-            if n_processors < CHIP_HOMOGENEOUS_CORES:
-                resource_exceptions["cores"] = n_processors
-
-            # Add tags if Ethernet chip
-            if chip.ip_address is not None:
-                resource_exceptions["tags"] = len(chip.tag_ids)
-
-            if resource_exceptions:
-                chip_resource_exceptions.append(
-                    (x_coord, y_coord, resource_exceptions))
+        if resource_exceptions:
+            chip_resource_exceptions.append(
+                (chip.x, chip.y, resource_exceptions))
 
     return Machine(
         width=machine.max_chip_x + 1,
@@ -108,10 +102,8 @@ def convert_to_rig_machine(machine):
                     resource, chip_resources[resource])
                 for resource in chip_resources}
             for x, y, r in chip_resource_exceptions},
-        dead_chips=set((x, y) for x, y in dead_chips),
-        dead_links=set(
-            (x, y, LINK_LOOKUP[link])
-            for x, y, link in dead_links))
+        dead_chips=dead_chips,
+        dead_links=dead_links)
 
 
 def convert_to_rig_graph(machine_graph):
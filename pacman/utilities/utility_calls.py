@@ -2,7 +2,13 @@ from pacman.exceptions import PacmanInvalidParameterException
 from pacman.exceptions import PacmanValueError
 
 import hashlib
+import multiprocessing
 import numpy
+import os
+
+# The function being mapped by forked_map; worker processes inherit this
+# when they are forked, so it does not need to be picklable
+_forked_function = None
 
 
 def locate_constraints_of_type(constraints, constraint_type):
@@ -173,3 +179,48 @@ def ident(object):  # @ReservedAssignment
     :rtype: str
     """
     return str(id(object))
+
+
+def _call_forked_function(item):
+    return _forked_function(item)
+
+
+def forked_map(function, items, n_processes):
+    """ Apply a function to each of a list of items, sharing the items out\
+        between a number of forked processes.
+
+    The function (and anything it refers to) is inherited by the processes\
+    when they are forked, so it need not be picklable and large read-only\
+    structures are shared rather than copied; the items and results are\
+    pickled.  Changes made by the function to the state it refers to are\
+    *not* seen by the calling process.  If n_processes is less than 2, or\
+    processes cannot be forked, the function is applied in this process.
+
+    :param function: the function to apply to each item
+    :param items: the items to apply the function to
+    :type items: list
+    :param n_processes: the number of processes to use
+    :type n_processes: int
+    :return: the results of the function, in the order of the items, each\
+        yielded as soon as it and those before it are ready
+    :rtype: iterable
+    """
+    global _forked_function
+    if n_processes < 2 or len(items) < 2 or not hasattr(os, "fork"):
+        for item in items:
+            yield function(item)
+        return
+    try:
+        context = multiprocessing.get_context("fork")
+    except AttributeError:
+        # Python 2 always forks where it can
+        context = multiprocessing
+    _forked_function = function
+    pool = context.Pool(min(n_processes, len(items)))
+    try:
+        for result in pool.imap(_call_forked_function, items):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+        _forked_function = None
@@ -1,5 +1,11 @@
+from .allocation_policy import AllocationPolicy
+from .core_allocation_policy import CoreAllocationPolicy
 from .field import Field
 from .flexi_field import FlexiField
+from .machine_topology import MachineTopology
+from .resource_model_cache import ResourceModelCache
 from .resource_tracker import ResourceTracker
 
-__all__ = ["Field", "FlexiField", "ResourceTracker"]
+__all__ = ["AllocationPolicy", "CoreAllocationPolicy", "Field",
+           "FlexiField", "MachineTopology", "ResourceModelCache",
+           "ResourceTracker"]
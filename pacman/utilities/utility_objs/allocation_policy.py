@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class AllocationPolicy(Enum):
+    """ How a resource tracker chooses the chip on which to allocate\
+        resources that are not constrained to a chip or board
+    """
+
+    #: The first chip, in the order given to the tracker, that fits
+    FIRST_FIT = 0
+
+    #: The chip with the least SDRAM available that fits, to pack tightly
+    BEST_FIT = 1
+
+    #: The chip with the most SDRAM available, to spread the use of SDRAM
+    WORST_FIT = 2
+
+    #: The first chip that fits on the board with the most processors\
+    #: available, to spread the load over the boards
+    BOARD_BALANCED = 3
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class CoreAllocationPolicy(Enum):
+    """ How a resource tracker chooses the core on a chip on which to\
+        allocate resources that are not constrained to a core
+    """
+
+    #: The free core with the lowest ID
+    LOWEST_ID = 0
+
+    #: The free core with the most DTCM and then CPU cycles available, and\
+    #: then the lowest ID, so that cores that differ are used best first
+    MOST_RESOURCES = 1
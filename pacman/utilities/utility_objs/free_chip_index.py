@@ -0,0 +1,312 @@
+from sortedcollections import SortedList
+
+#: The value of a position in the index that holds no chip
+NOT_FREE = float("-inf")
+
+
+class FreeChipIndex(object):
+    """ An ordered set of chips, each with a value giving how much of some\
+        resource is free on it, that can quickly find the chips in order\
+        with at least a given value.
+
+    The values are held at the leaves of a tree in which each node holds\
+    the largest value below it, so finding the next chip with at least a\
+    given value takes time logarithmic in the number of chips.  As in an\
+    ordered set, a chip that is added goes after those already present, and\
+    adding a chip that is already present leaves it where it is.
+
+    The index can also keep the chips sorted by value, so that they can be\
+    found in order of value, smallest or largest first.
+
+    If given an undo log, each change appends to the log a tuple of a\
+    function and its arguments which undoes the change; calling these in\
+    reverse order puts the index back as it was.
+    """
+
+    __slots__ = [
+        # The chip at each position, or None if the chip has been removed
+        "_keys",
+
+        # The position of each chip by key
+        "_positions",
+
+        # The number of leaves of the tree
+        "_capacity",
+
+        # The tree of values, with the root at 1, the children of node i at
+        # 2i and 2i + 1, and the value of the chip at position p at
+        # _capacity + p
+        "_tree",
+
+        # Sorted list of (value, position) of the chips, or None if the chips
+        # are not kept sorted by value
+        "_by_value",
+
+        # The list to append undo actions to, or None if not recording
+        "_undo_log"
+    ]
+
+    def __init__(self, keys_and_values=(), sort_by_value=False):
+        """
+        :param keys_and_values: The chips to start with, in order, and their\
+            values
+        :type keys_and_values: iterable(tuple(tuple(int, int), float))
+        :param sort_by_value: Whether to keep the chips sorted by value
+        :type sort_by_value: bool
+        """
+        self._undo_log = None
+        self._by_value = SortedList() if sort_by_value else None
+        self._rebuild(list(keys_and_values))
+
+    def set_undo_log(self, undo_log):
+        """ Set the list to which to append actions that undo changes
+
+        :param undo_log: the list, or None to stop recording
+        :type undo_log: list(tuple(callable, tuple)) or None
+        """
+        self._undo_log = undo_log
+
+    def copy(self):
+        """ Make a copy of the index, which does not record changes
+
+        :rtype: FreeChipIndex
+        """
+        index = FreeChipIndex.__new__(FreeChipIndex)
+        index._keys = list(self._keys)
+        index._positions = dict(self._positions)
+        index._capacity = self._capacity
+        index._tree = list(self._tree)
+        index._by_value = None
+        if self._by_value is not None:
+            index._by_value = SortedList(self._by_value)
+        index._undo_log = None
+        return index
+
+    def _rebuild(self, keys_and_values):
+        """ Rebuild the index with the given chips, leaving space to add as\
+            many again
+
+        :param keys_and_values: The chips, in order, and their values
+        :type keys_and_values: list(tuple(tuple(int, int), float))
+        """
+        if self._undo_log is not None:
+            # The rebuild makes new structures, so the old ones can be kept
+            self._undo_log.append((self._restore, (
+                self._keys, self._positions, self._capacity, self._tree,
+                self._by_value)))
+        self._capacity = 1
+        while self._capacity < 2 * len(keys_and_values):
+            self._capacity *= 2
+        self._keys = [key for key, _ in keys_and_values]
+        self._positions = dict(
+            (key, position) for position, key in enumerate(self._keys))
+        self._tree = [NOT_FREE] * (2 * self._capacity)
+        self._tree[self._capacity:self._capacity + len(keys_and_values)] = [
+            value for _, value in keys_and_values]
+        for node in range(self._capacity - 1, 0, -1):
+            self._tree[node] = max(
+                self._tree[2 * node], self._tree[2 * node + 1])
+        if self._by_value is not None:
+            self._by_value = SortedList(
+                (value, position)
+                for position, (_, value) in enumerate(keys_and_values))
+
+    def _restore(self, keys, positions, capacity, tree, by_value):
+        """ Put back the structures from before a rebuild
+        """
+        self._keys = keys
+        self._positions = positions
+        self._capacity = capacity
+        self._tree = tree
+        self._by_value = by_value
+
+    def _set(self, position, value):
+        """ Set the value at a position, updating the nodes above it
+        """
+        node = self._capacity + position
+        if self._undo_log is not None:
+            self._undo_log.append((self._set, (position, self._tree[node])))
+        if self._by_value is not None:
+            if self._tree[node] != NOT_FREE:
+                self._by_value.remove((self._tree[node], position))
+            if value != NOT_FREE:
+                self._by_value.add((value, position))
+        self._tree[node] = value
+        node //= 2
+        while node:
+            largest = max(self._tree[2 * node], self._tree[2 * node + 1])
+            if self._tree[node] == largest:
+                break
+            self._tree[node] = largest
+            node //= 2
+
+    def add(self, key, value=0):
+        """ Add a chip after those already present, or update its value if\
+            it is already present
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :param value: The amount free on the chip
+        :type value: float
+        """
+        if key in self._positions:
+            self._set(self._positions[key], value)
+            return
+        if len(self._keys) == self._capacity:
+            self._rebuild([
+                (k, self._tree[self._capacity + position])
+                for position, k in enumerate(self._keys) if k is not None])
+        self._positions[key] = len(self._keys)
+        self._keys.append(key)
+        if self._undo_log is not None:
+            self._undo_log.append((self._remove_last, ()))
+        self._set(self._positions[key], value)
+
+    def _remove_last(self):
+        """ Remove the chip at the last position
+        """
+        del self._positions[self._keys.pop()]
+
+    def _put(self, key, position):
+        """ Put a chip back at a position from which it was removed
+        """
+        self._keys[position] = key
+        self._positions[key] = position
+
+    def discard(self, key):
+        """ Remove a chip if it is present
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        """
+        position = self._positions.pop(key, None)
+        if position is not None:
+            self._keys[position] = None
+            if self._undo_log is not None:
+                self._undo_log.append((self._put, (key, position)))
+            self._set(position, NOT_FREE)
+
+    def set_value(self, key, value):
+        """ Set the value of a chip if it is present
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :param value: The amount free on the chip
+        :type value: float
+        """
+        position = self._positions.get(key)
+        if position is not None:
+            self._set(position, value)
+
+    def value(self, key):
+        """ Get the value of a chip
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :rtype: float
+        :raise KeyError: If the chip is not present
+        """
+        return self._tree[self._capacity + self._positions[key]]
+
+    def largest_value(self):
+        """ Get the largest value of any chip
+
+        :return: the value, or NOT_FREE if there are no chips
+        :rtype: float
+        """
+        return self._tree[1]
+
+    def largest(self):
+        """ Get the first chip with the largest value
+
+        :return: The (x, y) coordinates of the chip, or None if there are no\
+            chips
+        :rtype: tuple(int, int) or None
+        """
+        if self._tree[1] == NOT_FREE:
+            return None
+        return self._keys[self._find(0, self._tree[1])]
+
+    def _find(self, start, minimum):
+        """ Find the first position at or after start with at least the\
+            given value
+
+        :return: The position, or None if there is no such position
+        :rtype: int or None
+        """
+        if start >= self._capacity:
+            return None
+        tree = self._tree
+        node = self._capacity + start
+
+        # Climb until reaching a node to the right with a large enough value
+        while tree[node] < minimum:
+            while node & 1:
+                node //= 2
+            if not node:
+                return None
+            node += 1
+
+        # Descend to the leftmost large enough leaf below the node
+        while node < self._capacity:
+            node *= 2
+            if tree[node] < minimum:
+                node += 1
+        return node - self._capacity
+
+    def at_least(self, minimum):
+        """ Iterate, in order, over the chips with at least a given value.\
+            Values may be changed and chips removed while iterating, but\
+            chips must not be added.
+
+        :param minimum: The smallest value of the chips to find
+        :type minimum: float
+        :rtype: iterable(tuple(int, int))
+        """
+        position = self._find(0, minimum)
+        while position is not None:
+            yield self._keys[position]
+            position = self._find(position + 1, minimum)
+
+    def ascending(self, minimum):
+        """ Iterate over the chips with at least a given value, smallest\
+            value first, and in order for the same value.  The index must\
+            be kept sorted by value, and must not be changed while iterating.
+
+        :param minimum: The smallest value of the chips to find
+        :type minimum: float
+        :rtype: iterable(tuple(int, int))
+        """
+        for _, position in self._by_value.irange((minimum, )):
+            yield self._keys[position]
+
+    def descending(self, minimum):
+        """ Iterate over the chips with at least a given value, largest\
+            value first, and in order for the same value.  The index must\
+            be kept sorted by value, and must not be changed while iterating.
+
+        :param minimum: The smallest value of the chips to find
+        :type minimum: float
+        :rtype: iterable(tuple(int, int))
+        """
+        by_value = self._by_value
+        end = len(by_value)
+        while end:
+            value = by_value[end - 1][0]
+            if value < minimum:
+                return
+
+            # The chips with the same value are in order between start and end
+            start = by_value.bisect_left((value, ))
+            for index in range(start, end):
+                yield self._keys[by_value[index][1]]
+            end = start
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        return (key for key in self._keys if key is not None)
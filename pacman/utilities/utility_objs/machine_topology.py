@@ -0,0 +1,265 @@
+from collections import OrderedDict
+import numpy
+
+from pacman.utilities.constants import EDGES
+
+#: The value in the neighbour array of a link that does not exist
+NO_CHIP = -1
+
+
+class MachineTopology(object):
+    """ A compact, array-backed view of the chips of a machine and the links\
+        between them.
+
+    Each chip is given a dense index, in the order of the chips of the\
+    machine.  The links of the chips are held as an array of shape\
+    (n_chips, 6), giving for each link of each chip the index of the chip\
+    at the other end, or NO_CHIP if there is no working link to a chip of\
+    the machine.  Per-link weight and bandwidth arrays of the same shape give\
+    the starting values of these for routers; these arrays are read-only,\
+    so algorithms that change them must work on a copy.
+    """
+
+    __slots__ = [
+        # the machine this is a view of
+        "_machine",
+
+        # the number of chips in the machine when the view was built
+        "_n_chips",
+
+        # the number of links of the routers of the machine when the view
+        # was built
+        "_n_router_links",
+
+        # the x-coordinate of each chip by index
+        "_xs",
+
+        # the y-coordinate of each chip by index
+        "_ys",
+
+        # the index of each chip by [x, y], or NO_CHIP if there is no chip
+        "_index_grid",
+
+        # whether each chip is virtual by index
+        "_virtual",
+
+        # the index of the chip at the other end of each link of each chip
+        "_neighbours",
+
+        # a bitmask for each chip of which of its links are working
+        "_links_alive",
+
+        # the starting weight of each link of each chip
+        "_weights",
+
+        # the starting bandwidth of each link of each chip
+        "_bandwidths"
+    ]
+
+    #: The starting bandwidth of each working link
+    DEFAULT_BANDWIDTH = 250
+
+    # The number of views kept by of()
+    _CACHE_SIZE = 4
+
+    # The most recently used views by id of machine, so that algorithms run
+    # one after the other on the same machine share the view rather than each
+    # building their own; as each view refers to its machine, the id of a
+    # machine cannot be reused while its view is kept
+    _cached = OrderedDict()
+
+    def __init__(self, machine, bandwidth=DEFAULT_BANDWIDTH):
+        """
+        :param machine: The machine to build the view of
+        :type machine: :py:class:`spinn_machine.Machine`
+        :param bandwidth: The starting bandwidth of each working link
+        :type bandwidth: float
+        """
+        self._machine = machine
+        chips = list(machine.chips)
+        self._n_chips = len(chips)
+        self._n_router_links = self._count_router_links(chips)
+        n_links = len(EDGES)
+
+        self._xs = numpy.array([chip.x for chip in chips], dtype="int32")
+        self._ys = numpy.array([chip.y for chip in chips], dtype="int32")
+        self._virtual = numpy.array(
+            [chip.virtual for chip in chips], dtype="bool")
+        self._index_grid = numpy.full(
+            (machine.max_chip_x + 1, machine.max_chip_y + 1), NO_CHIP,
+            dtype="int32")
+        self._index_grid[self._xs, self._ys] = numpy.arange(
+            self._n_chips, dtype="int32")
+
+        self._neighbours = numpy.full(
+            (self._n_chips, n_links), NO_CHIP, dtype="int32")
+        for index, chip in enumerate(chips):
+            for link in chip.router.links:
+                self._neighbours[index, link.source_link_id] = \
+                    self.index_of(link.destination_x, link.destination_y)
+
+        alive = self._neighbours != NO_CHIP
+        self._links_alive = numpy.packbits(
+            alive[:, ::-1], axis=1).ravel() >> (8 - n_links)
+        self._weights = numpy.where(alive, 1.0, float("inf"))
+        self._bandwidths = numpy.where(alive, float(bandwidth), 0.0)
+        for array in (self._xs, self._ys, self._virtual, self._index_grid,
+                      self._neighbours, self._links_alive, self._weights,
+                      self._bandwidths):
+            array.flags.writeable = False
+
+    @staticmethod
+    def _count_router_links(chips):
+        return sum(len(chip.router) for chip in chips)
+
+    @classmethod
+    def of(cls, machine):
+        """ Get the view of a machine, reusing a recent view of the machine\
+            if the machine has not had chips or links added since.
+
+        As a machine only ever has chips and links added, a change is seen\
+        by counting these; a link replaced by another with the same ID on the\
+        same router is not seen, so a new view must be built directly after\
+        doing this.
+
+        :param machine: The machine to get the view of
+        :type machine: :py:class:`spinn_machine.Machine`
+        :rtype: :py:class:`MachineTopology`
+        """
+        topology = cls._cached.pop(id(machine), None)
+        if (topology is None or topology.n_chips != machine.n_chips or
+                topology._n_router_links !=
+                cls._count_router_links(machine.chips)):
+            topology = cls(machine)
+        cls._cached[id(machine)] = topology
+        while len(cls._cached) > cls._CACHE_SIZE:
+            cls._cached.popitem(last=False)
+        return topology
+
+    @property
+    def machine(self):
+        """ The machine this is a view of
+
+        :rtype: :py:class:`spinn_machine.Machine`
+        """
+        return self._machine
+
+    @property
+    def n_chips(self):
+        """ The number of chips in the view
+        """
+        return self._n_chips
+
+    @property
+    def xs(self):
+        """ The x-coordinate of each chip, by index
+
+        :rtype: numpy.ndarray(int32)
+        """
+        return self._xs
+
+    @property
+    def ys(self):
+        """ The y-coordinate of each chip, by index
+
+        :rtype: numpy.ndarray(int32)
+        """
+        return self._ys
+
+    @property
+    def virtual(self):
+        """ Whether each chip is virtual, by index
+
+        :rtype: numpy.ndarray(bool)
+        """
+        return self._virtual
+
+    @property
+    def index_grid(self):
+        """ The index of each chip by [x, y], or NO_CHIP where there is no\
+            chip
+
+        :rtype: numpy.ndarray(int32)
+        """
+        return self._index_grid
+
+    @property
+    def neighbours(self):
+        """ The index of the chip at the other end of each link of each chip,\
+            or NO_CHIP where there is no working link, with shape\
+            (n_chips, 6)
+
+        :rtype: numpy.ndarray(int32)
+        """
+        return self._neighbours
+
+    @property
+    def links_alive(self):
+        """ A bitmask for each chip of its working links, in which bit n is\
+            set if link n is working
+
+        :rtype: numpy.ndarray(uint8)
+        """
+        return self._links_alive
+
+    @property
+    def weights(self):
+        """ The starting weight of each link of each chip; 1 for working\
+            links and infinity otherwise, with shape (n_chips, 6)
+
+        :rtype: numpy.ndarray(float64)
+        """
+        return self._weights
+
+    @property
+    def bandwidths(self):
+        """ The starting bandwidth of each link of each chip; 0 for links\
+            that are not working, with shape (n_chips, 6)
+
+        :rtype: numpy.ndarray(float64)
+        """
+        return self._bandwidths
+
+    def index_of(self, x, y):
+        """ Get the index of a chip
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :return: The index, or NO_CHIP if there is no such chip
+        :rtype: int
+        """
+        if 0 <= x < self._index_grid.shape[0] and \
+                0 <= y < self._index_grid.shape[1]:
+            return int(self._index_grid[x, y])
+        return NO_CHIP
+
+    def coordinates_of(self, index):
+        """ Get the coordinates of a chip
+
+        :param index: The index of the chip
+        :type index: int
+        :rtype: tuple(int, int)
+        """
+        return int(self._xs[index]), int(self._ys[index])
+
+    def is_chip_at(self, x, y):
+        """ Determine if there is a chip at the given coordinates
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :rtype: bool
+        """
+        return self.index_of(x, y) != NO_CHIP
+
+    def is_link_at(self, x, y, link):
+        """ Determine if a link of a chip is working and leads to another\
+            chip of the machine
+
+        :param x: The x-coordinate of the chip
+        :param y: The y-coordinate of the chip
+        :param link: The ID of the link
+        :rtype: bool
+        """
+        index = self.index_of(x, y)
+        return index != NO_CHIP and bool(
+            self._links_alive[index] & (1 << link))
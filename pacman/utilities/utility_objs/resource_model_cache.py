@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+
+class ResourceModelCache(object):
+    """ A memo of the resources used by slices of application vertices, so\
+        that partitioners asking again for the resources of the same slice\
+        do not have the vertex work them out again.
+
+    The resources are remembered by vertex and by the atoms of the slice;\
+    in size only mode, they are remembered by vertex and by the number of\
+    atoms of the slice, which is right only for vertices whose atoms all use\
+    the same resources.  The least recently used slices are forgotten when\
+    there are more than the maximum size.
+
+    The same resources may be returned for more than one request, so they\
+    must not be changed by the caller.
+    """
+
+    __slots__ = [
+        # The resources by key, least recently used first
+        "_resources",
+
+        # The most slices to remember, or None if there is no limit
+        "_max_size",
+
+        # True if the slices are remembered only by number of atoms
+        "_size_only",
+
+        # The number of requests that were answered from the memo
+        "_hits",
+
+        # The number of requests that had to be passed to the vertex
+        "_misses"
+    ]
+
+    def __init__(self, max_size=None, size_only=False):
+        """
+        :param max_size: The most slices to remember, or None for no limit;\
+            0 remembers none
+        :type max_size: int or None
+        :param size_only: Whether to remember the slices only by their\
+            number of atoms
+        :type size_only: bool
+        """
+        self._resources = OrderedDict()
+        self._max_size = max_size
+        self._size_only = size_only
+        self._hits = 0
+        self._misses = 0
+
+    def get_resources_used_by_atoms(self, vertex, vertex_slice):
+        """ Get the resources used by a slice of a vertex
+
+        :param vertex: The vertex to get the resources of
+        :type vertex:\
+            :py:class:`pacman.model.graphs.application.ApplicationVertex`
+        :param vertex_slice: The atoms to get the resources of
+        :type vertex_slice: :py:class:`pacman.model.graphs.common.Slice`
+        :rtype: :py:class:`pacman.model.resources.ResourceContainer`
+        """
+        if self._size_only:
+            key = (vertex, vertex_slice.n_atoms)
+        else:
+            key = (vertex, vertex_slice.lo_atom, vertex_slice.hi_atom)
+        resources = self._resources.pop(key, None)
+        if resources is None:
+            self._misses += 1
+            resources = vertex.get_resources_used_by_atoms(vertex_slice)
+        else:
+            self._hits += 1
+        if self._max_size is None or self._max_size > 0:
+            self._resources[key] = resources
+            if (self._max_size is not None and
+                    len(self._resources) > self._max_size):
+                self._resources.popitem(last=False)
+        return resources
+
+    def clear(self):
+        """ Forget all the slices, but keep the counts of hits and misses
+        """
+        self._resources.clear()
+
+    def add_counts(self, hits, misses):
+        """ Add to the counts of hits and misses, such as those of a copy of\
+            the memo used in another process
+
+        :param hits: The number of hits to add
+        :type hits: int
+        :param misses: The number of misses to add
+        :type misses: int
+        """
+        self._hits += hits
+        self._misses += misses
+
+    @property
+    def hits(self):
+        """ The number of requests that were answered from the memo
+
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """ The number of requests that had to be passed to the vertex
+
+        :rtype: int
+        """
+        return self._misses
+
+    def __len__(self):
+        return len(self._resources)
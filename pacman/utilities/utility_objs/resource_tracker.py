@@ -7,15 +7,30 @@ from pacman.model.resources import ResourceContainer, DTCMResource, \
 from pacman.utilities import utility_calls, constants
 from pacman.exceptions import PacmanInvalidParameterException, \
     PacmanValueError, PacmanException
+from pacman.utilities.utility_objs.allocation_policy import \
+    AllocationPolicy
+from pacman.utilities.utility_objs.core_allocation_policy import \
+    CoreAllocationPolicy
+from pacman.utilities.utility_objs.free_chip_index import FreeChipIndex
 
 from spinn_utilities.ordered_set import OrderedSet
 
-from collections import defaultdict
-from sortedcollections import ValueSortedDict
+from collections import defaultdict, OrderedDict
+from six import iteritems, itervalues
 
 
 class ResourceTracker(object):
     """ Tracks the usage of resources of a machine.
+
+    Changes to the tracker can be made tentatively by taking a savepoint;\
+    until the savepoint is committed, each change is recorded in an undo log\
+    so that rolling back to the savepoint undoes the changes made since in\
+    time proportional to their number, leaving the tracker exactly as it was\
+    (including the order in which chips will be chosen).
+
+    A tracker can also be forked in constant time; the fork shares the state\
+    of the chips and of the tags with the original until either changes it,\
+    when that tracker copies the state for itself.
     """
 
     __slots__ = [
@@ -67,10 +82,35 @@ class ResourceTracker(object):
         # board address
         "_ethernet_chips",
 
-        # Set of (x, y) tuples of coordinates of chips which have available
-        # processors
+        # Ordered set of (x, y) tuples of coordinates of chips which have
+        # available processors, indexed by the SDRAM available on them
         "_chips_available",
 
+        # How to choose the chip for unconstrained resources
+        "_allocation_policy",
+
+        # How to choose the core on a chip for unconstrained resources
+        "_core_allocation_policy",
+
+        # The board addresses, in the order of the Ethernet chips
+        "_boards",
+
+        # The (x, y) tuples of coordinates of the chips on each board,
+        # indexed by board address
+        "_board_chips",
+
+        # The address of the board of each chip, by (x, y) coordinates
+        "_chip_board",
+
+        # The number of cores available on the available chips of each board,
+        # indexed by board address
+        "_board_free_cores",
+
+        # Index of the chips of each board, in the order given by the
+        # machine, by the SDRAM available on them, or -1 if they have no
+        # processors available; indexed by board address
+        "_board_chips_available",
+
         # Number of cores preallocated on each chip (by x, y coordinates)
         "_n_cores_preallocated",
 
@@ -81,11 +121,40 @@ class ResourceTracker(object):
         "_real_chips_with_n_cores_available",
 
         # the number of virtual chips with the n cores currently available
-        "_virtual_chips_with_n_cores_available"
+        "_virtual_chips_with_n_cores_available",
+
+        # The number of available chips, and of cores available on them
+        "_n_free_chips",
+        "_n_free_cores",
 
+        # The number of tags available over all boards
+        "_n_free_tags",
+
+        # List of (function, arguments) which undo the changes made since the
+        # first savepoint, or None if there are no savepoints
+        "_undo_log",
+
+        # The savepoints not yet committed, earliest first
+        "_savepoints",
+
+        # True if the state of the chips might be shared with a fork
+        "_chips_shared",
+
+        # The (x, y) coordinates of the chips whose sets of available
+        # processor IDs are not shared with a fork, or None if none are
+        "_own_core_sets",
+
+        # The addresses of the boards whose indices of available chips are
+        # not shared with a fork, or None if none are
+        "_own_board_indices",
+
+        # True if the state of the tags might be shared with a fork
+        "_tags_shared"
     ]
 
-    def __init__(self, machine, chips=None, preallocated_resources=None):
+    def __init__(self, machine, chips=None, preallocated_resources=None,
+                 allocation_policy=AllocationPolicy.FIRST_FIT,
+                 core_allocation_policy=CoreAllocationPolicy.LOWEST_ID):
         """
         :param machine: The machine to track the usage of
         :type machine: :py:class:`spinn_machine.Machine`
@@ -95,12 +164,30 @@ class ResourceTracker(object):
             used, or to re-order the chips. Note also that on deallocation,\
             the order is no longer guaranteed.
         :type chips: iterable(tuple(int, int))
+        :param allocation_policy: How to choose the chip on which to allocate\
+            resources that are not constrained to a chip or board
+        :type allocation_policy: \
+            :py:class:`pacman.utilities.utility_objs.AllocationPolicy`
+        :param core_allocation_policy: How to choose the core on a chip on\
+            which to allocate resources that are not constrained to a core
+        :type core_allocation_policy: \
+            :py:class:`pacman.utilities.utility_objs.CoreAllocationPolicy`
         """
 
+        # Changes are not recorded until a savepoint is taken
+        self._undo_log = None
+        self._savepoints = list()
+
+        # Nothing is shared until the tracker is forked
+        self._chips_shared = False
+        self._tags_shared = False
+        self._own_core_sets = None
+        self._own_board_indices = None
+
         # The amount of SDRAM used by each chip,
         # indexed by the (x, y) tuple of coordinates of the chip
-        # Note that the values are negative to allow reverse-order sorting
-        self._sdram_tracker = ValueSortedDict()
+        # Note that the values are negative, starting from minus the size
+        self._sdram_tracker = dict()
         for chip in machine.chips:
             self._sdram_tracker[chip.x, chip.y] = -chip.sdram.size
 
@@ -150,9 +237,11 @@ class ResourceTracker(object):
         # (x, y) tuple of coordinates of Ethernet connected chip indexed by
         # board address
         self._ethernet_chips = dict()
+        self._n_free_tags = 0
         for chip in self._machine.ethernet_connected_chips:
             self._ethernet_chips[chip.ip_address] = (chip.x, chip.y)
             self._boards_with_ip_tags.add(chip.ip_address)
+            self._n_free_tags += len(chip.tag_ids)
 
         # set of resources that have been pre allocated and therefore need to
         # be taken account of when allocating resources
@@ -176,15 +265,57 @@ class ResourceTracker(object):
                 self._real_chips_with_n_cores_available[
                     chip.n_user_processors - pre_allocated] += 1
 
-        # Set of (x, y) tuples of coordinates of chips which have available
-        # processors
-        self._chips_available = OrderedSet()
+        # Ordered set of (x, y) tuples of coordinates of chips which have
+        # available processors, indexed by the SDRAM available on them
         if chips is None:
-            for x, y in machine.chip_coordinates:
-                self._chips_available.add((x, y))
-        else:
-            for x, y in chips:
-                self._chips_available.add((x, y))
+            chips = machine.chip_coordinates
+        self._allocation_policy = allocation_policy
+        self._core_allocation_policy = core_allocation_policy
+
+        # The chips of each board, and an index of them like that of the
+        # available chips, so that allocating on a board only looks at the
+        # chips of the board
+        self._boards = list()
+        self._board_chips = dict()
+        self._chip_board = dict()
+        self._board_chips_available = dict()
+        for eth_chip in self._machine.ethernet_connected_chips:
+            board_address = eth_chip.ip_address
+            board_chips = list(self._machine.get_chips_on_board(eth_chip))
+            self._boards.append(board_address)
+            self._board_chips[board_address] = frozenset(board_chips)
+            self._board_chips_available[board_address] = FreeChipIndex(
+                (key, self._free_sdram_value(key)) for key in board_chips)
+            for key in board_chips:
+                self._chip_board[key] = board_address
+        self._index_chips(chips)
+
+    def _index_chips(self, chips):
+        """ Make the ordered set of chips on which to allocate resources\
+            that are not constrained to a chip, and count the chips and\
+            cores available on them
+
+        :param chips: The chips, in order
+        :type chips: iterable(tuple(int, int))
+        """
+        self._chips_available = FreeChipIndex(sort_by_value=(
+            self._allocation_policy == AllocationPolicy.BEST_FIT or
+            self._allocation_policy == AllocationPolicy.WORST_FIT))
+        self._n_free_chips = 0
+        self._n_free_cores = 0
+        for key in chips:
+            self._chips_available.add(key, self._free_sdram_value(key))
+            n_cores = self._counted_cores(key)
+            if n_cores is not None:
+                self._n_free_chips += 1
+                self._n_free_cores += n_cores
+        self._board_free_cores = dict(
+            (board_address, 0) for board_address in self._boards)
+        for key in self._chips_available:
+            board_address = self._chip_board.get(key)
+            if board_address is not None:
+                self._board_free_cores[board_address] += \
+                    self._counted_cores(key) or 0
 
     def _convert_preallocated_resources(self, preallocated_resources):
         """ Allocates preallocated SDRAM and specific cores to the trackers.\
@@ -247,6 +378,222 @@ class ResourceTracker(object):
 
         return chip_to_arbitrary_core_requirement
 
+    def fork(self, chips=None):
+        """ Make a copy of the tracker.  The two trackers share their state\
+            until one of them changes it, when that one copies the state for\
+            itself; a fork that is only used to allocate tags never copies\
+            the state of the chips, for example.  The state of each chip\
+            and of each board is only copied when it is first changed, so\
+            the first change copies just the maps from chip to state, and\
+            the ordered set of available chips.
+
+        :param chips: If specified, the fork uses these chips, in this\
+            order, instead of those of this tracker, as with the chips\
+            given when making a tracker; this takes time in proportion to\
+            the number of chips, but no state of the chips is copied
+        :type chips: iterable(tuple(int, int))
+        :rtype: ResourceTracker
+        :raise PacmanException: \
+            If the tracker has savepoints that have not been committed
+        """
+        if self._savepoints:
+            raise PacmanException(
+                "Cannot fork a resource tracker with savepoints that have not"
+                " been committed")
+        fork = ResourceTracker.__new__(ResourceTracker)
+        for name in ResourceTracker.__slots__:
+            setattr(fork, name, getattr(self, name))
+        fork._savepoints = list()
+        self._chips_shared = fork._chips_shared = True
+        self._tags_shared = fork._tags_shared = True
+        self._own_core_sets = set()
+        self._own_board_indices = set()
+        fork._own_core_sets = set()
+        fork._own_board_indices = set()
+        if chips is not None:
+            # Chips with all their cores allocated are left out, as they
+            # would have been had the fork allocated the cores
+            fork._index_chips(
+                key for key in chips
+                if key not in self._core_tracker or
+                len(self._core_tracker[key]) >
+                self._n_cores_preallocated[key])
+        return fork
+
+    def _own_chips(self):
+        """ Copy the maps from chip to state if they might be shared with a\
+            fork, ready to change them; the state of each chip and board is\
+            copied by :py:meth:`_own_cores` and\
+            :py:meth:`_own_board_index`
+        """
+        if self._chips_shared:
+            self._chips_shared = False
+            self._sdram_tracker = dict(self._sdram_tracker)
+            self._core_tracker = dict(self._core_tracker)
+            self._chips_available = self._chips_available.copy()
+            self._chips_available.set_undo_log(self._undo_log)
+            self._board_chips_available = dict(self._board_chips_available)
+            self._board_free_cores = dict(self._board_free_cores)
+            self._chips_used = set(self._chips_used)
+            self._real_chips_with_n_cores_available = list(
+                self._real_chips_with_n_cores_available)
+            self._virtual_chips_with_n_cores_available = list(
+                self._virtual_chips_with_n_cores_available)
+
+    def _own_cores(self, key):
+        """ Copy the set of processor IDs available on a chip if it might\
+            be shared with a fork, ready to change it
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        """
+        self._own_chips()
+        if (self._own_core_sets is not None and
+                key not in self._own_core_sets):
+            self._own_core_sets.add(key)
+            if key in self._core_tracker:
+                self._core_tracker[key] = set(self._core_tracker[key])
+
+    def _own_board_index(self, board_address):
+        """ Copy the index of the available chips of a board if it might be\
+            shared with a fork, ready to change it
+
+        :param board_address: The address of the board
+        :type board_address: str
+        :return: The index
+        :rtype: :py:class:`pacman.utilities.utility_objs.free_chip_index.\
+            FreeChipIndex`
+        """
+        self._own_chips()
+        if (self._own_board_indices is not None and
+                board_address not in self._own_board_indices):
+            self._own_board_indices.add(board_address)
+            self._board_chips_available[board_address] = \
+                self._board_chips_available[board_address].copy()
+        return self._board_chips_available[board_address]
+
+    def _own_tags(self):
+        """ Copy the state of the tags if it might be shared with a fork,\
+            ready to change it
+        """
+        if self._tags_shared:
+            self._tags_shared = False
+            self._restore_tags(*self._tag_state())
+
+    def savepoint(self):
+        """ Take a savepoint, after which changes can be undone by rolling\
+            back to it.  Savepoints can be nested.
+
+        :return: the savepoint, to pass to rollback or commit
+        :rtype: int
+        """
+        if self._undo_log is None:
+            self._undo_log = list()
+            self._chips_available.set_undo_log(self._undo_log)
+        savepoint = len(self._undo_log)
+        self._savepoints.append(savepoint)
+        return savepoint
+
+    def rollback(self, savepoint):
+        """ Undo the changes made since a savepoint was taken.  The savepoint\
+            remains, so changes can be rolled back to it again; any\
+            savepoints taken after it are discarded.
+
+        :param savepoint: the savepoint to roll back to
+        :type savepoint: int
+        :raise PacmanInvalidParameterException: \
+            If the savepoint has been committed or discarded
+        """
+        self._check_savepoint(savepoint)
+        undo_log = self._undo_log
+
+        # Stop recording, so that undoing changes is not itself recorded
+        self._undo_log = None
+        self._chips_available.set_undo_log(None)
+        while len(undo_log) > savepoint:
+            undo, args = undo_log.pop()
+            undo(*args)
+        self._undo_log = undo_log
+        self._chips_available.set_undo_log(undo_log)
+        while self._savepoints[-1] != savepoint:
+            self._savepoints.pop()
+
+    def commit(self, savepoint):
+        """ Keep the changes made since a savepoint was taken, and discard\
+            the savepoint and any taken after it.  The changes can still be\
+            undone by rolling back to an earlier savepoint.
+
+        :param savepoint: the savepoint to commit
+        :type savepoint: int
+        :raise PacmanInvalidParameterException: \
+            If the savepoint has been committed or discarded
+        """
+        self._check_savepoint(savepoint)
+        while self._savepoints.pop() != savepoint:
+            pass
+        if not self._savepoints:
+            self._undo_log = None
+            self._chips_available.set_undo_log(None)
+
+    def _check_savepoint(self, savepoint):
+        if savepoint not in self._savepoints:
+            raise PacmanInvalidParameterException(
+                "savepoint", str(savepoint),
+                "The savepoint has been committed or discarded")
+
+    def _log(self, undo, *args):
+        """ Record how to undo a change if there is a savepoint
+
+        :param undo: the function that undoes the change
+        :param args: the arguments to call the function with
+        """
+        if self._undo_log is not None:
+            self._undo_log.append((undo, args))
+
+    def _change_tags(self):
+        """ Get ready to change the state of the tags, recording it if there\
+            is a savepoint, as changes to the tags are undone by restoring\
+            it.  There are few tags, so this is cheap.
+        """
+        self._own_tags()
+        if self._undo_log is not None:
+            self._undo_log.append((self._restore_tags, self._tag_state()))
+
+    def _tag_state(self):
+        """ Get a copy of the state of the tags, for _restore_tags
+        """
+        return (
+            dict((board_address, set(tags)) for board_address, tags in
+                 iteritems(self._tags_by_board)),
+            list(self._boards_with_ip_tags),
+            dict((key, set(tags)) for key, tags in
+                 iteritems(self._ip_tags_address_traffic)),
+            dict(self._address_and_traffic_ip_tag),
+            dict(self._ip_tags_strip_sdp_and_port),
+            set(self._reverse_ip_tag_listen_port),
+            dict(self._listen_port_reverse_ip_tag),
+            dict(self._n_ip_tag_allocations),
+            self._n_free_tags)
+
+    def _restore_tags(
+            self, tags_by_board, boards_with_ip_tags, ip_tags_address_traffic,
+            address_and_traffic_ip_tag, ip_tags_strip_sdp_and_port,
+            reverse_ip_tag_listen_port, listen_port_reverse_ip_tag,
+            n_ip_tag_allocations, n_free_tags):
+        """ Restore a state of the tags from _tag_state
+        """
+        # pylint: disable=too-many-arguments
+        self._tags_by_board = tags_by_board
+        self._boards_with_ip_tags = OrderedSet(boards_with_ip_tags)
+        self._ip_tags_address_traffic = defaultdict(set)
+        self._ip_tags_address_traffic.update(ip_tags_address_traffic)
+        self._address_and_traffic_ip_tag = address_and_traffic_ip_tag
+        self._ip_tags_strip_sdp_and_port = ip_tags_strip_sdp_and_port
+        self._reverse_ip_tag_listen_port = reverse_ip_tag_listen_port
+        self._listen_port_reverse_ip_tag = listen_port_reverse_ip_tag
+        self._n_ip_tag_allocations = n_ip_tag_allocations
+        self._n_free_tags = n_free_tags
+
     @staticmethod
     def check_constraints(
             vertices, additional_placement_constraints=None):
@@ -342,7 +689,84 @@ class ResourceTracker(object):
             projected_id = self._machine.get_chip_at(x, y).n_user_processors
         return projected_id > self._n_cores_preallocated[x, y]
 
-    def _get_usable_chips(self, chips, board_address):
+    def _free_sdram_value(self, key):
+        """ Get the value of a chip in the index of available chips; the\
+            SDRAM available on the chip if it has cores available, or -1\
+            otherwise
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :rtype: int
+        """
+        if not self._chip_available(*key):
+            return -1
+        return max(0, -self._sdram_tracker[key])
+
+    def _update_chip_available(self, key):
+        """ Update the indices of available chips after the resources of a\
+            chip have changed
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        """
+        value = self._free_sdram_value(key)
+        self._chips_available.set_value(key, value)
+        board_address = self._chip_board.get(key)
+        if board_address is not None:
+            board_index = self._own_board_index(board_address)
+            self._log(board_index.set_value, key, board_index.value(key))
+            board_index.set_value(key, value)
+
+    def _counted_cores(self, key):
+        """ Get the number of cores available on a chip, as counted in the\
+            totals of available chips and cores
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :return: The number of cores, or None if the chip is not available
+        :rtype: int or None
+        """
+        if key not in self._chips_available or not self._chip_available(*key):
+            return None
+        if key in self._core_tracker:
+            n_cores = len(self._core_tracker[key])
+        else:
+            n_cores = self._machine.get_chip_at(*key).n_user_processors
+        return n_cores - self._n_cores_preallocated[key]
+
+    def _update_counts(self, key, counted_before):
+        """ Update the totals of available chips and cores after the cores\
+            available on a chip have changed
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :param counted_before: What _counted_cores gave before the change
+        :type counted_before: int or None
+        """
+        counted = self._counted_cores(key)
+        if counted != counted_before:
+            self._change_counts(
+                self._chip_board.get(key),
+                (counted is not None) - (counted_before is not None),
+                (counted or 0) - (counted_before or 0))
+
+    def _change_counts(self, board_address, n_chips, n_cores):
+        """ Change the totals of available chips and cores
+
+        :param board_address: The board of the chip that changed, or None
+        :type board_address: str or None
+        :param n_chips: The change in the number of chips
+        :type n_chips: int
+        :param n_cores: The change in the number of cores
+        :type n_cores: int
+        """
+        self._n_free_chips += n_chips
+        self._n_free_cores += n_cores
+        if board_address is not None:
+            self._board_free_cores[board_address] += n_cores
+        self._log(self._change_counts, board_address, -n_chips, -n_cores)
+
+    def _get_usable_chips(self, chips, board_address, min_sdram=0):
         """ Get all chips that are available on a board given the constraints
 
         :param chips: iterable of tuples of (x, y) coordinates of chips to \
@@ -350,6 +774,9 @@ class ResourceTracker(object):
         :type chips: iterable(tuple(int, int))
         :param board_address: the board address to check for usable chips on
         :type board_address: str or None
+        :param min_sdram: the SDRAM that is needed; when chips is None,\
+            chips with less SDRAM available are skipped
+        :type min_sdram: int
         :return: iterable of tuples of (x, y) coordinates of usable chips
         :rtype: iterable(tuple(int, int))
         :raise PacmanInvalidParameterException:
@@ -358,19 +785,16 @@ class ResourceTracker(object):
             * When a non-existent chip is specified
             * When all the chips in the specified board have been used
         """
-        eth_chip = None
         if board_address is not None:
             if board_address not in self._ethernet_chips:
                 raise PacmanInvalidParameterException(
                     "board_address", str(board_address),
                     "Unrecognised board address")
-            eth_chip = self._machine.get_chip_at(
-                *self._ethernet_chips[board_address])
 
         if chips is not None:
             area_code = None
-            if eth_chip is not None:
-                area_code = set(self._machine.get_chips_on_board(eth_chip))
+            if board_address is not None:
+                area_code = self._board_chips[board_address]
             chip_found = False
             for (x, y) in chips:
                 if ((area_code is None or (x, y) in area_code) and
@@ -383,13 +807,43 @@ class ResourceTracker(object):
                     "{} and {}".format(chips, board_address),
                     "No valid chips found on the specified board")
         elif board_address is not None:
-            for (x, y) in self._machine.get_chips_on_board(eth_chip):
-                if self._chip_available(x, y):
-                    yield (x, y)
+            for key in self._board_chips_available[board_address].at_least(
+                    max(min_sdram, 0)):
+                yield key
+        elif self._allocation_policy == AllocationPolicy.BEST_FIT:
+            for key in self._chips_available.ascending(max(min_sdram, 0)):
+                yield key
+        elif self._allocation_policy == AllocationPolicy.WORST_FIT:
+            for key in self._chips_available.descending(max(min_sdram, 0)):
+                yield key
+        elif self._allocation_policy == AllocationPolicy.BOARD_BALANCED:
+            for key in self._get_board_balanced_chips(min_sdram):
+                yield key
         else:
-            for (x, y) in self._chips_available:
-                if self._chip_available(x, y):
-                    yield (x, y)
+            for key in self._chips_available.at_least(min_sdram):
+                yield key
+
+    def _get_board_balanced_chips(self, min_sdram):
+        """ Get the available chips with at least the given SDRAM, board by\
+            board starting with the board with the most cores available
+
+        :param min_sdram: the SDRAM that is needed
+        :type min_sdram: int
+        :rtype: iterable(tuple(int, int))
+        """
+        # sorted is stable, so boards with the same cores stay in order
+        for board_address in sorted(
+                self._boards,
+                key=lambda board: -self._board_free_cores[board]):
+            for key in self._board_chips_available[board_address].at_least(
+                    max(min_sdram, 0)):
+                if key in self._chips_available:
+                    yield key
+
+        # Any chips that are not on a board go last
+        for key in self._chips_available.at_least(min_sdram):
+            if key not in self._chip_board:
+                yield key
 
     @property
     def chips_available(self):
@@ -433,20 +887,39 @@ class ResourceTracker(object):
         return self._sdram_available(chip)
 
     def _best_core_available(self, chip):
-        """ Locate the best core available on a chip
+        """ Locate the best core available on a chip, which is the core that\
+            would be allocated next
 
         :param chip: The chip to check the resources of
         :type chip: :py:class:`spinn_machine.Chip`
         :return: The processor ID selected as the best on this chip
         """
-
-        # TODO: Check for the best core; currently assumes all are the same
         key = (chip.x, chip.y)
         if key not in self._core_tracker:
-            for processor in chip.processors:
-                if not processor.is_monitor:
-                    return processor.processor_id
-        return next(iter(self._core_tracker[key]))
+            return self._choose_core(chip, (
+                processor.processor_id for processor in chip.processors
+                if not processor.is_monitor))
+        return self._choose_core(chip, self._core_tracker[key])
+
+    def _choose_core(self, chip, processor_ids):
+        """ Choose a core from those available on a chip using the core\
+            allocation policy
+
+        :param chip: The chip to choose a core of
+        :type chip: :py:class:`spinn_machine.Chip`
+        :param processor_ids: The IDs of the processors available
+        :type processor_ids: iterable(int)
+        :return: The processor ID chosen
+        :rtype: int
+        """
+        if self._core_allocation_policy == \
+                CoreAllocationPolicy.MOST_RESOURCES:
+            def most_resources(processor_id):
+                processor = chip.get_processor_with_id(processor_id)
+                return (-processor.dtcm_available,
+                        -processor.cpu_cycles_available, processor_id)
+            return min(processor_ids, key=most_resources)
+        return min(processor_ids)
 
     def _is_core_available(self, chip, key, processor_id):
         """ Check if there is a core available on a given chip given the\
@@ -729,7 +1202,40 @@ class ResourceTracker(object):
         :type resources: \
             :py:class:`pacman.model.resources.ResourceContainer`
         """
-        self._sdram_tracker[chip.x, chip.y] += resources.sdram.get_value()
+        self._use_sdram((chip.x, chip.y), resources.sdram.get_value())
+        self._update_chip_available((chip.x, chip.y))
+
+    def _use_sdram(self, key, sdram):
+        """ Change the SDRAM used on a chip
+
+        :param key: The (x, y) coordinates of the chip
+        :type key: tuple(int, int)
+        :param sdram: The SDRAM to use, or to free if negative
+        :type sdram: int
+        """
+        self._own_chips()
+        self._log(self._sdram_tracker.__setitem__, key,
+                  self._sdram_tracker[key])
+        self._sdram_tracker[key] += sdram
+
+    def _count_chip_cores(self, chip, n_cores_before, n_cores_after):
+        """ Update the count of chips with each number of cores available\
+            after the number available on a chip has changed
+
+        :param chip: The chip
+        :type chip: :py:class:`spinn_machine.Chip`
+        :param n_cores_before: The number of cores available before
+        :type n_cores_before: int
+        :param n_cores_after: The number of cores available after
+        :type n_cores_after: int
+        """
+        if chip.virtual:
+            counts = self._virtual_chips_with_n_cores_available
+        else:
+            counts = self._real_chips_with_n_cores_available
+        counts[n_cores_before] -= 1
+        counts[n_cores_after] += 1
+        self._log(self._count_chip_cores, chip, n_cores_after, n_cores_before)
 
     def _allocate_core(self, chip, key, processor_id):
         """ Allocates a core on the given chip
@@ -741,31 +1247,30 @@ class ResourceTracker(object):
         :param processor_id: The ID of the processor to allocate
         :type processor_id: int
         """
+        self._own_cores(key)
+        counted_before = self._counted_cores(key)
         if key not in self._core_tracker:
             self._fill_in_core_tracker_for_chip(key, chip)
-        if processor_id is not None:
-            self._core_tracker[key].remove(processor_id)
-        else:
-            # TODO: Find a core that meets the resource requirements
-            processor_id = self._core_tracker[key].pop()
+            self._log(self._core_tracker.pop, key)
+        if processor_id is None:
+            processor_id = self._choose_core(chip, self._core_tracker[key])
+        self._core_tracker[key].remove(processor_id)
+        self._log(self._core_tracker[key].add, processor_id)
 
         # update number tracker
-        if chip.virtual:
-            self._virtual_chips_with_n_cores_available[
-                len(self._core_tracker[key])] -= 1
-            self._virtual_chips_with_n_cores_available[
-                len(self._core_tracker[key]) - 1] += 1
-        else:
-            self._real_chips_with_n_cores_available[
-                len(self._core_tracker[key])] -= 1
-            self._real_chips_with_n_cores_available[
-                len(self._core_tracker[key]) - 1] += 1
+        self._count_chip_cores(
+            chip, len(self._core_tracker[key]) + 1,
+            len(self._core_tracker[key]))
 
         if len(self._core_tracker[key]) == self._n_cores_preallocated[key]:
-            self._chips_available.remove(key)
+            self._chips_available.discard(key)
+        self._update_chip_available(key)
+        self._update_counts(key, counted_before)
 
         # update chip tracker
-        self._chips_used.add(key)
+        if key not in self._chips_used:
+            self._chips_used.add(key)
+            self._log(self._chips_used.remove, key)
 
         # return processor ID
         return processor_id
@@ -833,6 +1338,7 @@ class ResourceTracker(object):
         :param board_address: board address
         :return: tag ID allocated
         """
+        self._n_free_tags -= 1
         if tag_id is None:
             return self._tags_by_board[board_address].pop()
         self._tags_by_board[board_address].remove(tag_id)
@@ -854,6 +1360,7 @@ class ResourceTracker(object):
         if ip_tags is None or not ip_tags:
             return None
 
+        self._change_tags()
         allocations = list()
         for ip_tag in ip_tags:
 
@@ -923,6 +1430,7 @@ class ResourceTracker(object):
         if reverse_ip_tags is None or not reverse_ip_tags:
             return None
 
+        self._change_tags()
         allocations = list()
         for reverse_ip_tag in reverse_ip_tags:
             (board_address, tag) = self._allocate_tag(
@@ -978,6 +1486,132 @@ class ResourceTracker(object):
         return self.allocate_resources(resources, chips, p, board_address,
                                        ip_tags, reverse_ip_tags)
 
+    def allocate_constrained_resources_batch(
+            self, resource_and_constraint_list, chips=None, progress=None):
+        """ Attempts to use the given resources of the machine for each of a\
+            list of items, constrained by the placement constraints of each.\
+            The items with placement or tag constraints are allocated first,\
+            one at a time in the order given.  The other items are then put\
+            into groups by their SDRAM requirement, wherever they are in the\
+            list, and each group is allocated together, visiting each chip\
+            used once per group rather than once per item.  The groups are\
+            allocated in the order in which their first items are given.\
+            The result is the same as calling allocate_constrained_resources\
+            for each item in this order.
+
+        :param resource_and_constraint_list:\
+            A list of tuples of (resources, list of constraints) to allocate
+        :param chips: \
+            The optional list of (x, y) tuples of chip coordinates of chips\
+            that can be used. Note that any chips passed in previously will\
+            be ignored
+        :type chips: iterable(tuple(int, int))
+        :param progress: \
+            An optional progress bar to update as each item is allocated
+        :type progress: :py:class:`spinn_utilities.progress_bar.ProgressBar`
+        :return: list of the x and y coordinates of the used chip, the\
+            processor_id, and the IP tag and reverse IP tag allocation tuples\
+            for each item, in the order of the items given
+        :rtype: list(tuple(int, int, int, list(tuple(int, int)),\
+            list(tuple(int, int))))
+        :raise PacmanValueError: \
+            If the constraints of an item cannot be met given the\
+            current allocation of resources; the items allocated before it\
+            remain allocated
+        """
+        results = list()
+
+        # The unconstrained items by SDRAM requirement, as the resources
+        # of the first item and the indices of all the items
+        groups = OrderedDict()
+        for resources, constraints in resource_and_constraint_list:
+            (x, y, p) = self.get_chip_and_core(constraints, chips)
+            (board_address, ip_tags, reverse_ip_tags) = \
+                self.get_ip_tag_info(resources, constraints)
+            if (x is None and y is None and p is None and
+                    board_address is None and not ip_tags and
+                    not reverse_ip_tags):
+                sdram = resources.sdram.get_value()
+                if sdram not in groups:
+                    groups[sdram] = (resources, list())
+                groups[sdram][1].append(len(results))
+                results.append(None)
+                continue
+
+            allocation_chips = None
+            if x is not None and y is not None:
+                allocation_chips = [(x, y)]
+            results.append(self.allocate_resources(
+                resources, allocation_chips, p, board_address, ip_tags,
+                reverse_ip_tags))
+            if progress is not None:
+                progress.update()
+
+        for resources, indices in itervalues(groups):
+            allocations = self._allocate_resources_run(
+                resources, len(indices), progress)
+            for index, allocation in zip(indices, allocations):
+                results[index] = allocation
+        return results
+
+    def _allocate_resources_run(self, resources, n_items, progress=None):
+        """ Allocate the same resources, with no placement or tag\
+            constraints, a number of times, as if by calling\
+            allocate_resources for each
+
+        :param resources: The resources to be allocated for each item
+        :type resources:\
+            :py:class:`pacman.model.resources.ResourceContainer`
+        :param n_items: The number of items to allocate
+        :type n_items: int
+        :param progress: \
+            An optional progress bar to update as the items are allocated
+        :type progress: :py:class:`spinn_utilities.progress_bar.ProgressBar`
+        :return: The allocation of each item
+        :rtype: list(tuple(int, int, int, None, None))
+        :raise PacmanValueError: \
+            If there isn't a chip available that can take an allocation
+        """
+        results = list()
+        sdram = resources.sdram.get_value() if n_items else 0
+        while len(results) < n_items:
+
+            # The first chip that can take the resources takes as many of the
+            # items as it can, as the chips before it cannot take any more;
+            # this is so for first and best fit, but other policies might
+            # choose another chip once this one has been used
+            key = next(iter(self._get_usable_chips(None, None, sdram)), None)
+            n_fit = 0
+            if key is not None:
+                chip = self._machine.get_chip_at(*key)
+                free_sdram = self._sdram_available(chip)
+                if free_sdram >= sdram:
+                    n_fit = self._n_cores_available(chip, key, None)
+                    if sdram:
+                        n_fit = min(n_fit, free_sdram // sdram)
+                n_fit = min(n_fit, n_items - len(results))
+                if (self._allocation_policy !=
+                        AllocationPolicy.FIRST_FIT and
+                        self._allocation_policy !=
+                        AllocationPolicy.BEST_FIT):
+                    n_fit = min(n_fit, 1)
+            if not n_fit:
+                # Let allocate_resources deal with this one, raising an
+                # error if it cannot be allocated
+                results.append(self.allocate_resources(resources))
+                if progress is not None:
+                    progress.update()
+                continue
+
+            for _ in range(n_fit):
+                processor_id = self._allocate_core(chip, key, None)
+                results.append((chip.x, chip.y, processor_id, None, None))
+            self._use_sdram(key, sdram * n_fit)
+            self._update_chip_available(key)
+            if progress is not None:
+                progress.update(n_fit)
+        return results
+
     def allocate_constrained_group_resources(
             self, resource_and_constraint_list, chips=None):
         """ Allocates a group of cores on the same chip for these resources
@@ -1064,18 +1698,24 @@ class ResourceTracker(object):
             If there aren't chips available that can take the allocation.
         """
 
+        total_sdram = 0
+        for resources in group_resources:
+            total_sdram += resources.sdram.get_value()
+
         usable_chips = chips
         for ip_tags, reverse_ip_tags in zip(
                 group_ip_tags, group_reverse_ip_tags):
             usable_chips = self._get_usable_chips(usable_chips, board_address)
 
-        total_sdram = 0
-        for resources in group_resources:
-            total_sdram += resources.sdram.get_value()
+        # Skip straight past the chips without enough SDRAM where possible
+        candidate_chips = usable_chips
+        if chips is None:
+            candidate_chips = self._get_usable_chips(
+                None, board_address, total_sdram)
 
         # Find the first usable chip which fits all the group resources
         tried_chips = list()
-        for key in usable_chips:
+        for key in candidate_chips:
             (chip_x, chip_y) = key
             tried_chips.append(key)
             chip = self._machine.get_chip_at(chip_x, chip_y)
@@ -1119,8 +1759,14 @@ class ResourceTracker(object):
                     return results
 
         # If no chip is available, raise an exception
-        n_cores, n_chips, max_sdram, n_tags = self._available_resources(
-            tried_chips)
+        if chips is None and board_address is None:
+            n_cores, n_chips, max_sdram, n_tags = \
+                self._all_available_resources()
+        else:
+            if candidate_chips is not usable_chips:
+                tried_chips = usable_chips
+            n_cores, n_chips, max_sdram, n_tags = \
+                self._available_resources(tried_chips)
         raise PacmanValueError(
             "No resources available to allocate the given group resources"
             " within the given constraints:\n"
@@ -1160,7 +1806,8 @@ class ResourceTracker(object):
             If there isn't a chip available that can take the allocation.
         """
         # Find the first usable chip which fits the resources
-        for (chip_x, chip_y) in self._get_usable_chips(chips, board_address):
+        for (chip_x, chip_y) in self._get_usable_chips(
+                chips, board_address, resources.sdram.get_value()):
             chip = self._machine.get_chip_at(chip_x, chip_y)
             key = (chip_x, chip_y)
 
@@ -1179,12 +1826,15 @@ class ResourceTracker(object):
                         reverse_ip_tags_allocated)
 
         # If no chip is available, raise an exception
-        tried_chips = self._get_usable_chips(chips, board_address)
-        n_cores, n_chips, max_sdram, n_tags = \
-            self._available_resources(tried_chips)
-        all_chips = self._get_usable_chips(None, None)
         all_n_cores, all_n_chips, all_max_sdram, all_n_tags = \
-            self._available_resources(all_chips)
+            self._all_available_resources()
+        if chips is None and board_address is None:
+            n_cores, n_chips, max_sdram, n_tags = \
+                all_n_cores, all_n_chips, all_max_sdram, all_n_tags
+        else:
+            tried_chips = self._get_usable_chips(chips, board_address)
+            n_cores, n_chips, max_sdram, n_tags = \
+                self._available_resources(tried_chips)
         raise PacmanValueError(
             "No resources available to allocate the given resources"
             " within the given constraints:\n"
@@ -1210,7 +1860,6 @@ class ResourceTracker(object):
         n_cores = 0
         max_sdram = 0
         n_chips = 0
-        n_tags = 0
         for x, y in usable_chips:
             chip = self._machine.get_chip_at(x, y)
             if (x, y) in self._core_tracker:
@@ -1223,13 +1872,19 @@ class ResourceTracker(object):
             if sdram_available > max_sdram:
                 max_sdram = sdram_available
             n_chips += 1
-        for board_address in self._boards_with_ip_tags:
-            if board_address in self._tags_by_board:
-                n_tags += len(self._tags_by_board)
-            else:
-                eth_x, eth_y = self._ethernet_chips[board_address]
-                n_tags += len(self._machine.get_chip_at(eth_x, eth_y).tag_ids)
-        return n_cores, n_chips, max_sdram, n_tags
+        return n_cores, n_chips, max_sdram, self._n_free_tags
+
+    def _all_available_resources(self):
+        """ Describe how much of the various resource types are available\
+            on all the usable chips, as _available_resources does, but from\
+            totals kept up to date as resources are allocated.
+
+        :return: returns #cores, #chips, amount of SDRAM, #tags
+        :rtype: tuple(int,int,int,int)
+        """
+        return (self._n_free_cores, self._n_free_chips,
+                max(0, self._chips_available.largest_value()),
+                self._n_free_tags)
 
     def get_maximum_cores_available_on_a_chip(self):
         """ returns the number of available cores of a real chip with the \
@@ -1280,9 +1935,7 @@ class ResourceTracker(object):
                 raise PacmanInvalidParameterException(
                     "board_address", str(board_address),
                     "Unrecognised board address")
-            eth_chip = self._machine.get_chip_at(
-                *self._ethernet_chips[board_address])
-            area_code = set(self._machine.get_chips_on_board(eth_chip))
+            area_code = self._board_chips[board_address]
 
         (x, y, p) = self.get_chip_and_core(constraints)
         if x is not None and y is not None:
@@ -1306,7 +1959,10 @@ class ResourceTracker(object):
                 SDRAMResource(sdram_available),
                 CPUCyclesPerTickResource(max_cpu_available))
 
-        return self.get_maximum_resources_available(area_code)
+        if board_address is not None:
+            return self._maximum_resources_on(
+                self._board_chips_available[board_address].largest())
+        return self.get_maximum_resources_available()
 
     def get_maximum_resources_available(self, area_code=None):
         """ Get the maximum resources available
@@ -1315,23 +1971,38 @@ class ResourceTracker(object):
         :return: a resource which shows max resources available
         :rtype: pacman.model.resources.ResourceContainer
         """
-        # Go through the chips in order of sdram
-        for ((chip_x, chip_y),
-                sdram_available) in self._sdram_tracker.items():
+        # Find the available chip with the most SDRAM available
+        if area_code is None:
+            return self._maximum_resources_on(self._chips_available.largest())
+        key = None
+        for (chip_x, chip_y) in area_code:
             if self._chip_available(chip_x, chip_y) and (
-                    area_code is None or (chip_x, chip_y) in area_code):
-                chip = self._machine.get_chip_at(chip_x, chip_y)
-                best_processor_id = self._best_core_available(chip)
-                processor = chip.get_processor_with_id(best_processor_id)
-                max_dtcm_available = processor.dtcm_available
-                max_cpu_available = processor.cpu_cycles_available
-                return ResourceContainer(
-                    DTCMResource(max_dtcm_available),
-                    SDRAMResource(-sdram_available),
-                    CPUCyclesPerTickResource(max_cpu_available))
+                    key is None or self._sdram_tracker[chip_x, chip_y] <
+                    self._sdram_tracker[key]):
+                key = (chip_x, chip_y)
+        return self._maximum_resources_on(key)
+
+    def _maximum_resources_on(self, key):
+        """ Get the maximum resources available on a chip
+
+        :param key: The (x, y) coordinates of the chip, or None
+        :type key: tuple(int, int) or None
+        :return: the resources, or no resources if the chip is None or has\
+            no processors available
+        :rtype: pacman.model.resources.ResourceContainer
+        """
+        if key is None or not self._chip_available(*key):
+            return ResourceContainer()
 
-        # If nothing is available, return nothing
-        return ResourceContainer()
+        chip = self._machine.get_chip_at(*key)
+        best_processor_id = self._best_core_available(chip)
+        processor = chip.get_processor_with_id(best_processor_id)
+        max_dtcm_available = processor.dtcm_available
+        max_cpu_available = processor.cpu_cycles_available
+        return ResourceContainer(
+            DTCMResource(max_dtcm_available),
+            SDRAMResource(-self._sdram_tracker[key]),
+            CPUCyclesPerTickResource(max_cpu_available))
 
     def unallocate_resources(self, chip_x, chip_y, processor_id, resources,
                              ip_tags, reverse_ip_tags):
@@ -1353,29 +2024,31 @@ class ResourceTracker(object):
         :rtype: None
         """
 
+        self._own_cores((chip_x, chip_y))
+        counted_before = self._counted_cores((chip_x, chip_y))
         self._chips_available.add((chip_x, chip_y))
-        self._sdram_tracker[chip_x, chip_y] -= resources.sdram.get_value()
+        self._use_sdram((chip_x, chip_y), -resources.sdram.get_value())
 
         # update number tracker
-        if self._machine.get_chip_at(chip_x, chip_y).virtual:
-            self._virtual_chips_with_n_cores_available[
-                len(self._core_tracker[chip_x, chip_y])] -= 1
-            self._virtual_chips_with_n_cores_available[
-                len(self._core_tracker[chip_x, chip_y]) + 1] += 1
-        else:
-            self._real_chips_with_n_cores_available[
-                len(self._core_tracker[chip_x, chip_y])] -= 1
-            self._real_chips_with_n_cores_available[
-                len(self._core_tracker[chip_x, chip_y]) + 1] += 1
+        self._count_chip_cores(
+            self._machine.get_chip_at(chip_x, chip_y),
+            len(self._core_tracker[chip_x, chip_y]),
+            len(self._core_tracker[chip_x, chip_y]) + 1)
 
         self._core_tracker[chip_x, chip_y].add(processor_id)
+        self._log(self._core_tracker[chip_x, chip_y].remove, processor_id)
+        self._update_chip_available((chip_x, chip_y))
+        self._update_counts((chip_x, chip_y), counted_before)
 
         # check if chip used needs updating
         if (len(self._core_tracker[chip_x, chip_y]) ==
                 self._machine.get_chip_at(chip_x, chip_y).n_user_processors):
             self._chips_used.remove((chip_x, chip_y))
+            self._log(self._chips_used.add, (chip_x, chip_y))
 
         # Deallocate the IP tags
+        if ip_tags or reverse_ip_tags:
+            self._change_tags()
         if ip_tags is not None:
             for (board_address, tag, _, _) in ip_tags:
                 self._boards_with_ip_tags.add(board_address)
@@ -1388,6 +2061,7 @@ class ResourceTracker(object):
                     if not self._ip_tags_address_traffic[key]:
                         del self._ip_tags_address_traffic[key]
                     self._tags_by_board[board_address].add(tag)
+                    self._n_free_tags += 1
                     del self._ip_tags_strip_sdp_and_port[tag_key]
 
         # Deallocate the reverse IP tags
@@ -1395,6 +2069,7 @@ class ResourceTracker(object):
             for (board_address, tag) in reverse_ip_tags:
                 self._boards_with_ip_tags.add(board_address)
                 self._tags_by_board[board_address].add(tag)
+                self._n_free_tags += 1
                 port = self._listen_port_reverse_ip_tag.get(
                     (board_address, tag), None)
                 if port is not None:
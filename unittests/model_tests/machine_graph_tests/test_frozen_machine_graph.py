@@ -0,0 +1,173 @@
+import unittest
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.exceptions import PacmanConfigurationException
+from pacman.model.graphs.machine import \
+    FrozenMachineGraph, FrozenOutgoingEdgePartition, MachineEdge, \
+    MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import DictBasedMachinePartitionNKeysMap
+from pacman.operations.placer_algorithms import RadialPlacer
+from pacman.operations.router_algorithms import BasicDijkstraRouting
+from pacman.operations.routing_info_allocator_algorithms import \
+    BasicRoutingInfoAllocator
+
+
+class TestFrozenMachineGraph(unittest.TestCase):
+
+    def _make_graph(self, n_vertices):
+        graph = MachineGraph("foo")
+        vertices = [
+            SimpleMachineVertex(ResourceContainer(), str(i))
+            for i in range(n_vertices)]
+        graph.add_vertices(vertices)
+        for i, vertex in enumerate(vertices):
+            graph.add_edge(
+                MachineEdge(vertex, vertices[(i + 1) % n_vertices]), "next")
+            if i % 2 == 0:
+                graph.add_edge(
+                    MachineEdge(vertex, vertices[(i + 3) % n_vertices]),
+                    "other")
+        return graph, vertices
+
+    def test_same_as_graph(self):
+        graph, vertices = self._make_graph(10)
+        frozen = graph.freeze()
+        self.assertIsInstance(frozen, FrozenMachineGraph)
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertEqual(frozen.label, graph.label)
+        self.assertEqual(list(frozen.vertices), list(graph.vertices))
+        self.assertEqual(frozen.n_vertices, graph.n_vertices)
+        self.assertEqual(list(frozen.edges), list(graph.edges))
+        self.assertEqual(frozen.n_edges, 15)
+        self.assertEqual(
+            list(frozen.outgoing_edge_partitions),
+            list(graph.outgoing_edge_partitions))
+        for vertex in vertices:
+            self.assertEqual(
+                list(frozen.get_edges_starting_at_vertex(vertex)),
+                list(graph.get_edges_starting_at_vertex(vertex)))
+            self.assertEqual(
+                list(frozen.get_edges_ending_at_vertex(vertex)),
+                list(graph.get_edges_ending_at_vertex(vertex)))
+            self.assertEqual(
+                list(frozen.get_edges_ending_at_vertex_with_partition_name(
+                    vertex, "other")),
+                list(graph.get_edges_ending_at_vertex_with_partition_name(
+                    vertex, "other")))
+            self.assertEqual(
+                list(frozen.get_outgoing_edge_partitions_starting_at_vertex(
+                    vertex)),
+                list(graph.get_outgoing_edge_partitions_starting_at_vertex(
+                    vertex)))
+            partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+                vertex, "next")
+            frozen_partition = \
+                frozen.get_outgoing_edge_partition_starting_at_vertex(
+                    vertex, "next")
+            self.assertIsInstance(
+                frozen_partition, FrozenOutgoingEdgePartition)
+            self.assertIs(frozen_partition.partition, partition)
+            self.assertEqual(frozen_partition, partition)
+            self.assertEqual(hash(frozen_partition), hash(partition))
+            self.assertEqual(
+                frozen.get_outgoing_edge_partition_id(partition),
+                graph.get_outgoing_edge_partition_id(partition))
+            self.assertEqual(
+                frozen.get_n_edges_starting_at_vertex(vertex),
+                len(graph.get_edges_starting_at_vertex(vertex)))
+            self.assertEqual(
+                frozen.get_vertex_id(vertex), graph.get_vertex_id(vertex))
+        self.assertIsNone(
+            frozen.get_outgoing_edge_partition_starting_at_vertex(
+                vertices[1], "other"))
+
+        adjacency = frozen.get_adjacency()
+        self.assertIs(frozen.get_adjacency(), adjacency)
+        expected = graph.get_adjacency()
+        for name in ("row_starts", "sources", "targets", "partition_ids",
+                     "weights", "edge_ids"):
+            self.assertEqual(
+                list(getattr(adjacency, name)), list(getattr(expected, name)))
+
+    def test_cannot_change(self):
+        graph, vertices = self._make_graph(3)
+        frozen = graph.freeze()
+        with self.assertRaises(PacmanConfigurationException):
+            frozen.add_vertex(SimpleMachineVertex(ResourceContainer()))
+        with self.assertRaises(PacmanConfigurationException):
+            frozen.add_edge(MachineEdge(vertices[0], vertices[2]), "next")
+        partition = frozen.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[0], "other")
+        with self.assertRaises(PacmanConfigurationException):
+            partition.add_edge(MachineEdge(vertices[0], vertices[2]))
+
+        # Changing the graph does not change the frozen graph or its
+        # partitions
+        graph.add_edge(MachineEdge(vertices[0], vertices[2]), "other")
+        self.assertEqual(frozen.n_edges, 5)
+        self.assertEqual(len(graph.edges), 6)
+        self.assertEqual(partition.n_edges, 1)
+        self.assertEqual(len(partition.edges), 1)
+        self.assertEqual(partition.partition.n_edges, 2)
+        self.assertEqual(
+            len(frozen.get_edges_starting_at_vertex(vertices[0])), 2)
+
+    def test_adjacency_after_graph_changed(self):
+        graph = MachineGraph("foo")
+        vertices = [
+            SimpleMachineVertex(ResourceContainer(), str(i))
+            for i in range(3)]
+        graph.add_vertices(vertices)
+        graph.add_edge(MachineEdge(vertices[0], vertices[1]), "p")
+        graph.add_edge(MachineEdge(vertices[1], vertices[2]), "q")
+        frozen = graph.freeze()
+        graph.add_edge(MachineEdge(vertices[0], vertices[2]), "p")
+
+        adjacency = frozen.get_adjacency()
+        p = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[0], "p")
+        q = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[1], "q")
+        self.assertEqual(list(adjacency.sources), [
+            graph.get_vertex_id(vertices[0]),
+            graph.get_vertex_id(vertices[1])])
+        self.assertEqual(list(adjacency.targets), [
+            graph.get_vertex_id(vertices[1]),
+            graph.get_vertex_id(vertices[2])])
+        self.assertEqual(list(adjacency.partition_ids), [
+            graph.get_outgoing_edge_partition_id(p),
+            graph.get_outgoing_edge_partition_id(q)])
+
+    def test_pipeline(self):
+        graph, _ = self._make_graph(40)
+        frozen = graph.freeze()
+        machine = VirtualMachine(width=2, height=2)
+        n_keys_map = DictBasedMachinePartitionNKeysMap()
+        for partition in graph.outgoing_edge_partitions:
+            n_keys_map.set_n_keys_for_partition(partition, 1)
+
+        def run(machine_graph):
+            placements = RadialPlacer()(machine_graph, machine)
+            routing_tables = BasicDijkstraRouting()(
+                placements, machine, machine_graph)
+            routing_info = BasicRoutingInfoAllocator()(
+                machine_graph, placements, n_keys_map)
+            return (
+                sorted((p.vertex.label, p.x, p.y, p.p)
+                       for p in placements.placements),
+                sorted((x, y, tuple(sorted(entry.out_going_links)),
+                        tuple(sorted(entry.out_going_processors)))
+                       for x, y in routing_tables.get_routers()
+                       for entry in routing_tables.get_entries_for_router(
+                           x, y).values()),
+                sorted((info.partition.pre_vertex.label,
+                        info.partition.identifier, info.first_key)
+                       for info in routing_info))
+
+        self.assertEqual(run(frozen), run(graph))
+
+
+if __name__ == '__main__':
+    unittest.main()
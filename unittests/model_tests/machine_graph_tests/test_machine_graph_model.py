@@ -1,7 +1,10 @@
 # pacman imports
 from pacman.model.graphs.machine \
     import MachineEdge, MachineGraph, SimpleMachineVertex
-from pacman.exceptions import PacmanInvalidParameterException
+from pacman.model.graphs.common import GraphChangeType
+from pacman.model.graphs.impl import EdgeBlock
+from pacman.exceptions import \
+    PacmanInvalidParameterException, PacmanNotFoundError
 
 # general imports
 import unittest
@@ -130,6 +133,219 @@ class TestMachineGraphModel(unittest.TestCase):
             graph.add_vertices(vertices)
             graph.add_edges(edges, "bar")
 
+    def test_edge_block(self):
+        """
+        test that the edges of a block are only made when asked for, and
+        then once each
+        """
+        pre_vertices = [SimpleMachineVertex(None, "") for _ in range(3)]
+        post_vertices = [SimpleMachineVertex(None, "") for _ in range(4)]
+        made = list()
+
+        def create_edge(pre_vertex, post_vertex):
+            made.append((pre_vertex, post_vertex))
+            return MachineEdge(pre_vertex, post_vertex)
+
+        graph = MachineGraph("foo")
+        graph.add_vertices(pre_vertices + post_vertices)
+        edge_block = EdgeBlock(pre_vertices, post_vertices, create_edge)
+        graph.add_edge_block(edge_block, "bar")
+        partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+            pre_vertices[0], "bar")
+        self.assertEqual(partition.n_edges, 4)
+        self.assertEqual(len(made), 0)
+
+        outgoing = list(graph.get_edges_starting_at_vertex(pre_vertices[0]))
+        self.assertEqual(
+            [edge.post_vertex for edge in outgoing], post_vertices)
+        self.assertEqual(len(made), 4)
+        self.assertEqual(list(partition.edges), outgoing)
+
+        incoming = list(graph.get_edges_ending_at_vertex(post_vertices[1]))
+        self.assertEqual(
+            [edge.pre_vertex for edge in incoming], pre_vertices)
+        self.assertIs(incoming[0], outgoing[1])
+        self.assertEqual(len(made), 6)
+        self.assertEqual(edge_block.n_edges_made, 6)
+
+        self.assertEqual(len(graph.edges), 12)
+        self.assertEqual(len(made), 12)
+        self.assertEqual(len(set(made)), 12)
+
+    def test_edge_block_with_no_existing_post_vertex_in_graph(self):
+        """
+        test that adding a block of edges where a post vertex has not been
+        added to the machine graph causes an error
+        """
+        vertex = SimpleMachineVertex(None, "")
+        graph = MachineGraph("foo")
+        graph.add_vertex(vertex)
+        with self.assertRaises(PacmanInvalidParameterException):
+            graph.add_edge_block(EdgeBlock(
+                [vertex], [SimpleMachineVertex(None, "")], MachineEdge),
+                "bar")
+
+    def test_ids_and_adjacency(self):
+        """
+        test that the vertices, edges and partitions get dense ids, and
+        that the adjacency arrays hold the edges by pre-vertex
+        """
+        vertices = [SimpleMachineVertex(None, str(i)) for i in range(4)]
+        graph = MachineGraph("foo")
+        graph.add_vertices(vertices)
+        edges = [
+            MachineEdge(vertices[2], vertices[0], traffic_weight=3),
+            MachineEdge(vertices[0], vertices[1]),
+            MachineEdge(vertices[0], vertices[2], traffic_weight=2)]
+        graph.add_edge(edges[0], "bar")
+        graph.add_edges(edges[1:], "baz")
+        graph.add_vertex(vertices[0])
+
+        self.assertEqual(
+            [graph.get_vertex_id(vertex) for vertex in vertices],
+            [0, 1, 2, 3])
+        self.assertEqual(
+            [graph.get_edge_id(edge) for edge in edges], [0, 1, 2])
+        partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[0], "baz")
+        self.assertEqual(graph.get_outgoing_edge_partition_id(partition), 1)
+        with self.assertRaises(PacmanNotFoundError):
+            graph.get_vertex_id(SimpleMachineVertex(None, ""))
+
+        adjacency = graph.get_adjacency()
+        self.assertEqual(adjacency.n_vertices, 4)
+        self.assertEqual(adjacency.n_edges, 3)
+        self.assertEqual(list(adjacency.row_starts), [0, 2, 2, 3, 3])
+        self.assertEqual(list(adjacency.sources), [0, 0, 2])
+        self.assertEqual(list(adjacency.targets), [1, 2, 0])
+        self.assertEqual(list(adjacency.partition_ids), [1, 1, 0])
+        self.assertEqual(list(adjacency.weights), [1, 2, 3])
+        self.assertEqual(list(adjacency.edge_ids), [1, 2, 0])
+        self.assertEqual(list(adjacency.targets_of(0)), [1, 2])
+        self.assertEqual(list(adjacency.out_degrees()), [2, 0, 1, 0])
+        self.assertEqual(list(adjacency.in_degrees()), [1, 1, 1, 0])
+        with self.assertRaises(ValueError):
+            adjacency.targets[0] = 3
+
+        # The snapshot does not change with the graph
+        graph.add_edge(MachineEdge(vertices[3], vertices[3]), "bar")
+        self.assertEqual(adjacency.n_edges, 3)
+        self.assertEqual(graph.get_adjacency().n_edges, 4)
+
+    def test_remove_edge(self):
+        """
+        test that a removed edge is in none of the indices, and that its
+        partition is kept
+        """
+        vertices = [SimpleMachineVertex(None, str(i)) for i in range(3)]
+        graph = MachineGraph("foo")
+        graph.add_vertices(vertices)
+        edges = [MachineEdge(vertices[0], vertices[1]),
+                 MachineEdge(vertices[0], vertices[2]),
+                 MachineEdge(vertices[2], vertices[1])]
+        graph.add_edges(edges, "bar")
+        graph.remove_edge(edges[0])
+
+        partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[0], "bar")
+        self.assertEqual(list(partition.edges), [edges[1]])
+        self.assertEqual(
+            list(graph.get_edges_starting_at_vertex(vertices[0])), [edges[1]])
+        self.assertEqual(
+            list(graph.get_edges_ending_at_vertex(vertices[1])), [edges[2]])
+        self.assertEqual(
+            list(graph.get_edges_ending_at_vertex_with_partition_name(
+                vertices[1], "bar")), [edges[2]])
+        self.assertEqual(graph.edges, edges[1:])
+        with self.assertRaises(PacmanNotFoundError):
+            graph.get_edge_id(edges[0])
+        with self.assertRaises(PacmanNotFoundError):
+            graph.remove_edge(edges[0])
+
+        # IDs are not reused
+        new_edge = MachineEdge(vertices[1], vertices[0])
+        graph.add_edge(new_edge, "bar")
+        self.assertEqual(graph.get_edge_id(new_edge), 3)
+
+    def test_remove_vertex(self):
+        """
+        test that removing a vertex removes its partitions and the edges
+        that start or end at it
+        """
+        vertices = [SimpleMachineVertex(None, str(i)) for i in range(3)]
+        graph = MachineGraph("foo")
+        graph.add_vertices(vertices)
+        graph.add_edge(MachineEdge(vertices[0], vertices[1]), "bar")
+        graph.add_edge(MachineEdge(vertices[1], vertices[2]), "bar")
+        graph.add_edge(MachineEdge(vertices[1], vertices[2]), "baz")
+        kept = MachineEdge(vertices[2], vertices[0])
+        graph.add_edge(kept, "bar")
+        graph.remove_vertex(vertices[1])
+
+        self.assertEqual(list(graph.vertices), [vertices[0], vertices[2]])
+        self.assertEqual(graph.edges, [kept])
+        self.assertEqual(graph.n_outgoing_edge_partitions, 2)
+        self.assertEqual(
+            list(graph.get_outgoing_edge_partitions_starting_at_vertex(
+                vertices[1])), [])
+        self.assertEqual(
+            list(graph.get_edges_ending_at_vertex(vertices[2])), [])
+        self.assertEqual(
+            list(graph.get_edges_starting_at_vertex(vertices[0])), [])
+        self.assertEqual(graph.get_adjacency().n_edges, 1)
+        with self.assertRaises(PacmanNotFoundError):
+            graph.remove_vertex(vertices[1])
+
+    def test_remove_vertex_of_edge_block(self):
+        """
+        test that removing a vertex of a block of edges removes the edges
+        of the block to it, and that the others are still made
+        """
+        pre_vertices = [SimpleMachineVertex(None, "") for _ in range(2)]
+        post_vertices = [SimpleMachineVertex(None, "") for _ in range(3)]
+        graph = MachineGraph("foo")
+        graph.add_vertices(pre_vertices + post_vertices)
+        graph.add_edge_block(
+            EdgeBlock(pre_vertices, post_vertices, MachineEdge), "bar")
+        graph.remove_vertex(post_vertices[1])
+        graph.remove_vertex(pre_vertices[0])
+        self.assertEqual(
+            [edge.post_vertex
+             for edge in graph.get_edges_starting_at_vertex(pre_vertices[1])],
+            [post_vertices[0], post_vertices[2]])
+        self.assertEqual(len(graph.edges), 2)
+
+    def test_journal(self):
+        """
+        test that the changes to a graph are recorded while the journal is
+        kept
+        """
+        vertices = [SimpleMachineVertex(None, str(i)) for i in range(3)]
+        graph = MachineGraph("foo")
+        graph.add_vertex(vertices[0])
+        self.assertIsNone(graph.journal)
+
+        graph.start_journal()
+        graph.add_vertices(vertices)
+        edge = MachineEdge(vertices[0], vertices[1])
+        graph.add_edge(edge, "bar")
+        partition = graph.get_outgoing_edge_partition_starting_at_vertex(
+            vertices[0], "bar")
+        graph.remove_vertex(vertices[0])
+        journal = graph.stop_journal()
+        self.assertIsNone(graph.journal)
+
+        self.assertEqual(
+            [(change.change_type, change.item, change.partition_name)
+             for change in journal],
+            [(GraphChangeType.ADD_VERTEX, vertices[1], None),
+             (GraphChangeType.ADD_VERTEX, vertices[2], None),
+             (GraphChangeType.ADD_PARTITION, partition, "bar"),
+             (GraphChangeType.ADD_EDGE, edge, "bar"),
+             (GraphChangeType.REMOVE_EDGE, edge, "bar"),
+             (GraphChangeType.REMOVE_PARTITION, partition, "bar"),
+             (GraphChangeType.REMOVE_VERTEX, vertices[0], None)])
+
 
 if __name__ == '__main__':
     unittest.main()
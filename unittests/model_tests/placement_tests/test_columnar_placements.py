@@ -0,0 +1,144 @@
+import unittest
+from pacman.exceptions import (PacmanAlreadyPlacedError,
+                               PacmanNotPlacedError,
+                               PacmanProcessorAlreadyOccupiedError,
+                               PacmanProcessorNotOccupiedError)
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import ColumnarPlacements, Placement, Placements
+
+
+class TestColumnarPlacements(unittest.TestCase):
+    """
+    tests that the columnar placements behave as the placements do
+    """
+
+    def _make_placements(self, n_placements):
+        vertices = [SimpleMachineVertex(None, str(i))
+                    for i in range(n_placements)]
+        placements = [
+            Placement(vertex, (i * 7) % 5, (i * 3) % 4, (i * 11) % 17 + 1)
+            for i, vertex in enumerate(vertices)]
+        # Drop any placement that would clash with an earlier one
+        used = set()
+        unique = list()
+        for placement in placements:
+            if (placement.x, placement.y, placement.p) not in used:
+                used.add((placement.x, placement.y, placement.p))
+                unique.append(placement)
+        return vertices, unique
+
+    def _assert_same(self, columnar, placements):
+        self.assertEqual(len(columnar), len(placements))
+        self.assertEqual(columnar.n_placements, placements.n_placements)
+        self.assertEqual(list(columnar.placements),
+                         list(placements.placements))
+        self.assertEqual(list(columnar), list(placements))
+        self.assertEqual(list(columnar.get_placed_processors()),
+                         list(placements.get_placed_processors()))
+        self.assertEqual(set(columnar.chips_used),
+                         set(placements.chips_used))
+        for x, y in placements.chips_used:
+            self.assertEqual(columnar.get_placements_on_chip(x, y),
+                             placements.get_placements_on_chip(x, y))
+            self.assertEqual(columnar.n_placements_on_chip(x, y),
+                             placements.n_placements_on_chip(x, y))
+        for placement in placements:
+            self.assertEqual(
+                columnar.get_placement_of_vertex(placement.vertex),
+                placement)
+            self.assertIs(
+                columnar.get_vertex_on_processor(
+                    placement.x, placement.y, placement.p),
+                placement.vertex)
+            self.assertTrue(columnar.is_processor_occupied(
+                placement.x, placement.y, placement.p))
+        expected = placements.to_arrays()
+        arrays = columnar.to_arrays()
+        self.assertEqual(arrays[0], expected[0])
+        for array, expected_array in zip(arrays[1:], expected[1:]):
+            self.assertEqual(list(array), list(expected_array))
+
+    def test_same_as_placements(self):
+        vertices, placement_list = self._make_placements(2000)
+        columnar = ColumnarPlacements(placement_list)
+        placements = Placements(placement_list)
+        self._assert_same(columnar, placements)
+        self.assertEqual(columnar.get_placements_on_chip(100, 100), [])
+        self.assertEqual(columnar.n_placements_on_chip(100, 100), 0)
+        self.assertFalse(columnar.is_processor_occupied(100, 100, 1))
+
+        for placement in placement_list[::3]:
+            self.assertEqual(
+                columnar.remove_placement(placement.vertex),
+                placements.remove_placement(placement.vertex))
+        self._assert_same(columnar, placements)
+
+        extra = Placement(SimpleMachineVertex(None, "extra"), 10, 10, None)
+        columnar.add_placement(extra)
+        placements.add_placement(extra)
+        self._assert_same(columnar, placements)
+        self.assertEqual(columnar.to_arrays()[3][-1], -1)
+
+    def test_remove_most(self):
+        vertices, placement_list = self._make_placements(200)
+        columnar = ColumnarPlacements(placement_list)
+        placements = Placements(placement_list)
+        arrays = columnar.to_arrays()
+
+        # Removing more than half closes up the gaps part way through
+        for i, placement in enumerate(placement_list):
+            if i % 4 != 1:
+                self.assertEqual(
+                    columnar.remove_placement(placement.vertex),
+                    placements.remove_placement(placement.vertex))
+                self.assertEqual(columnar.n_placements,
+                                 placements.n_placements)
+                self.assertEqual(
+                    list(columnar.get_placed_processors()),
+                    list(placements.get_placed_processors()))
+        self._assert_same(columnar, placements)
+        self.assertEqual(len(arrays[0]), len(placement_list))
+        self.assertEqual(
+            list(zip(*arrays[1:])),
+            [(placement.x, placement.y, placement.p)
+             for placement in placement_list])
+
+        for placement in placement_list[::4]:
+            columnar.add_placement(placement)
+            placements.add_placement(placement)
+        self._assert_same(columnar, placements)
+
+    def test_errors(self):
+        vertices, placement_list = self._make_placements(3)
+        columnar = ColumnarPlacements(placement_list)
+        with self.assertRaises(PacmanAlreadyPlacedError):
+            columnar.add_placement(Placement(vertices[0], 50, 50, 1))
+        with self.assertRaises(PacmanProcessorAlreadyOccupiedError):
+            columnar.add_placement(Placement(
+                SimpleMachineVertex(None, ""), placement_list[0].x,
+                placement_list[0].y, placement_list[0].p))
+        with self.assertRaises(PacmanProcessorNotOccupiedError):
+            columnar.get_vertex_on_processor(50, 50, 1)
+        other = SimpleMachineVertex(None, "")
+        with self.assertRaises(PacmanNotPlacedError):
+            columnar.get_placement_of_vertex(other)
+        with self.assertRaises(PacmanNotPlacedError):
+            columnar.remove_placement(other)
+
+    def test_arrays_not_changed(self):
+        vertices, placement_list = self._make_placements(10)
+        columnar = ColumnarPlacements(placement_list[:5])
+        arrays = columnar.to_arrays()
+        with self.assertRaises(ValueError):
+            arrays[1][0] = 1
+        columnar.add_placements(placement_list[5:])
+        columnar.remove_placement(placement_list[0].vertex)
+        self.assertEqual(len(arrays[0]), 5)
+        self.assertEqual(
+            list(zip(*arrays[1:])),
+            [(placement.x, placement.y, placement.p)
+             for placement in placement_list[:5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
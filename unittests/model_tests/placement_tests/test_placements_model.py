@@ -83,6 +83,33 @@ class TestPlacements(unittest.TestCase):
         for i in range(4):
             self.assertIn(pl[i], container)
 
+    def test_placements_on_chip(self):
+        """
+        tests the placements of each chip.
+        """
+        subv = [SimpleMachineVertex(None, "") for _ in range(5)]
+        pl = [Placement(subv[0], 1, 0, 3), Placement(subv[1], 0, 0, 2),
+              Placement(subv[2], 1, 0, 1), Placement(subv[3], 1, 0, 2)]
+        pls = Placements(pl)
+        self.assertEqual(list(pls.chips_used), [(1, 0), (0, 0)])
+        self.assertEqual(pls.get_placements_on_chip(1, 0),
+                         [pl[2], pl[3], pl[0]])
+        self.assertEqual(pls.get_placements_on_chip(0, 0), [pl[1]])
+        self.assertEqual(pls.get_placements_on_chip(0, 1), [])
+        self.assertEqual(pls.n_placements_on_chip(1, 0), 3)
+        self.assertEqual(pls.n_placements_on_chip(0, 1), 0)
+
+        pls.remove_placement(subv[1])
+        self.assertEqual(list(pls.chips_used), [(1, 0)])
+        self.assertEqual(pls.get_placements_on_chip(0, 0), [])
+        pls.remove_placement(subv[3])
+        self.assertEqual(pls.get_placements_on_chip(1, 0), [pl[2], pl[0]])
+        pls.add_placement(Placement(subv[4], 1, 0, 2))
+        self.assertEqual(
+            [placement.vertex for placement in pls.get_placements_on_chip(
+                1, 0)],
+            [subv[2], subv[4], subv[0]])
+
 
 if __name__ == '__main__':
     unittest.main()
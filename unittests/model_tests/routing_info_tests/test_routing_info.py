@@ -1,4 +1,5 @@
 import unittest
+import numpy
 from pacman.model.resources import ResourceContainer
 from pacman.exceptions import PacmanAlreadyExistsException,\
     PacmanConfigurationException
@@ -100,6 +101,52 @@ class TestRoutingInfo(unittest.TestCase):
         assert k.tolist() == [1073741824, 1073741825]
         assert n == 2
 
+    def test_base_key_and_mask_get_keys(self):
+        def expected_keys(key, mask):
+            zeros = [bit for bit in range(32) if not (mask >> bit) & 1]
+            keys = list()
+            for value in range(2 ** len(zeros)):
+                k = key
+                for i, zero in enumerate(zeros):
+                    k |= ((value >> i) & 1) << zero
+                keys.append(k)
+            return keys
+
+        for key, mask in [(0x100, 0xFFFFFFF0), (0x80000000, 0xFFFF0F0E),
+                          (0x12345678, _32_BITS), (0xF000, 0xFFFFF0F7)]:
+            bkm = BaseKeyAndMask(key, mask)
+            keys = expected_keys(key, mask)
+            assert bkm.n_keys == len(keys)
+            k, n = bkm.get_keys()
+            assert k.tolist() == keys
+            assert n == len(keys)
+
+        bkm = BaseKeyAndMask(0x80000000, 0xFFFF0F0E)
+        keys = expected_keys(0x80000000, 0xFFFF0F0E)
+        k, n = bkm.get_keys(n_keys=5)
+        assert k.tolist() == keys[:5]
+        assert n == 5
+        array = numpy.zeros(40, dtype=">u4")
+        k, n = bkm.get_keys(key_array=array, offset=3, n_keys=7)
+        assert k is array
+        assert n == 7
+        assert array.tolist() == [0] * 3 + keys[:7] + [0] * 30
+        k, n = bkm.get_keys(key_array=array, offset=20)
+        assert n == 20
+        assert array[20:].tolist() == keys[:20]
+
+    def test_partition_routing_info_get_keys(self):
+        info = PartitionRoutingInfo(
+            [BaseKeyAndMask(0x100, 0xFFFFFFFC),
+             BaseKeyAndMask(0x200, 0xFFFFFFF8),
+             BaseKeyAndMask(0x300, _32_BITS)], None)
+        keys = [0x100 + i for i in range(4)] + [0x200 + i for i in range(8)]
+        assert info.get_keys().tolist() == keys + [0x300]
+        assert info.get_keys(6).tolist() == keys[:6]
+        assert info.get_keys(12).tolist() == keys
+        with self.assertRaises(PacmanConfigurationException):
+            info.get_keys(14)
+
     def test_dict_based_machine_partition_n_keys_map(self):
         pmap = DictBasedMachinePartitionNKeysMap()
         p1 = OutgoingEdgePartition("foo", None)
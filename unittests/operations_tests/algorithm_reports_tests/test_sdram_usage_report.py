@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import ColumnarPlacements, Placement, Placements
+from pacman.model.resources import ResourceContainer, SDRAMResource
+from pacman.operations.algorithm_reports.reports import \
+    sdram_usage_report_per_chip
+
+
+class TestSdramUsageReport(unittest.TestCase):
+
+    def setUp(self):
+        self._folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._folder)
+
+    def _report(self, placements, machine):
+        sdram_usage_report_per_chip(
+            self._folder, "test", placements, machine)
+        with open(os.path.join(
+                self._folder, "chip_sdram_usage_by_core.rpt")) as f:
+            return [line for line in f if not line.startswith("Generated")]
+
+    def test_same_for_columnar_placements(self):
+        machine = VirtualMachine(width=2, height=2)
+        placement_list = [
+            Placement(SimpleMachineVertex(
+                ResourceContainer(sdram=SDRAMResource(1024 * (i + 1))),
+                "v{}".format(9 - i)), i % 2, 0, i // 2 + 1)
+            for i in range(10)]
+        report = self._report(Placements(placement_list), machine)
+        self.assertEqual(
+            self._report(ColumnarPlacements(placement_list), machine), report)
+        self.assertIn("SDRAM reqs for core (1,0,5) is 10 KB\n", report)
+        self.assertEqual(report.index(
+            "SDRAM reqs for core (1,0,5) is 10 KB\n"), 4)
+        self.assertIn(
+            "**** Chip: (0, 0) has total memory usage of 25 KB"
+            " (25600 bytes) out of a max of {0} KB ({1} bytes)\n".format(
+                machine.get_chip_at(0, 0).sdram.size // 1024,
+                machine.get_chip_at(0, 0).sdram.size), report)
+
+
+if __name__ == '__main__':
+    unittest.main()
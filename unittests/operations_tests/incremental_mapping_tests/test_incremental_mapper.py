@@ -0,0 +1,151 @@
+import unittest
+from collections import deque
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.model.graphs.machine import \
+    MachineEdge, MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+from pacman.model.routing_info import DictBasedMachinePartitionNKeysMap
+from pacman.model.routing_table_by_partition import \
+    MulticastRoutingTableByPartition
+from pacman.model.routing_tables import MulticastRoutingTables
+from pacman.operations.incremental_mapping import IncrementalMapper
+from pacman.operations.routing_table_generators.\
+    basic_routing_table_generator import BasicRoutingTableGenerator
+
+
+class TestIncrementalMapper(unittest.TestCase):
+
+    def setUp(self):
+        self.machine = VirtualMachine(width=8, height=8)
+        self.graph = MachineGraph("Test")
+        self.vertices = [
+            SimpleMachineVertex(ResourceContainer(), str(i))
+            for i in range(100)]
+        self.graph.add_vertices(self.vertices)
+        for i, vertex in enumerate(self.vertices):
+            self.graph.add_edges([
+                MachineEdge(vertex, self.vertices[(i + 1) % 100]),
+                MachineEdge(vertex, self.vertices[(i + 37) % 100])], "next")
+        self.n_keys_map = DictBasedMachinePartitionNKeysMap()
+        self._set_n_keys()
+
+    def _set_n_keys(self):
+        for partition in self.graph.outgoing_edge_partitions:
+            self.n_keys_map.set_n_keys_for_partition(partition, 4)
+
+    def _map_in_full(self):
+        # With no fraction allowed to change, the graph is mapped in full
+        result = IncrementalMapper(max_changed_fraction=-1)(
+            self.graph, self.machine, [], self.n_keys_map, None,
+            MulticastRoutingTableByPartition(), None,
+            MulticastRoutingTables())
+        self.assertFalse(result[4])
+        return result[:4]
+
+    def _check_mapping(
+            self, placements, routing_table_by_partition, routing_infos,
+            routing_tables):
+        self.assertEqual(
+            set(placement.vertex for placement in placements),
+            set(self.graph.vertices))
+
+        # Every partition reaches all its destinations
+        for partition in self.graph.outgoing_edge_partitions:
+            source = placements.get_placement_of_vertex(partition.pre_vertex)
+            reached = set()
+            seen = set()
+            queue = deque([(source.x, source.y)])
+            while queue:
+                x, y = queue.pop()
+                if (x, y) in seen:
+                    continue
+                seen.add((x, y))
+                entry = routing_table_by_partition.\
+                    get_entry_on_coords_for_edge(partition, x, y)
+                self.assertIsNotNone(entry)
+                for p in entry.out_going_processors:
+                    reached.add(placements.get_vertex_on_processor(x, y, p))
+                chip = self.machine.get_chip_at(x, y)
+                for link_id in entry.out_going_links:
+                    link = chip.router.get_link(link_id)
+                    queue.append((link.destination_x, link.destination_y))
+            self.assertEqual(
+                reached, set(edge.post_vertex for edge in partition.edges))
+
+        # The keys do not overlap and there are no keys of other partitions
+        keys = [
+            key_and_mask.key
+            for partition_info in routing_infos
+            for key_and_mask in partition_info.keys_and_masks]
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual(
+            set(partition_info.partition for partition_info in routing_infos),
+            set(self.graph.outgoing_edge_partitions))
+
+        # The tables are those that would be made from the routes and keys
+        expected = BasicRoutingTableGenerator()(
+            routing_infos, routing_table_by_partition, self.machine)
+        self.assertEqual(
+            sorted((table.x, table.y, sorted(
+                (entry.routing_entry_key, entry.mask, entry.processor_ids,
+                 entry.link_ids)
+                for entry in table.multicast_routing_entries))
+                for table in routing_tables),
+            sorted((table.x, table.y, sorted(
+                (entry.routing_entry_key, entry.mask, entry.processor_ids,
+                 entry.link_ids)
+                for entry in table.multicast_routing_entries))
+                for table in expected))
+
+    def test_small_change_is_incremental(self):
+        placements, routes, routing_infos, tables = self._map_in_full()
+        old_placements = dict(
+            (placement.vertex, (placement.x, placement.y, placement.p))
+            for placement in placements)
+
+        self.graph.start_journal()
+        new_vertex = SimpleMachineVertex(ResourceContainer(), "new")
+        self.graph.add_vertex(new_vertex)
+        self.graph.add_edge(
+            MachineEdge(self.vertices[0], new_vertex), "next")
+        self.graph.add_edge(
+            MachineEdge(new_vertex, self.vertices[50]), "next")
+        self.graph.remove_vertex(self.vertices[10])
+        self.graph.remove_edge(list(self.graph.get_edges_starting_at_vertex(
+            self.vertices[20]))[0])
+        changes = self.graph.stop_journal()
+        self._set_n_keys()
+
+        placements, routes, routing_infos, tables, incremental = \
+            IncrementalMapper()(
+                self.graph, self.machine, changes, self.n_keys_map,
+                placements, routes, routing_infos, tables)
+        self.assertTrue(incremental)
+        self._check_mapping(placements, routes, routing_infos, tables)
+
+        # The vertices that were placed before stay where they were
+        for placement in placements:
+            if placement.vertex is not new_vertex:
+                self.assertEqual(
+                    old_placements[placement.vertex],
+                    (placement.x, placement.y, placement.p))
+
+    def test_large_change_is_full(self):
+        placements, routes, routing_infos, tables = self._map_in_full()
+        self.graph.start_journal()
+        for vertex in self.vertices[:30]:
+            self.graph.remove_vertex(vertex)
+        changes = self.graph.stop_journal()
+
+        placements, routes, routing_infos, tables, incremental = \
+            IncrementalMapper()(
+                self.graph, self.machine, changes, self.n_keys_map,
+                placements, routes, routing_infos, tables)
+        self.assertFalse(incremental)
+        self._check_mapping(placements, routes, routing_infos, tables)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.executor import PACMANAlgorithmExecutor
+from pacman.model.graphs.machine import \
+    FrozenMachineGraph, MachineEdge, MachineGraph, SimpleMachineVertex
+from pacman.model.resources import ResourceContainer
+
+
+class TestMachineGraphFreezer(unittest.TestCase):
+
+    def test_placer_waits_for_frozen_graph(self):
+        graph = MachineGraph("Test")
+        vertices = [
+            SimpleMachineVertex(ResourceContainer(), str(i))
+            for i in range(10)]
+        graph.add_vertices(vertices)
+        for i, vertex in enumerate(vertices):
+            graph.add_edge(MachineEdge(vertex, vertices[i - 1]), "Test")
+
+        # The placer is listed first, but must run on the frozen graph
+        executor = PACMANAlgorithmExecutor(
+            algorithms=["RadialPlacer", "MachineGraphFreezer"],
+            optional_algorithms=[],
+            inputs={"MemoryMachineGraph": graph,
+                    "MemoryExtendedMachine": VirtualMachine(2, 2)},
+            required_outputs=["MemoryPlacements"],
+            tokens=[], required_output_tokens=[])
+        executor.execute_mapping()
+        self.assertEqual(
+            [algorithm.algorithm_id for algorithm in executor._algorithms],
+            ["MachineGraphFreezer", "RadialPlacer"])
+        frozen = executor.get_item("MemoryMachineGraph")
+        self.assertIsInstance(frozen, FrozenMachineGraph)
+        self.assertEqual(list(frozen.vertices), vertices)
+        self.assertEqual(
+            executor.get_item("MemoryPlacements").n_placements, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,9 +9,13 @@ from pacman.exceptions import PacmanInvalidParameterException,\
     PacmanPartitionException, PacmanValueError
 from pacman.model.constraints.partitioner_constraints\
     import MaxVertexAtomsConstraint, FixedVertexAtomsConstraint
+from pacman.model.constraints.key_allocator_constraints \
+    import ContiguousKeyRangeContraint
+from pacman.model.abstract_classes import AbstractSlicesConnect
 from spinn_machine.virtual_machine import VirtualMachine
 from pacman.operations.partition_algorithms.basic_partitioner \
     import BasicPartitioner
+from pacman.utilities.utility_objs import ResourceModelCache
 
 # spinnMachine imports
 from spinn_machine import Machine, Processor, SDRAM, Link, Router, Chip
@@ -21,6 +25,15 @@ import unittest
 from uinit_test_objects import NewPartitionerConstraint, SimpleTestVertex
 
 
+class OneToOneEdge(ApplicationEdge, AbstractSlicesConnect):
+    """ An edge between the same atoms of two vertices
+    """
+
+    def could_connect(self, pre_slice, post_slice):
+        return (pre_slice.lo_atom <= post_slice.hi_atom and
+                post_slice.lo_atom <= pre_slice.hi_atom)
+
+
 class TestBasicPartitioner(unittest.TestCase):
     """
     test for basic partitioning algorithm
@@ -372,6 +385,109 @@ class TestBasicPartitioner(unittest.TestCase):
         machine_graph, _, _ = partitioner(app_graph, machine)
         self.assert_(len(machine_graph.vertices) == 4)
 
+    def test_machine_edges_between_connected_slices(self):
+        app_graph = ApplicationGraph("Test")
+        pre_vertex = SimpleTestVertex(100, "Pre", 10)
+        post_vertex = SimpleTestVertex(100, "Post", 25)
+        app_graph.add_vertices([pre_vertex, post_vertex])
+        app_graph.add_edge(OneToOneEdge(pre_vertex, post_vertex), "OneToOne")
+        app_graph.add_edge(ApplicationEdge(pre_vertex, post_vertex), "All")
+        app_graph.get_outgoing_edge_partition_starting_at_vertex(
+            pre_vertex, "All").add_constraint(ContiguousKeyRangeContraint())
+
+        machine_graph, mapper, _ = BasicPartitioner()(
+            app_graph, VirtualMachine(width=2, height=2))
+        for machine_vertex in mapper.get_machine_vertices(pre_vertex):
+            pre_slice = mapper.get_slice(machine_vertex)
+            one_to_one = machine_graph.\
+                get_outgoing_edge_partition_starting_at_vertex(
+                    machine_vertex, "OneToOne")
+            self.assertEqual(
+                [mapper.get_slice(edge.post_vertex).lo_atom
+                 for edge in one_to_one.edges],
+                [lo_atom for lo_atom in range(0, 100, 25)
+                 if (lo_atom <= pre_slice.hi_atom and
+                     pre_slice.lo_atom <= lo_atom + 24)])
+            all_to_all = machine_graph.\
+                get_outgoing_edge_partition_starting_at_vertex(
+                    machine_vertex, "All")
+            self.assertEqual(all_to_all.n_edges, 4)
+            self.assertEqual(len(all_to_all.constraints), 1)
+            self.assertEqual(len(one_to_one.constraints), 0)
+
+    def test_edge_blocks_match_edges(self):
+        app_graph = ApplicationGraph("Test")
+        pre_vertex = SimpleTestVertex(100, "Pre", 10)
+        post_vertex = SimpleTestVertex(100, "Post", 25)
+        app_graph.add_vertices([pre_vertex, post_vertex])
+        one_to_one = OneToOneEdge(pre_vertex, post_vertex)
+        all_to_all = ApplicationEdge(pre_vertex, post_vertex)
+        app_graph.add_edge(one_to_one, "OneToOne")
+        app_graph.add_edge(all_to_all, "All")
+        app_graph.get_outgoing_edge_partition_starting_at_vertex(
+            pre_vertex, "All").add_constraint(ContiguousKeyRangeContraint())
+
+        def edges(use_edge_blocks):
+            machine_graph, mapper, _ = BasicPartitioner()(
+                app_graph, VirtualMachine(width=2, height=2),
+                use_edge_blocks=use_edge_blocks)
+            for machine_vertex in mapper.get_machine_vertices(pre_vertex):
+                partition = machine_graph.\
+                    get_outgoing_edge_partition_starting_at_vertex(
+                        machine_vertex, "All")
+                self.assertEqual(len(partition.constraints), 1)
+            return [
+                sorted(
+                    (mapper.get_slice(edge.pre_vertex).lo_atom,
+                     mapper.get_slice(edge.post_vertex).lo_atom)
+                    for edge in mapper.get_machine_edges(app_edge))
+                for app_edge in (one_to_one, all_to_all)]
+
+        self.assertEqual(edges(True), edges(False))
+
+    def test_parallel_matches_serial(self):
+        machine = VirtualMachine(width=8, height=8)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        app_graph = ApplicationGraph("Test")
+
+        # The first vertex leaves a quarter of each chip, so the second
+        # fits fewer atoms on a core than it would on an empty machine
+        app_graph.add_vertex(SimpleTestVertex(
+            48, "A", 1, fixed_sdram_value=sdram * 3 // 4))
+        app_graph.add_vertex(SimpleTestVertex(
+            20, "B", 100, fixed_sdram_value=sdram // 8))
+        for i in range(10):
+            app_graph.add_vertex(SimpleTestVertex(100 + i, "C{}".format(i)))
+
+        def slices(n_processes):
+            _, mapper, _ = BasicPartitioner()(
+                app_graph, machine, n_processes=n_processes)
+            return [
+                (vertex.label, vertex_slice.lo_atom, vertex_slice.hi_atom)
+                for vertex in app_graph.vertices
+                for vertex_slice in mapper.get_slices(vertex)]
+
+        serial_slices = slices(1)
+        self.assertEqual(
+            [atoms for atoms in serial_slices if atoms[0] == "B"],
+            [("B", lo_atom, lo_atom + 1) for lo_atom in range(0, 20, 2)])
+        self.assertEqual(slices(3), serial_slices)
+
+        # The slices worked out in the other processes are counted as misses
+        cache = ResourceModelCache()
+        machine_graph, _, _ = BasicPartitioner()(
+            app_graph, machine, resource_model_cache=cache, n_processes=3)
+        self.assertGreaterEqual(cache.misses, machine_graph.n_vertices)
+
+    def test_parallel_with_insufficient_space(self):
+        machine = VirtualMachine(width=2, height=2, sdram_per_chip=1)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        app_graph = ApplicationGraph("Test")
+        app_graph.add_vertex(SimpleTestVertex(
+            10, "Large", fixed_sdram_value=sdram * 2))
+        with self.assertRaises(PacmanPartitionException):
+            BasicPartitioner()(app_graph, machine, n_processes=2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,9 @@ from pacman.model.constraints.partitioner_constraints\
 from pacman.model.resources.pre_allocated_resource_container import \
     PreAllocatedResourceContainer
 from pacman.operations.partition_algorithms import PartitionAndPlacePartitioner
+from pacman.model.graphs.common import Slice
+from pacman.model.resources import ResourceContainer, SDRAMResource
+from pacman.utilities.utility_objs import ResourceModelCache
 
 # spinnMachine imports
 from spinn_machine import Machine, Processor, SDRAM, Link, Router, Chip
@@ -416,6 +419,30 @@ class TestBasicPartitioner(unittest.TestCase):
         partitioner = PartitionAndPlacePartitioner()
         partitioner(self.graph, self.machine, PreAllocatedResourceContainer())
 
+    def test_partitioning_with_resource_model_cache(self):
+        self.setup()
+        vertex = SimpleTestVertex(16000, "Large")
+        self.graph.add_vertex(vertex)
+        vertex_2 = SimpleTestVertex(16000, "Same size")
+        vertex_2.add_constraint(SameAtomsAsVertexConstraint(vertex))
+        self.graph.add_vertex(vertex_2)
+
+        def slices(graph_mapper):
+            return [
+                (v.label, s.lo_atom, s.hi_atom)
+                for v in self.graph.vertices
+                for s in graph_mapper.get_slices(v)]
+
+        _, graph_mapper, _ = PartitionAndPlacePartitioner()(
+            self.graph, self.machine, PreAllocatedResourceContainer())
+        cache = ResourceModelCache(size_only=True)
+        _, cached_graph_mapper, _ = PartitionAndPlacePartitioner()(
+            self.graph, self.machine, PreAllocatedResourceContainer(),
+            resource_model_cache=cache)
+        self.assertEqual(slices(cached_graph_mapper), slices(graph_mapper))
+        self.assertGreater(cache.hits, 0)
+        self.assertEqual(len(cache), cache.misses)
+
     @unittest.skip("Test not implemented yet")
     def test_detect_subclass_hierarchy(self):
         self.assertEqual(True, False, "Test not implemented yet")
@@ -428,9 +455,33 @@ class TestBasicPartitioner(unittest.TestCase):
     def test_scale_down_resource_usage(self):
         self.assertEqual(True, False, "Test not implemented yet")
 
-    @unittest.skip("Test not implemented yet")
-    def test_scale_up_resource_usage(self):
-        self.assertEqual(True, False, "Test not implemented yet")
+    def test_find_max_atoms(self):
+        class CountingVertex(SimpleTestVertex):
+            n_calls = 0
+
+            def get_sdram_usage_for_atoms(self, vertex_slice, graph):
+                CountingVertex.n_calls += 1
+                return 1000 + 3 * vertex_slice.n_atoms
+
+        vertex = CountingVertex(200000, "Counting", 200000)
+        partitioner = PartitionAndPlacePartitioner()
+        for available in [1002, 1003, 1004, 5000, 123456, 600003, 700000]:
+            resources = ResourceContainer(sdram=SDRAMResource(available))
+            for lo_atom in [0, 1000]:
+                hi_atom = vertex.n_atoms - 1
+                used_resources = vertex.get_resources_used_by_atoms(
+                    Slice(lo_atom, hi_atom))
+                ratio = partitioner._find_max_ratio(used_resources, resources)
+                CountingVertex.n_calls = 0
+                used_resources, hi_atom = partitioner._find_max_atoms(
+                    vertex, lo_atom, hi_atom, used_resources, resources,
+                    ratio, ResourceModelCache(max_size=0))
+                self.assertLessEqual(CountingVertex.n_calls, 40)
+                n_atoms = min((available - 1000) // 3, 200000 - lo_atom)
+                self.assertEqual(hi_atom, lo_atom + n_atoms - 1)
+                self.assertEqual(
+                    used_resources.sdram.get_value(),
+                    1000 + 3 * max(n_atoms, 1))
 
     @unittest.skip("Test not implemented yet")
     def test_find_max_ratio(self):
@@ -0,0 +1,41 @@
+import unittest
+
+from spinn_machine import VirtualMachine
+
+from pacman.model.graphs.machine import MachineGraph, SimpleMachineVertex
+from pacman.model.resources import \
+    PreAllocatedResourceContainer, ResourceContainer, SpecificCoreResource
+from pacman.operations.placer_algorithms import BasicPlacer, RadialPlacer
+from pacman.operations.placer_algorithms.one_to_one_placer import \
+    OneToOnePlacer
+from pacman.utilities.utility_objs import ResourceTracker
+
+
+class TestPlacersWithResourceTracker(unittest.TestCase):
+
+    def test_placers_fork_the_tracker(self):
+        machine = VirtualMachine(width=2, height=2)
+        preallocated_resources = PreAllocatedResourceContainer(
+            specific_core_resources=[SpecificCoreResource(
+                chip=machine.get_chip_at(0, 0), cores=range(1, 18))])
+        tracker = ResourceTracker(
+            machine, preallocated_resources=preallocated_resources)
+        chips_available = list(tracker.chips_available)
+        graph = MachineGraph("Test")
+        for i in range(20):
+            graph.add_vertex(SimpleMachineVertex(
+                ResourceContainer(), "vertex " + str(i)))
+
+        # The tracker is forked, so each placement avoids the preallocated
+        # cores and leaves the tracker as it was
+        for placer in (BasicPlacer(), RadialPlacer(), OneToOnePlacer()):
+            placements = placer(graph, machine, tracker)
+            self.assertEqual(placements.n_placements, 20)
+            self.assertNotIn((0, 0), set(placements.chips_used))
+            self.assertEqual(tracker.chips_used, 0)
+            self.assertEqual(
+                list(tracker.chips_available), chips_available)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from spinn_machine import VirtualMachine
+
+from pacman.exceptions import PacmanConfigurationException
+from pacman.operations.placer_algorithms import RadialPlacer
+
+
+class TestRadialPlacementFromChip(unittest.TestCase):
+
+    def test_radial_chips(self):
+        machine = VirtualMachine(width=8, height=8, with_wrap_arounds=False)
+        chips = list(RadialPlacer._generate_radial_chips(
+            machine, start_chip_x=5, start_chip_y=6))
+        self.assertEqual(chips[0], (5, 6))
+        self.assertEqual(sorted(chips), sorted(
+            (chip.x, chip.y) for chip in machine.chips))
+
+    def test_start_chip_not_in_machine(self):
+        machine = VirtualMachine(width=8, height=8, with_wrap_arounds=False)
+        for x, y in ((9, 2), (-1, 0)):
+            with self.assertRaises(PacmanConfigurationException):
+                RadialPlacer._generate_radial_chips(
+                    machine, start_chip_x=x, start_chip_y=y)
+
+
+if __name__ == '__main__':
+    unittest.main()
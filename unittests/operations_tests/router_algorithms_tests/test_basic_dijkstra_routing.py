@@ -1,8 +1,10 @@
 import unittest
 from collections import deque
+from six import iteritems
 
 from spinn_machine.virtual_machine import VirtualMachine
 
+from pacman.exceptions import PacmanRoutingException
 from pacman.model.graphs.machine import \
     MachineGraph, MachineEdge, SimpleMachineVertex
 from pacman.operations.router_algorithms import BasicDijkstraRouting
@@ -72,6 +74,57 @@ class MyTestCase(unittest.TestCase):
                 if vertex != vertex_to:
                     self.assertIn(vertex_to, vertices_reached)
 
+    def test_unreachable_destination(self):
+        machine = VirtualMachine(
+            2, 2, down_links={(0, 0, link) for link in range(6)})
+        graph = MachineGraph("Test")
+        placements = Placements()
+        source = SimpleMachineVertex(resources=ResourceContainer())
+        target = SimpleMachineVertex(resources=ResourceContainer())
+        graph.add_vertex(source)
+        graph.add_vertex(target)
+        graph.add_edge(MachineEdge(source, target), "Test")
+        placements.add_placement(Placement(source, 0, 0, 1))
+        placements.add_placement(Placement(target, 1, 1, 1))
+
+        router = BasicDijkstraRouting()
+        with self.assertRaises(PacmanRoutingException):
+            router(placements, machine, graph, use_progress_bar=False)
+        with self.assertRaises(PacmanRoutingException):
+            router(placements, machine, graph, use_progress_bar=False,
+                   n_processes=2)
+
+    def test_small_tree_cache(self):
+        machine = VirtualMachine(8, 8)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        vertices = list()
+
+        # Interleave the chips so that trees are evicted and rebuilt
+        for p in range(1, 4):
+            for x, y in [(0, 0), (7, 7), (3, 4), (0, 0), (5, 2)]:
+                vertex = SimpleMachineVertex(resources=ResourceContainer())
+                graph.add_vertex(vertex)
+                placements.add_placement(
+                    Placement(vertex, x, y, p + len(vertices) % 5 * 3))
+                vertices.append(vertex)
+        for i, vertex in enumerate(vertices):
+            for vertex_to in vertices[i % 3::4]:
+                if vertex != vertex_to:
+                    graph.add_edge(MachineEdge(vertex, vertex_to), "Test")
+
+        def routes(**kwargs):
+            paths = BasicDijkstraRouting()(
+                placements, machine, graph, use_progress_bar=False, **kwargs)
+            return [
+                (x, y, partition, repr(entry))
+                for x, y in paths.get_routers()
+                for partition, entry in iteritems(
+                    paths.get_entries_for_router(x, y))]
+
+        self.assertEqual(routes(), routes(tree_cache_size=1))
+        self.assertEqual(routes(), routes(n_processes=3))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from collections import deque
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.model.graphs.machine import \
+    MachineGraph, MachineEdge, SimpleMachineVertex
+from pacman.operations.router_algorithms import CongestionAwareRouting
+from pacman.model.resources import ResourceContainer
+from pacman.model.placements import Placements, Placement
+
+
+class TestCongestionAwareRouting(unittest.TestCase):
+
+    def _reached(self, machine, placements, routing_paths, partition):
+        placement = placements.get_placement_of_vertex(partition.pre_vertex)
+        entry = routing_paths.get_entry_on_coords_for_edge(
+            partition, placement.x, placement.y)
+        self.assertEqual(entry.incoming_processor, placement.p)
+        reached = set()
+        seen = set()
+        queue = deque([(placement.x, placement.y)])
+        while queue:
+            x, y = queue.pop()
+            seen.add((x, y))
+            entry = routing_paths.get_entry_on_coords_for_edge(
+                partition, x, y)
+            self.assertIsNotNone(entry)
+            for p in entry.out_going_processors:
+                reached.add(placements.get_vertex_on_processor(x, y, p))
+            chip = machine.get_chip_at(x, y)
+            for link_id in entry.out_going_links:
+                link = chip.router.get_link(link_id)
+                self.assertIsNotNone(link)
+                dest = (link.destination_x, link.destination_y)
+                self.assertNotIn(dest, seen)
+                queue.append(dest)
+        return reached
+
+    def test_routing(self):
+        machine = VirtualMachine(8, 8)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        vertices = list()
+        for i, (x, y) in enumerate([(0, 0), (7, 7), (3, 4), (5, 2), (2, 4)]):
+            for p in range(1, 3):
+                vertex = SimpleMachineVertex(resources=ResourceContainer())
+                graph.add_vertex(vertex)
+                placements.add_placement(Placement(vertex, x, y, p + i))
+                vertices.append(vertex)
+        for vertex in vertices:
+            for vertex_to in vertices:
+                if vertex != vertex_to:
+                    graph.add_edge(MachineEdge(vertex, vertex_to), "Test")
+
+        routing_paths, link_loads = CongestionAwareRouting()(
+            placements, machine, graph, n_reroute_passes=2,
+            use_progress_bar=False)
+
+        for partition in graph.outgoing_edge_partitions:
+            self.assertEqual(
+                self._reached(machine, placements, routing_paths, partition),
+                set(edge.post_vertex for edge in partition.edges))
+        self.assertTrue(link_loads)
+        for (x, y, link), load in link_loads.items():
+            self.assertIsNotNone(machine.get_chip_at(x, y).router.get_link(
+                link))
+            self.assertGreater(load, 0)
+
+    def test_spreads_load(self):
+        # Many partitions between the same two chips; with congestion
+        # costs they should not all go down the same links
+        machine = VirtualMachine(8, 8)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        for p in range(1, 16):
+            source = SimpleMachineVertex(resources=ResourceContainer())
+            target = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(source)
+            graph.add_vertex(target)
+            placements.add_placement(Placement(source, 0, 0, p))
+            placements.add_placement(Placement(target, 3, 3, p))
+            graph.add_edge(MachineEdge(source, target), "Test")
+
+        _, link_loads = CongestionAwareRouting()(
+            placements, machine, graph, bw_per_route_entry=1, max_bw=5,
+            n_reroute_passes=3, use_progress_bar=False)
+        self.assertLessEqual(max(link_loads.values()), 5)
+        self.assertGreater(len(link_loads), 3)
+
+    def test_overloaded_after_last_pass(self):
+        # Each link has too little bandwidth for even one partition, so
+        # links stay overloaded whatever the number of passes
+        machine = VirtualMachine(8, 8)
+        graph = MachineGraph("Test")
+        placements = Placements()
+        for p in range(1, 11):
+            source = SimpleMachineVertex(resources=ResourceContainer())
+            target = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(source)
+            graph.add_vertex(target)
+            placements.add_placement(Placement(source, 0, 0, p))
+            placements.add_placement(Placement(target, 2, 3, p))
+            graph.add_edge(MachineEdge(source, target), "Test")
+
+        for n_reroute_passes in (0, 2):
+            routing_paths, link_loads = CongestionAwareRouting()(
+                placements, machine, graph, max_bw=0.035,
+                n_reroute_passes=n_reroute_passes, use_progress_bar=False)
+            for partition in graph.outgoing_edge_partitions:
+                self.assertEqual(
+                    self._reached(
+                        machine, placements, routing_paths, partition),
+                    set(edge.post_vertex for edge in partition.edges))
+            self.assertGreater(max(link_loads.values()), 0.035)
+
+
+if __name__ == '__main__':
+    unittest.main()
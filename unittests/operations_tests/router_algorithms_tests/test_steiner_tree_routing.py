@@ -0,0 +1,132 @@
+import unittest
+from collections import deque
+from six import iteritems
+
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.exceptions import PacmanRoutingException
+from pacman.model.graphs.machine import \
+    MachineGraph, MachineEdge, SimpleMachineVertex
+from pacman.operations.router_algorithms import \
+    BasicDijkstraRouting, SteinerTreeRouting
+from pacman.model.resources import ResourceContainer
+from pacman.model.placements import Placements, Placement
+
+
+class TestSteinerTreeRouting(unittest.TestCase):
+
+    def _make_graph(self, machine, chips):
+        graph = MachineGraph("Test")
+        placements = Placements()
+        vertices = list()
+        for i, (x, y) in enumerate(chips):
+            vertex = SimpleMachineVertex(resources=ResourceContainer())
+            graph.add_vertex(vertex)
+            placements.add_placement(Placement(vertex, x, y, 1 + i % 16))
+            vertices.append(vertex)
+        for vertex in vertices:
+            for vertex_to in vertices:
+                if vertex != vertex_to:
+                    graph.add_edge(MachineEdge(vertex, vertex_to), "Test")
+        return graph, placements
+
+    def _check_reached(self, machine, graph, placements, routing_paths):
+        for partition in graph.outgoing_edge_partitions:
+            placement = placements.get_placement_of_vertex(
+                partition.pre_vertex)
+            entry = routing_paths.get_entry_on_coords_for_edge(
+                partition, placement.x, placement.y)
+            self.assertEqual(entry.incoming_processor, placement.p)
+            reached = set()
+            seen = set()
+            queue = deque([(placement.x, placement.y)])
+            while queue:
+                x, y = queue.pop()
+                self.assertNotIn((x, y), seen)
+                seen.add((x, y))
+                entry = routing_paths.get_entry_on_coords_for_edge(
+                    partition, x, y)
+                self.assertIsNotNone(entry)
+                for p in entry.out_going_processors:
+                    reached.add(placements.get_vertex_on_processor(x, y, p))
+                chip = machine.get_chip_at(x, y)
+                for link_id in entry.out_going_links:
+                    link = chip.router.get_link(link_id)
+                    self.assertIsNotNone(link)
+                    dest = (link.destination_x, link.destination_y)
+                    self.assertEqual(
+                        routing_paths.get_entry_on_coords_for_edge(
+                            partition, *dest).incoming_link,
+                        (link_id + 3) % 6)
+                    queue.append(dest)
+            self.assertEqual(
+                reached, set(edge.post_vertex for edge in partition.edges))
+
+    def test_routing(self):
+        machine = VirtualMachine(8, 8)
+        chips = [(0, 0), (7, 7), (3, 4), (5, 2), (2, 4), (4, 4), (0, 0)]
+        graph, placements = self._make_graph(machine, chips)
+        routing_paths = SteinerTreeRouting()(
+            placements, machine, graph, use_progress_bar=False)
+        self._check_reached(machine, graph, placements, routing_paths)
+
+    def test_fewer_routers_than_dijkstra(self):
+        machine = VirtualMachine(8, 8)
+        chips = [(0, 0)] + [(x, 7) for x in range(4, 8)] + \
+            [(7, y) for y in range(3, 7)]
+        graph, placements = self._make_graph(machine, chips)
+
+        def n_entries(routing_paths):
+            return sum(
+                len(routing_paths.get_entries_for_router(x, y))
+                for x, y in routing_paths.get_routers())
+
+        steiner_paths = SteinerTreeRouting()(
+            placements, machine, graph, use_progress_bar=False)
+        self._check_reached(machine, graph, placements, steiner_paths)
+        dijkstra_paths = BasicDijkstraRouting()(
+            placements, machine, graph, use_progress_bar=False)
+        self.assertLessEqual(
+            n_entries(steiner_paths), n_entries(dijkstra_paths))
+
+    def test_routes_around_dead_links(self):
+        machine = VirtualMachine(
+            8, 8, down_links={(1, 1, link) for link in range(6)})
+        chips = [(0, 0), (2, 2), (1, 2), (2, 1)]
+        graph, placements = self._make_graph(machine, chips)
+        routing_paths = SteinerTreeRouting()(
+            placements, machine, graph, use_progress_bar=False)
+        self._check_reached(machine, graph, placements, routing_paths)
+
+    def test_parallel_matches_serial(self):
+        machine = VirtualMachine(8, 8)
+        chips = [(0, 0), (7, 7), (3, 4), (5, 2), (2, 4), (4, 4), (6, 6)]
+        graph, placements = self._make_graph(machine, chips)
+
+        def routes(n_processes):
+            paths = SteinerTreeRouting()(
+                placements, machine, graph, use_progress_bar=False,
+                n_processes=n_processes)
+            return [
+                (x, y, partition, repr(entry))
+                for x, y in paths.get_routers()
+                for partition, entry in iteritems(
+                    paths.get_entries_for_router(x, y))]
+
+        self.assertEqual(routes(1), routes(3))
+
+    def test_unreachable_destination(self):
+        machine = VirtualMachine(
+            2, 2, down_links={(0, 0, link) for link in range(6)})
+        graph, placements = self._make_graph(machine, [(0, 0), (1, 1)])
+        with self.assertRaises(PacmanRoutingException):
+            SteinerTreeRouting()(
+                placements, machine, graph, use_progress_bar=False)
+        with self.assertRaises(PacmanRoutingException):
+            SteinerTreeRouting()(
+                placements, machine, graph, use_progress_bar=False,
+                n_processes=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from pacman.utilities.utility_objs.free_chip_index import FreeChipIndex
+
+
+class TestFreeChipIndex(unittest.TestCase):
+
+    def test_at_least(self):
+        index = FreeChipIndex([((0, 0), 5), ((1, 0), 2), ((0, 1), 8)])
+        self.assertEqual(list(index.at_least(0)), [(0, 0), (1, 0), (0, 1)])
+        self.assertEqual(list(index.at_least(3)), [(0, 0), (0, 1)])
+        self.assertEqual(list(index.at_least(9)), [])
+
+        index.set_value((0, 0), 1)
+        index.discard((0, 1))
+        self.assertEqual(list(index.at_least(2)), [(1, 0)])
+
+        # Adding again goes to the end; adding when present keeps the place
+        index.add((0, 1), 4)
+        index.add((1, 0), 3)
+        self.assertEqual(list(index), [(0, 0), (1, 0), (0, 1)])
+        self.assertEqual(index.value((1, 0)), 3)
+        self.assertNotIn((5, 5), index)
+        self.assertEqual(len(index), 3)
+
+    def test_matches_ordered_scan(self):
+        rnd = random.Random(7)
+        keys = [(x, y) for x in range(8) for y in range(8)]
+        index = FreeChipIndex()
+        values = dict()
+        order = list()
+        for _ in range(2000):
+            key = rnd.choice(keys)
+            action = rnd.random()
+            if action < 0.4:
+                index.add(key, rnd.randint(-1, 20))
+                if key not in values:
+                    order.append(key)
+                values[key] = index.value(key)
+            elif action < 0.6:
+                index.discard(key)
+                if key in values:
+                    del values[key]
+                    order.remove(key)
+            else:
+                minimum = rnd.randint(0, 20)
+                self.assertEqual(
+                    list(index.at_least(minimum)),
+                    [k for k in order if values[k] >= minimum])
+        self.assertEqual(list(index), order)
+
+
+if __name__ == '__main__':
+    unittest.main()
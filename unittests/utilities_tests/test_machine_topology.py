@@ -0,0 +1,63 @@
+import unittest
+
+from spinn_machine import Link
+from spinn_machine.virtual_machine import VirtualMachine
+
+from pacman.utilities.utility_objs import MachineTopology
+from pacman.utilities.utility_objs.machine_topology import NO_CHIP
+
+
+class TestMachineTopology(unittest.TestCase):
+
+    def test_matches_machine(self):
+        machine = VirtualMachine(
+            8, 8, with_wrap_arounds=False, down_chips={(3, 3)},
+            down_links={(1, 1, 0)})
+        topology = MachineTopology(machine)
+        self.assertEqual(topology.n_chips, machine.n_chips)
+        self.assertEqual(topology.neighbours.shape, (machine.n_chips, 6))
+        self.assertFalse(topology.is_chip_at(3, 3))
+        self.assertFalse(topology.is_chip_at(8, 0))
+
+        for chip in machine.chips:
+            index = topology.index_of(chip.x, chip.y)
+            self.assertEqual(topology.coordinates_of(index), (chip.x, chip.y))
+            for link_id in range(6):
+                link = chip.router.get_link(link_id)
+                neighbour = topology.neighbours[index, link_id]
+                alive = topology.is_link_at(chip.x, chip.y, link_id)
+                if link is None:
+                    self.assertEqual(neighbour, NO_CHIP)
+                    self.assertFalse(alive)
+                    self.assertEqual(
+                        topology.weights[index, link_id], float("inf"))
+                else:
+                    self.assertEqual(
+                        topology.coordinates_of(neighbour),
+                        (link.destination_x, link.destination_y))
+                    self.assertTrue(alive)
+                    self.assertEqual(topology.weights[index, link_id], 1)
+        self.assertFalse(topology.is_link_at(1, 1, 0))
+
+    def test_shared_and_read_only(self):
+        machine = VirtualMachine(2, 2)
+        topology = MachineTopology.of(machine)
+        self.assertIs(MachineTopology.of(machine), topology)
+        self.assertIsNot(MachineTopology.of(VirtualMachine(2, 2)), topology)
+        with self.assertRaises(ValueError):
+            topology.weights[0, 0] = 2
+
+    def test_rebuilt_when_link_added(self):
+        machine = VirtualMachine(
+            8, 8, with_wrap_arounds=False, down_links={(1, 1, 0)})
+        topology = MachineTopology.of(machine)
+        self.assertFalse(topology.is_link_at(1, 1, 0))
+        machine.get_chip_at(1, 1).router.add_link(
+            Link(1, 1, 0, 2, 1, 0, 0))
+        topology = MachineTopology.of(machine)
+        self.assertTrue(topology.is_link_at(1, 1, 0))
+        self.assertIs(MachineTopology.of(machine), topology)
+
+
+if __name__ == '__main__':
+    unittest.main()
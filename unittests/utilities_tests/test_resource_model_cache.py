@@ -0,0 +1,73 @@
+import unittest
+
+from pacman.model.graphs.common import Slice
+from pacman.utilities.utility_objs import ResourceModelCache
+from uinit_test_objects import SimpleTestVertex
+
+
+class CountingVertex(SimpleTestVertex):
+
+    def __init__(self, n_atoms, label):
+        super(CountingVertex, self).__init__(n_atoms, label)
+        self.n_calls = 0
+
+    def get_resources_used_by_atoms(self, vertex_slice):
+        self.n_calls += 1
+        return super(CountingVertex, self).get_resources_used_by_atoms(
+            vertex_slice)
+
+
+class TestResourceModelCache(unittest.TestCase):
+
+    def test_by_slice(self):
+        vertex = CountingVertex(100, "A")
+        other = CountingVertex(100, "B")
+        cache = ResourceModelCache()
+        resources = cache.get_resources_used_by_atoms(vertex, Slice(0, 9))
+        self.assertEqual(resources.sdram.get_value(), 10)
+        self.assertIs(
+            cache.get_resources_used_by_atoms(vertex, Slice(0, 9)), resources)
+        cache.get_resources_used_by_atoms(vertex, Slice(10, 19))
+        cache.get_resources_used_by_atoms(other, Slice(0, 9))
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        self.assertEqual((vertex.n_calls, other.n_calls), (2, 1))
+        self.assertEqual(len(cache), 3)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.get_resources_used_by_atoms(vertex, Slice(0, 9))
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+        cache.add_counts(3, 2)
+        self.assertEqual((cache.hits, cache.misses), (4, 6))
+
+    def test_size_only(self):
+        vertex = CountingVertex(100, "A")
+        cache = ResourceModelCache(size_only=True)
+        for lo_atom in range(0, 100, 10):
+            cache.get_resources_used_by_atoms(
+                vertex, Slice(lo_atom, lo_atom + 9))
+        self.assertEqual((cache.hits, cache.misses), (9, 1))
+        self.assertEqual(vertex.n_calls, 1)
+
+    def test_least_recently_used_forgotten(self):
+        vertex = CountingVertex(100, "A")
+        cache = ResourceModelCache(max_size=2)
+        for hi_atom in [0, 1, 0, 2, 0, 1]:
+            cache.get_resources_used_by_atoms(vertex, Slice(0, hi_atom))
+        self.assertEqual(len(cache), 2)
+
+        # 0 is used most, so only 1 and 2 push each other out
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_no_memo(self):
+        vertex = CountingVertex(100, "A")
+        cache = ResourceModelCache(max_size=0)
+        for _ in range(3):
+            cache.get_resources_used_by_atoms(vertex, Slice(0, 9))
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,35 @@
 import unittest
+from collections import OrderedDict
 
 from spinn_machine import VirtualMachine
-from pacman.model.resources import ResourceContainer, SDRAMResource
+from pacman.model.resources import ResourceContainer, SDRAMResource, \
+    IPtagResource, ReverseIPtagResource
 
-from pacman.utilities.utility_objs import ResourceTracker
+from pacman.utilities.utility_objs import ResourceTracker, \
+    AllocationPolicy, CoreAllocationPolicy
 from pacman.model.resources import PreAllocatedResourceContainer
 from pacman.model.resources import CoreResource
 from pacman.model.resources import SpecificCoreResource
 from spinn_machine.machine import Machine
 from spinn_machine.chip import Chip
+from spinn_machine.processor import Processor
 from spinn_machine.router import Router
 from spinn_machine.sdram import SDRAM
-from pacman.exceptions import PacmanValueError
+from pacman.exceptions import PacmanException, PacmanValueError, \
+    PacmanInvalidParameterException
+from pacman.model.constraints.placer_constraints import \
+    ChipAndCoreConstraint, BoardConstraint
+
+
+class _CountingProgress(object):
+    """ Counts the updates made to it as a progress bar would
+    """
+
+    def __init__(self):
+        self.n_done = 0
+
+    def update(self, amount_to_add=1):
+        self.n_done += amount_to_add
 
 
 class TestResourceTracker(unittest.TestCase):
@@ -110,6 +128,372 @@ class TestResourceTracker(unittest.TestCase):
             resource_tracker.allocate_resources(
                 ResourceContainer(sdram=SDRAMResource(1024)))
 
+    def test_allocate_batch_matches_one_at_a_time(self):
+        machine = VirtualMachine(width=8, height=8)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        last_chips = list(machine.chip_coordinates)[-4:]
+        items = list()
+        for i in range(300):
+            resources = ResourceContainer(sdram=SDRAMResource(
+                [0, sdram // 7, sdram // 40][i % 3]))
+            constraints = list()
+            if i % 37 == 0:
+                constraints.append(
+                    ChipAndCoreConstraint(*last_chips[i // 37 % 4]))
+            items.append((resources, constraints))
+
+        tracker = ResourceTracker(machine)
+        expected = self._allocate_in_batch_order(tracker, items)
+        batch_tracker = ResourceTracker(machine)
+        progress = _CountingProgress()
+        self.assertEqual(
+            batch_tracker.allocate_constrained_resources_batch(
+                items, progress=progress),
+            expected)
+        self.assertEqual(progress.n_done, len(items))
+        self.assertEqual(
+            list(batch_tracker.chips_available),
+            list(tracker.chips_available))
+
+        # Both should fail on the same item, having allocated the same
+        with self.assertRaises(PacmanException):
+            self._allocate_in_batch_order(tracker, items * 3)
+        with self.assertRaises(PacmanException):
+            batch_tracker.allocate_constrained_resources_batch(items * 3)
+        self.assertEqual(
+            list(batch_tracker.chips_available),
+            list(tracker.chips_available))
+        self.assertEqual(batch_tracker.chips_used, tracker.chips_used)
+
+    @staticmethod
+    def _allocate_in_batch_order(tracker, items):
+        """ Allocate items one at a time in the order that a batch does,\
+            giving the allocations in the order of the items
+        """
+        order = [
+            index for index, (_, constraints) in enumerate(items)
+            if constraints]
+        groups = OrderedDict()
+        for index, (resources, constraints) in enumerate(items):
+            if not constraints:
+                groups.setdefault(
+                    resources.sdram.get_value(), list()).append(index)
+        for indices in groups.values():
+            order.extend(indices)
+        allocations = dict()
+        for index in order:
+            allocations[index] = tracker.allocate_constrained_resources(
+                *items[index])
+        return [allocations[index] for index in range(len(items))]
+
+    @staticmethod
+    def _state(tracker):
+        return (
+            list(tracker.chips_available), dict(tracker._sdram_tracker),
+            dict((key, sorted(cores))
+                 for key, cores in tracker._core_tracker.items()),
+            set(tracker.keys),
+            list(tracker._real_chips_with_n_cores_available),
+            dict((board, sorted(tags))
+                 for board, tags in tracker._tags_by_board.items()),
+            list(tracker._boards_with_ip_tags),
+            dict(tracker._n_ip_tag_allocations),
+            dict(tracker._listen_port_reverse_ip_tag),
+            tracker._all_available_resources(),
+            dict((board_address, list(index.at_least(0)))
+                 for board_address, index in
+                 tracker._board_chips_available.items()))
+
+    def test_rollback_to_savepoint(self):
+        machine = VirtualMachine(width=8, height=8)
+        resources = ResourceContainer()
+        tag_resources = ResourceContainer(
+            iptags=[IPtagResource("1.2.3.4", 5, True)],
+            reverse_iptags=[ReverseIPtagResource(port=6)])
+        tracker = ResourceTracker(machine)
+        tagged = tracker.allocate_resources(
+            tag_resources, ip_tags=tag_resources.iptags,
+            reverse_ip_tags=tag_resources.reverse_iptags)
+        allocations = [tracker.allocate_resources(resources)
+                       for _ in range(200)]
+        before = self._state(tracker)
+
+        # Free and use chips often enough for the index of chips to grow
+        savepoint = tracker.savepoint()
+        tracker.unallocate_resources(*(tagged[:3] + (tag_resources, ) +
+                                       tagged[3:]))
+        for _ in range(5):
+            for (x, y, p, _, _) in allocations:
+                tracker.unallocate_resources(x, y, p, resources, None, None)
+            allocations = [tracker.allocate_resources(resources)
+                           for _ in range(200)]
+        inner = tracker.savepoint()
+        tracker.allocate_resources(
+            tag_resources, ip_tags=tag_resources.iptags,
+            reverse_ip_tags=tag_resources.reverse_iptags)
+        tracker.commit(inner)
+        self.assertNotEqual(self._state(tracker), before)
+        tracker.rollback(savepoint)
+        self.assertEqual(self._state(tracker), before)
+
+        # The savepoint can be rolled back to again until committed
+        tracker.allocate_resources(resources)
+        tracker.rollback(savepoint)
+        self.assertEqual(self._state(tracker), before)
+        tracker.commit(savepoint)
+        with self.assertRaises(PacmanInvalidParameterException):
+            tracker.rollback(savepoint)
+
+    def test_fork(self):
+        machine = VirtualMachine(width=8, height=8)
+        resources = ResourceContainer(sdram=SDRAMResource(
+            machine.get_chip_at(0, 0).sdram.size // 4))
+
+        def allocate_tags(tracker, port):
+            tag_resources = ResourceContainer(
+                iptags=[IPtagResource("1.2.3.4", 5, True)],
+                reverse_iptags=[ReverseIPtagResource(port=port)])
+            return tracker.allocate_resources(
+                tag_resources, ip_tags=tag_resources.iptags,
+                reverse_ip_tags=tag_resources.reverse_iptags)
+
+        tracker = ResourceTracker(machine)
+        tracker_copy = ResourceTracker(machine)
+        fork_copy = ResourceTracker(machine)
+        for resource_tracker in (tracker, tracker_copy, fork_copy):
+            allocate_tags(resource_tracker, 6)
+            for _ in range(20):
+                resource_tracker.allocate_resources(resources)
+        fork = tracker.fork()
+        self.assertEqual(self._state(fork), self._state(fork_copy))
+
+        # Changes to either tracker must not be seen by the other
+        for resource_tracker in (fork, fork_copy):
+            for _ in range(30):
+                resource_tracker.allocate_resources(resources)
+            allocate_tags(resource_tracker, 7)
+        for resource_tracker in (tracker, tracker_copy):
+            x, y, p, _, _ = resource_tracker.allocate_resources(resources)
+            resource_tracker.unallocate_resources(
+                x, y, p, resources, None, None)
+        self.assertEqual(self._state(tracker), self._state(tracker_copy))
+        self.assertEqual(self._state(fork), self._state(fork_copy))
+
+        savepoint = tracker.savepoint()
+        with self.assertRaises(PacmanException):
+            tracker.fork()
+        tracker.commit(savepoint)
+
+    def test_fork_shares_each_chip(self):
+        machine = VirtualMachine(width=12, height=12, with_wrap_arounds=True)
+        preallocated_resources = PreAllocatedResourceContainer(
+            core_resources=[
+                CoreResource(chip=machine.get_chip_at(0, 0), n_cores=2)])
+        tracker = ResourceTracker(
+            machine, preallocated_resources=preallocated_resources)
+        for _ in range(20):
+            tracker.allocate_resources(ResourceContainer())
+
+        # A fork with its own order of chips is as a new tracker
+        chips_available = list(tracker.chips_available)
+        chips = list(reversed(list(machine.chip_coordinates)))
+        fork = tracker.fork(chips)
+        fork_copy = ResourceTracker(
+            machine, chips, preallocated_resources=preallocated_resources)
+        for _ in range(20):
+            fork_copy.allocate_resources(
+                ResourceContainer(), chips=[(0, 0), (0, 1)])
+        self.assertEqual(list(fork.chips_available), chips[:-1])
+        for resource_tracker in (fork, fork_copy):
+            for _ in range(30):
+                resource_tracker.allocate_resources(ResourceContainer())
+            resource_tracker.allocate_resources(
+                ResourceContainer(), chips=[(11, 7)])
+        self.assertEqual(self._state(fork), self._state(fork_copy))
+        self.assertEqual(
+            fork._board_free_cores, fork_copy._board_free_cores)
+        self.assertEqual(list(tracker.chips_available), chips_available)
+
+        # Only the chips and boards changed by the fork have been copied
+        for key, cores in tracker._core_tracker.items():
+            if key in fork._own_core_sets:
+                self.assertIsNot(fork._core_tracker[key], cores)
+            else:
+                self.assertIs(fork._core_tracker[key], cores)
+        self.assertEqual(
+            fork._own_core_sets, set([(11, 11), (11, 10), (11, 7)]))
+        self.assertEqual(
+            fork._own_board_indices, set([tracker._chip_board[11, 7]]))
+        for board_address, index in tracker._board_chips_available.items():
+            self.assertEqual(
+                fork._board_chips_available[board_address] is index,
+                board_address not in fork._own_board_indices)
+
+    def test_available_resource_totals(self):
+        machine = VirtualMachine(width=8, height=8)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        preallocated_resources = PreAllocatedResourceContainer(
+            specific_core_resources=[SpecificCoreResource(
+                chip=machine.get_chip_at(1, 1), cores=range(1, 18))],
+            core_resources=[
+                CoreResource(chip=machine.get_chip_at(0, 0), n_cores=2)])
+        tracker = ResourceTracker(
+            machine, preallocated_resources=preallocated_resources)
+
+        def check():
+            self.assertEqual(
+                tracker._all_available_resources(),
+                tracker._available_resources(
+                    tracker._get_usable_chips(None, None)))
+            best = max(
+                (-tracker._sdram_tracker[key], key)
+                for key in machine.chip_coordinates
+                if tracker._chip_available(*key))
+            self.assertEqual(
+                tracker.get_maximum_resources_available().sdram.get_value(),
+                best[0])
+
+        check()
+        allocations = list()
+        for i in range(200):
+            resources = ResourceContainer(sdram=SDRAMResource(
+                [0, sdram // 5, sdram // 17][i % 3]))
+            allocations.append((tracker.allocate_resources(resources),
+                                resources))
+            if i % 5 == 0:
+                (x, y, p, ip_tags, reverse_ip_tags), resources = \
+                    allocations.pop(len(allocations) // 2)
+                tracker.unallocate_resources(
+                    x, y, p, resources, ip_tags, reverse_ip_tags)
+            check()
+        tag_resources = ResourceContainer(
+            iptags=[IPtagResource("1.2.3.4", 5, True)],
+            reverse_iptags=[ReverseIPtagResource(port=6)])
+        _, _, _, n_tags = tracker._all_available_resources()
+        tracker.allocate_resources(
+            tag_resources, ip_tags=tag_resources.iptags,
+            reverse_ip_tags=tag_resources.reverse_iptags)
+        self.assertEqual(tracker._all_available_resources()[3], n_tags - 2)
+
+    def test_allocate_on_board(self):
+        machine = VirtualMachine(width=16, height=16)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        boards = [chip.ip_address for chip in machine.ethernet_connected_chips]
+        tracker = ResourceTracker(machine)
+        for i in range(390):
+            board_address = boards[i % len(boards)]
+            resources = ResourceContainer(sdram=SDRAMResource(
+                [0, sdram // 20][i % 2]))
+            x, y, _, _, _ = tracker.allocate_constrained_resources(
+                resources, [BoardConstraint(board_address)])
+            self.assertIn((x, y), tracker._board_chips[board_address])
+
+            for board_address in boards:
+                eth_chip = machine.get_chip_at(
+                    *tracker._ethernet_chips[board_address])
+                board_chips = [
+                    key for key in machine.get_chips_on_board(eth_chip)
+                    if tracker._chip_available(*key)]
+                self.assertEqual(
+                    list(tracker._get_usable_chips(None, board_address)),
+                    board_chips)
+                maximum = tracker.get_maximum_constrained_resources_available(
+                    ResourceContainer(), [BoardConstraint(board_address)])
+                self.assertEqual(
+                    maximum.sdram.get_value(),
+                    max([-tracker._sdram_tracker[key]
+                         for key in board_chips] or [0]))
+
+    def test_policy_batch_matches_one_at_a_time(self):
+        machine = VirtualMachine(width=16, height=16)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        items = [
+            (ResourceContainer(sdram=SDRAMResource(
+                [0, sdram // 7, sdram // 40][i % 3])), [])
+            for i in range(200)]
+        for policy in AllocationPolicy:
+            tracker = ResourceTracker(machine, allocation_policy=policy)
+            expected = self._allocate_in_batch_order(tracker, items)
+            batch_tracker = ResourceTracker(
+                machine, allocation_policy=policy)
+            self.assertEqual(
+                batch_tracker.allocate_constrained_resources_batch(items),
+                expected)
+            self.assertEqual(self._state(batch_tracker), self._state(tracker))
+
+    def test_best_and_worst_fit(self):
+        machine = VirtualMachine(width=8, height=8)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        for policy in (AllocationPolicy.BEST_FIT, AllocationPolicy.WORST_FIT):
+            tracker = ResourceTracker(machine, allocation_policy=policy)
+            tracker.allocate_resources(
+                ResourceContainer(sdram=SDRAMResource(sdram * 3 // 4)),
+                [(3, 3)])
+            tracker.allocate_resources(
+                ResourceContainer(sdram=SDRAMResource(sdram // 2)), [(5, 5)])
+            x, y, _, _, _ = tracker.allocate_resources(
+                ResourceContainer(sdram=SDRAMResource(sdram // 3)))
+            if policy == AllocationPolicy.BEST_FIT:
+                # The fullest chip that still fits
+                self.assertEqual((x, y), (5, 5))
+            else:
+                # The first of the chips with the most free
+                self.assertEqual((x, y), next(iter(machine.chip_coordinates)))
+
+    def test_board_balanced(self):
+        machine = VirtualMachine(width=16, height=16)
+        tracker = ResourceTracker(
+            machine, allocation_policy=AllocationPolicy.BOARD_BALANCED)
+        boards = list()
+        for _ in range(30):
+            x, y, _, _, _ = tracker.allocate_resources(ResourceContainer())
+            boards.append(tracker._chip_board[x, y])
+        for board_address in set(boards):
+            self.assertEqual(boards.count(board_address), 10)
+        self.assertEqual(len(set(boards[:3])), 3)
+
+    def test_rollback_with_best_fit(self):
+        machine = VirtualMachine(width=8, height=8)
+        sdram = machine.get_chip_at(0, 0).sdram.size
+        tracker = ResourceTracker(
+            machine, allocation_policy=AllocationPolicy.BEST_FIT)
+        for i in range(20):
+            tracker.allocate_resources(ResourceContainer(
+                sdram=SDRAMResource(sdram // (i % 5 + 3))))
+        before = self._state(tracker)
+        by_value = list(tracker._chips_available.ascending(0))
+        savepoint = tracker.savepoint()
+        for i in range(100):
+            tracker.allocate_resources(ResourceContainer(
+                sdram=SDRAMResource(sdram // (i % 7 + 9))))
+        tracker.rollback(savepoint)
+        self.assertEqual(self._state(tracker), before)
+        self.assertEqual(list(tracker._chips_available.ascending(0)), by_value)
+
+    def test_core_allocation_policies(self):
+        processors = [Processor(0, is_monitor=True)] + [
+            Processor(p, dtcm_available=dtcm)
+            for p, dtcm in [(1, 100), (2, 300), (3, 200), (4, 300)]]
+        chip = Chip(0, 0, processors, Router([]), SDRAM(), 0, 0,
+                    "127.0.0.1", virtual=False, tag_ids=[1])
+        machine = Machine([chip], 0, 0)
+        for policy, expected in [
+                (CoreAllocationPolicy.LOWEST_ID, [1, 2, 3, 4]),
+                (CoreAllocationPolicy.MOST_RESOURCES, [2, 4, 3, 1])]:
+            tracker = ResourceTracker(
+                machine, core_allocation_policy=policy)
+            cores = list()
+            for _ in range(4):
+                # The maximum available is that of the core allocated next
+                dtcm = tracker.get_maximum_resources_available().dtcm
+                _, _, p, _, _ = tracker.allocate_resources(
+                    ResourceContainer())
+                self.assertEqual(
+                    dtcm.get_value(),
+                    chip.get_processor_with_id(p).dtcm_available)
+                cores.append(p)
+            self.assertEqual(cores, expected)
+
 
 if __name__ == '__main__':
     unittest.main()